@@ -0,0 +1,148 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from forecasting_tools.ai_models.ai_utils.embedding_index import (
+    EmbeddingIndex,
+)
+from forecasting_tools.ai_models.ai_utils.embedding_providers import (
+    EmbeddingProvider,
+)
+from forecasting_tools.forecasting.sub_question_researchers.deduplicator import (
+    Deduplicator,
+)
+
+VOCABULARY = ["hiroshima", "nagasaki", "bombed", "1945", "moldova", "vote"]
+
+
+class FakeEmbedder(EmbeddingProvider):
+    def __init__(self, name: str = "fake", is_failing: bool = False) -> None:
+        self.name = name
+        self.is_failing = is_failing
+        self.batches: list[list[str]] = []
+
+    @property
+    def model_name(self) -> str:
+        return self.name
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        if self.is_failing:
+            raise RuntimeError("Embedding service is down")
+        self.batches.append(texts)
+        return [
+            [float(text.lower().count(word)) for word in VOCABULARY]
+            for text in texts
+        ]
+
+
+def create_index(
+    tmp_path: Path, embedder: FakeEmbedder, **kwargs
+) -> EmbeddingIndex:
+    return EmbeddingIndex(
+        file_path=str(tmp_path / "embeddings.sqlite"),
+        providers=[embedder],
+        **kwargs,
+    )
+
+
+def test_each_text_is_embedded_once_in_batches(tmp_path: Path) -> None:
+    embedder = FakeEmbedder()
+    index = create_index(tmp_path, embedder, batch_size=2)
+    texts = ["Hiroshima bombed", "Nagasaki bombed", "Moldova vote"]
+    embeddings = index.get_embeddings(texts + texts)
+
+    assert embedder.batches == [texts[:2], texts[2:]]
+    assert embeddings.shape == (6, len(VOCABULARY))
+    assert np.allclose(np.linalg.norm(embeddings, axis=1), 1)
+
+    index.get_embeddings(texts)
+    assert len(embedder.batches) == 2
+    assert index.texts_embedded == 3
+
+
+def test_embeddings_are_cached_on_disk(tmp_path: Path) -> None:
+    first_embedder = FakeEmbedder()
+    first_embeddings = create_index(tmp_path, first_embedder).get_embeddings(
+        ["Hiroshima bombed"]
+    )
+
+    second_embedder = FakeEmbedder()
+    second_index = create_index(tmp_path, second_embedder)
+    second_embeddings = second_index.get_embeddings(["Hiroshima bombed"])
+    assert second_embedder.batches == []
+    assert second_index.cache_hits == 1
+    assert np.allclose(first_embeddings, second_embeddings)
+
+
+def test_deduplicate_keeps_first_of_similar_texts(tmp_path: Path) -> None:
+    index = create_index(tmp_path, FakeEmbedder())
+    texts = [
+        "Hiroshima bombed in 1945",
+        "Nagasaki bombed in 1945",
+        "In 1945 Hiroshima was bombed",
+        "Moldova vote",
+        "Moldova held a vote",
+    ]
+    assert index.deduplicate(texts, threshold=0.9) == [
+        "Hiroshima bombed in 1945",
+        "Nagasaki bombed in 1945",
+        "Moldova vote",
+    ]
+    assert index.text_is_similar_to_any(
+        "Hiroshima was bombed in 1945", texts[:2], threshold=0.9
+    )
+    assert not index.text_is_similar_to_any(
+        "Moldova vote", texts[:2], threshold=0.9
+    )
+
+
+async def test_async_embeddings_match_sync_embeddings(
+    tmp_path: Path,
+) -> None:
+    embedder = FakeEmbedder()
+    index = create_index(tmp_path, embedder, batch_size=1)
+    texts = ["Hiroshima bombed", "Moldova vote"]
+    async_embeddings = await index.get_embeddings_async(texts)
+    assert len(embedder.batches) == 2
+    assert np.allclose(async_embeddings, index.get_embeddings(texts))
+    assert (
+        await index.deduplicate_async(
+            texts + ["Hiroshima bombed"], threshold=0.9
+        )
+        == texts
+    )
+
+
+def test_falls_back_to_next_embedder(tmp_path: Path) -> None:
+    failing_embedder = FakeEmbedder("failing", is_failing=True)
+    working_embedder = FakeEmbedder()
+    index = EmbeddingIndex(
+        file_path=None, providers=[failing_embedder, working_embedder]
+    )
+    assert index.get_embeddings(["Moldova vote"]).shape == (
+        1,
+        len(VOCABULARY),
+    )
+    assert working_embedder.batches == [["Moldova vote"]]
+
+    only_failing_index = EmbeddingIndex(
+        file_path=None, providers=[failing_embedder]
+    )
+    with pytest.raises(RuntimeError):
+        only_failing_index.get_embeddings(["Moldova vote"])
+
+
+async def test_deduplicator_uses_shared_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    embedder = FakeEmbedder()
+    monkeypatch.setattr(
+        Deduplicator, "_embedding_index", create_index(tmp_path, embedder)
+    )
+    kept_items = ["Hiroshima bombed in 1945", "Moldova vote"]
+    for _ in range(3):
+        assert await Deduplicator.determine_if_item_is_duplicate(
+            "In 1945 Hiroshima was bombed", kept_items
+        )
+    assert sum(len(batch) for batch in embedder.batches) == 3
@@ -0,0 +1,101 @@
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+from forecasting_tools.ai_models.ai_utils import embedding_providers
+from forecasting_tools.ai_models.ai_utils.embedding_index import (
+    EmbeddingIndex,
+)
+from forecasting_tools.ai_models.ai_utils.embedding_providers import (
+    HashedNgramEmbeddingProvider,
+    SentenceTransformerEmbeddingProvider,
+    get_default_embedding_providers,
+)
+
+
+def cosine_similarity(first_text: str, second_text: str) -> float:
+    provider = HashedNgramEmbeddingProvider()
+    vectors = EmbeddingIndex.normalize(
+        np.array(provider.embed([first_text, second_text]))
+    )
+    return float(vectors[0] @ vectors[1])
+
+
+def test_hashed_ngrams_score_rewordings_above_unrelated_text() -> None:
+    original = (
+        "**Hiroshima**: Hiroshima was bombed in 1945 during World War II"
+    )
+    reordered = (
+        "**Hiroshima**: In 1945, during World War II, Hiroshima was bombed"
+    )
+    unrelated = "**Moldova referendum**: Moldova voted on joining the EU"
+    assert cosine_similarity(original, original) > 0.999
+    assert cosine_similarity(original, reordered) > 0.7
+    assert cosine_similarity(original, unrelated) < 0.3
+
+
+def test_hashed_ngrams_are_deterministic_and_sized() -> None:
+    provider = HashedNgramEmbeddingProvider(dimensions=64)
+    first_vectors = provider.embed(["Moldova vote", ""])
+    assert first_vectors == provider.embed(["Moldova vote", ""])
+    assert len(first_vectors[0]) == 64
+    assert not any(first_vectors[1])
+
+
+async def test_local_provider_runs_in_process_pool() -> None:
+    provider = HashedNgramEmbeddingProvider()
+    texts = ["Hiroshima bombed", "Nagasaki bombed", "Moldova vote"]
+    with ProcessPoolExecutor(max_workers=2) as process_pool:
+        index = EmbeddingIndex(
+            file_path=None,
+            providers=[provider],
+            batch_size=2,
+            local_executor=process_pool,
+        )
+        embeddings = await index.get_embeddings_async(texts)
+    assert np.allclose(
+        embeddings, EmbeddingIndex.normalize(np.array(provider.embed(texts)))
+    )
+
+
+def test_local_providers_can_be_pickled() -> None:
+    provider = SentenceTransformerEmbeddingProvider()
+    assert pickle.loads(pickle.dumps(provider)).model_name == (
+        provider.model_name
+    )
+
+
+def test_sentence_transformer_is_loaded_once_per_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded_model_ids: list[str] = []
+
+    class FakeSentenceTransformer:
+        def __init__(self, model_id: str, device: str) -> None:
+            loaded_model_ids.append(model_id)
+
+        def encode(self, texts: list[str], convert_to_numpy: bool):
+            return np.zeros((len(texts), 3))
+
+    fake_module = ModuleType("sentence_transformers")
+    fake_module.SentenceTransformer = FakeSentenceTransformer  # type: ignore
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+    embedding_providers._load_sentence_transformer.cache_clear()
+    try:
+        provider = SentenceTransformerEmbeddingProvider("model-a")
+        unpickled_provider = pickle.loads(pickle.dumps(provider))
+        provider.embed(["Moldova vote"])
+        unpickled_provider.embed(["Hiroshima bombed"])
+        SentenceTransformerEmbeddingProvider("model-b").embed(["Moldova"])
+        assert loaded_model_ids == ["model-a", "model-b"]
+    finally:
+        embedding_providers._load_sentence_transformer.cache_clear()
+
+
+def test_default_providers_end_with_offline_fallback() -> None:
+    providers = get_default_embedding_providers()
+    assert isinstance(providers[-1], HashedNgramEmbeddingProvider)
@@ -0,0 +1,68 @@
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from litellm import ModelResponse
+from litellm.types.utils import Choices, Message, Usage
+
+from forecasting_tools.ai_models.ai_utils.response_cache import (
+    LlmResponseCache,
+)
+from forecasting_tools.ai_models.general_llm import GeneralLlm
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+
+RESPONSE_COST = 0.5
+
+
+def create_model_response() -> ModelResponse:
+    response = ModelResponse(
+        choices=[Choices(message=Message(content="Hello", role="assistant"))],
+        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+    response._hidden_params["response_cost"] = RESPONSE_COST
+    return response
+
+
+def mock_acompletion(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    acompletion = AsyncMock(side_effect=lambda **_: create_model_response())
+    monkeypatch.setattr(
+        "forecasting_tools.ai_models.general_llm.acompletion", acompletion
+    )
+    return acompletion
+
+
+async def test_repeated_call_is_served_from_cache_at_no_cost(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = LlmResponseCache(file_path=str(tmp_path / "cache.sqlite"))
+    llm = GeneralLlm(model="gpt-4o", temperature=0, response_cache=cache)
+    acompletion = mock_acompletion(monkeypatch)
+
+    with MonetaryCostManager(10) as cost_manager:
+        first_answer = await llm.invoke("Hi")
+        usage_after_first_call = cost_manager.current_usage
+        second_answer = await llm.invoke("Hi")
+
+        assert second_answer == first_answer == "Hello"
+        assert acompletion.await_count == 1
+        assert usage_after_first_call > 0
+        assert cost_manager.current_usage == usage_after_first_call
+        assert cache.hits == 1
+        assert cache.cost_saved == RESPONSE_COST
+
+
+async def test_sampled_call_is_not_cached_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = LlmResponseCache(file_path=str(tmp_path / "cache.sqlite"))
+    llm = GeneralLlm(model="gpt-4o", temperature=0.7, response_cache=cache)
+    acompletion = mock_acompletion(monkeypatch)
+
+    await llm.invoke("Hi")
+    await llm.invoke("Hi")
+
+    assert acompletion.await_count == 2
+    assert cache.hits == 0
+    assert len(cache) == 0
@@ -0,0 +1,87 @@
+import pytest
+from litellm.types.utils import Usage
+
+from forecasting_tools.ai_models.ai_utils.prompt_caching import (
+    CacheablePrompt,
+    PromptCacheAccounting,
+)
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+
+
+def test_prefix_is_only_marked_for_caching_when_asked() -> None:
+    prompt = CacheablePrompt(prefix="Question and research", suffix="Today")
+    assert prompt.to_message_content(False) == "Question and research\n\nToday"
+    content = prompt.to_message_content(True)
+    assert isinstance(content, list)
+    assert content[0]["text"] == "Question and research"
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert content[1] == {"type": "text", "text": "Today"}
+
+
+@pytest.mark.parametrize(
+    "litellm_model, supports_cache_control",
+    [
+        ("claude-3-5-sonnet-20241022", True),
+        ("anthropic/claude-3-5-sonnet-latest", True),
+        ("openrouter/anthropic/claude-3.5-sonnet", True),
+        ("gpt-4o", False),
+        ("o1", False),
+    ],
+)
+def test_cache_control_is_only_used_for_anthropic_models(
+    litellm_model: str, supports_cache_control: bool
+) -> None:
+    assert (
+        CacheablePrompt.model_supports_cache_control(litellm_model)
+        == supports_cache_control
+    )
+
+
+def test_cached_tokens_are_read_from_usage() -> None:
+    usage = Usage(
+        prompt_tokens=100,
+        completion_tokens=10,
+        total_tokens=110,
+        prompt_tokens_details={"cached_tokens": 80},
+    )
+    assert PromptCacheAccounting.get_cached_prompt_tokens(usage) == 80
+    assert (
+        PromptCacheAccounting.get_cached_prompt_tokens(
+            Usage(prompt_tokens=100, completion_tokens=10, total_tokens=110)
+        )
+        == 0
+    )
+
+
+@pytest.mark.parametrize(
+    "litellm_model", ["gpt-4o", "claude-3-5-sonnet-20241022"]
+)
+def test_cost_saved_is_positive_for_models_with_cache_pricing(
+    litellm_model: str,
+) -> None:
+    cost_saved = PromptCacheAccounting.calculate_cost_saved(
+        litellm_model, 1000
+    )
+    assert cost_saved > 0
+    assert PromptCacheAccounting.calculate_cost_saved(litellm_model, 0) == 0
+
+
+def test_cost_saved_is_zero_for_unknown_models() -> None:
+    assert (
+        PromptCacheAccounting.calculate_cost_saved("not-a-real-model", 1000)
+        == 0
+    )
+
+
+def test_cached_tokens_and_savings_are_tracked_in_cost_managers() -> None:
+    with MonetaryCostManager() as outer_manager:
+        with MonetaryCostManager() as inner_manager:
+            MonetaryCostManager.increase_cached_prompt_tokens_in_parent_managers(
+                80
+            )
+            MonetaryCostManager.increase_cost_saved_in_parent_managers(0.01)
+        assert inner_manager.cached_prompt_tokens == 80
+        assert outer_manager.cached_prompt_tokens == 80
+        assert outer_manager.cost_saved == pytest.approx(0.01)
@@ -0,0 +1,127 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from forecasting_tools.ai_models.ai_utils.response_cache import (
+    LlmResponseCache,
+)
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+
+
+def create_response(
+    data: str = "Hello", cost: float = 0.5
+) -> TextTokenCostResponse:
+    return TextTokenCostResponse(
+        data=data,
+        prompt_tokens_used=10,
+        completion_tokens_used=5,
+        total_tokens_used=15,
+        model="gpt-4o",
+        cost=cost,
+    )
+
+
+def create_cache(tmp_path: Path, **kwargs) -> LlmResponseCache:
+    return LlmResponseCache(file_path=str(tmp_path / "cache.sqlite"), **kwargs)
+
+
+def test_cache_returns_stored_response_and_counts_hits_and_misses(
+    tmp_path: Path,
+) -> None:
+    cache = create_cache(tmp_path)
+    key = cache.make_key(
+        {"model": "gpt-4o", "temperature": 0},
+        [{"role": "user", "content": "Hi"}],
+    )
+    assert cache.get(key) is None
+
+    response = create_response()
+    cache.set(key, response)
+    cached_response = cache.get(key)
+
+    assert cached_response == response
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+    assert cache.cost_saved == response.cost
+
+
+def test_cache_persists_between_instances(tmp_path: Path) -> None:
+    key = LlmResponseCache.make_key({"model": "gpt-4o"}, [])
+    create_cache(tmp_path).set(key, create_response())
+    assert create_cache(tmp_path).get(key) == create_response()
+
+
+def test_key_changes_with_kwargs_and_messages() -> None:
+    messages = [{"role": "user", "content": "Hi"}]
+    base_key = LlmResponseCache.make_key(
+        {"model": "gpt-4o", "temperature": 0}, messages
+    )
+    reordered_key = LlmResponseCache.make_key(
+        {"temperature": 0, "model": "gpt-4o"}, messages
+    )
+    different_kwargs_key = LlmResponseCache.make_key(
+        {"model": "gpt-4o", "temperature": 0.5}, messages
+    )
+    different_messages_key = LlmResponseCache.make_key(
+        {"model": "gpt-4o", "temperature": 0},
+        [{"role": "user", "content": "Hello"}],
+    )
+    assert base_key == reordered_key
+    assert base_key != different_kwargs_key
+    assert base_key != different_messages_key
+
+
+def test_expired_entries_are_not_returned(tmp_path: Path) -> None:
+    cache = create_cache(tmp_path, time_to_live_in_seconds=1)
+    cache.set("key", create_response())
+    assert cache.get("key") is not None
+    time.sleep(1.1)
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = create_cache(tmp_path, max_entries=2)
+    cache.set("first", create_response("first"))
+    time.sleep(0.01)
+    cache.set("second", create_response("second"))
+    time.sleep(0.01)
+    assert cache.get("first") is not None
+    time.sleep(0.01)
+    cache.set("third", create_response("third"))
+
+    assert len(cache) == 2
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+
+
+@pytest.mark.parametrize(
+    "only_cache_deterministic_calls, temperature, expected",
+    [
+        (True, 0, True),
+        (True, 0.7, False),
+        (True, None, False),
+        (False, 0.7, True),
+    ],
+)
+def test_temperature_policy(
+    tmp_path: Path,
+    only_cache_deterministic_calls: bool,
+    temperature: float | None,
+    expected: bool,
+) -> None:
+    cache = create_cache(
+        tmp_path,
+        only_cache_deterministic_calls=only_cache_deterministic_calls,
+    )
+    assert (
+        cache.call_is_cacheable(
+            {"model": "gpt-4o", "temperature": temperature}
+        )
+        == expected
+    )
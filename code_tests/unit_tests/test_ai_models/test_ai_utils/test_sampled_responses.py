@@ -0,0 +1,94 @@
+import pytest
+
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.ai_models.ai_utils.sampled_responses import (
+    SampledResponseSplitter,
+)
+
+
+def test_costs_and_tokens_are_split_between_choices() -> None:
+    responses = SampledResponseSplitter.split_into_choice_responses(
+        answers=["Short", "A longer answer"],
+        completion_tokens_per_answer=[10, 30],
+        prompt_tokens=101,
+        cached_prompt_tokens=80,
+        prompt_cost=0.02,
+        completion_cost=0.04,
+        model="gpt-4o",
+    )
+    assert [response.data for response in responses] == [
+        "Short",
+        "A longer answer",
+    ]
+    assert [response.prompt_tokens_used for response in responses] == [51, 50]
+    assert [response.cached_prompt_tokens_used for response in responses] == [
+        40,
+        40,
+    ]
+    assert responses[0].cost == pytest.approx(0.01 + 0.01)
+    assert responses[1].cost == pytest.approx(0.01 + 0.03)
+    assert sum(response.cost for response in responses) == pytest.approx(0.06)
+    assert responses[1].total_tokens_used == 80
+
+
+def test_completion_cost_is_split_evenly_without_token_counts() -> None:
+    responses = SampledResponseSplitter.split_into_choice_responses(
+        answers=["", ""],
+        completion_tokens_per_answer=[0, 0],
+        prompt_tokens=10,
+        cached_prompt_tokens=0,
+        prompt_cost=0,
+        completion_cost=0.02,
+        model="gpt-4o",
+    )
+    assert [response.cost for response in responses] == pytest.approx(
+        [0.01, 0.01]
+    )
+
+
+def test_mismatched_token_counts_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        SampledResponseSplitter.split_into_choice_responses(
+            answers=["One", "Two"],
+            completion_tokens_per_answer=[1],
+            prompt_tokens=10,
+            cached_prompt_tokens=0,
+            prompt_cost=0,
+            completion_cost=0,
+            model="gpt-4o",
+        )
+
+
+def test_choices_without_content_are_returned_as_errors() -> None:
+    responses = SampledResponseSplitter.split_into_choice_responses(
+        answers=["Probability: 40%", None, "Probability: 60%"],
+        completion_tokens_per_answer=[10, 0, 30],
+        prompt_tokens=100,
+        cached_prompt_tokens=0,
+        prompt_cost=0.02,
+        completion_cost=0.04,
+        model="gpt-4o",
+    )
+    first_response, missing_response, last_response = responses
+    assert isinstance(missing_response, ValueError)
+    assert isinstance(first_response, TextTokenCostResponse)
+    assert isinstance(last_response, TextTokenCostResponse)
+    assert first_response.data == "Probability: 40%"
+    assert first_response.prompt_tokens_used == 50
+    assert first_response.cost + last_response.cost == pytest.approx(0.06)
+    assert last_response.cost == pytest.approx(0.01 + 0.03)
+
+
+def test_call_without_any_content_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        SampledResponseSplitter.split_into_choice_responses(
+            answers=[None, None],
+            completion_tokens_per_answer=[0, 0],
+            prompt_tokens=10,
+            cached_prompt_tokens=0,
+            prompt_cost=0.01,
+            completion_cost=0,
+            model="gpt-4o",
+        )
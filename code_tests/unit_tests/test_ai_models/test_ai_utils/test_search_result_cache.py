@@ -0,0 +1,129 @@
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from forecasting_tools.ai_models.ai_utils.search_result_cache import (
+    SearchResultCache,
+)
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher, SearchInput
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+
+
+def create_search(**kwargs) -> SearchInput:
+    search_kwargs = {
+        "web_search_query": "Moldova referendum results",
+        "highlight_query": None,
+        "include_domains": [],
+        "exclude_domains": [],
+        "include_text": None,
+        "start_published_date": None,
+        "end_published_date": None,
+    }
+    search_kwargs.update(kwargs)
+    return SearchInput(**search_kwargs)
+
+
+def create_cache(tmp_path: Path, **kwargs) -> SearchResultCache:
+    return SearchResultCache(
+        file_path=str(tmp_path / "search_cache.sqlite"), **kwargs
+    )
+
+
+def test_key_is_canonicalized() -> None:
+    settings = {"num_results": 5}
+    base_key = SearchResultCache.make_key(
+        create_search(include_domains=["bbc.com", "apnews.com"]), settings
+    )
+    equivalent_search = create_search(
+        web_search_query="  moldova   Referendum results ",
+        highlight_query="Moldova referendum results",
+        include_domains=["APNEWS.com", "bbc.com"],
+    )
+    assert SearchResultCache.make_key(equivalent_search, settings) == base_key
+    assert (
+        SearchResultCache.make_key(
+            create_search(include_domains=["bbc.com", "apnews.com"]),
+            {"num_results": 10},
+        )
+        != base_key
+    )
+    assert (
+        SearchResultCache.make_key(
+            create_search(
+                include_domains=["bbc.com", "apnews.com"],
+                highlight_query="turnout",
+            ),
+            settings,
+        )
+        != base_key
+    )
+
+
+def test_entries_are_only_used_while_fresh(tmp_path: Path) -> None:
+    cache = create_cache(tmp_path, freshness_window_in_seconds=0.2)
+    cache.set("key", [{"title": "A"}])
+    assert cache.get("key") == [{"title": "A"}]
+    assert create_cache(tmp_path).get("key") == [{"title": "A"}]
+    time.sleep(0.05)
+    assert cache.get("key", max_age_in_seconds=0.01) is None
+    time.sleep(0.2)
+    assert cache.get("key") is None
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_date_bounded_searches_bypass_cache_by_default(
+    tmp_path: Path,
+) -> None:
+    dated_search = create_search(start_published_date=datetime(2024, 1, 1))
+    assert create_cache(tmp_path).search_is_cacheable(create_search())
+    assert not create_cache(tmp_path).search_is_cacheable(dated_search)
+    assert create_cache(
+        tmp_path, cache_date_bounded_searches=True
+    ).search_is_cacheable(dated_search)
+
+
+async def test_exa_searcher_reuses_cached_results_and_reports_savings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+    cache = create_cache(tmp_path)
+    searcher = ExaSearcher(search_cache=cache, num_results=2)
+    payloads: list[dict] = []
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        payloads.append(payload)
+        return {
+            "results": [
+                {
+                    "title": "Referendum passes",
+                    "url": "https://example.com/referendum",
+                    "publishedDate": "2024-10-21T00:00:00.000Z",
+                    "highlights": ["Yes won narrowly"],
+                    "highlightScores": [0.5],
+                }
+            ]
+        }
+
+    monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+    with MonetaryCostManager() as cost_manager:
+        first_sources = await searcher.invoke("Moldova referendum results")
+        cost_of_first_search = cost_manager.current_usage
+        second_sources = await searcher.invoke("moldova referendum results")
+        await searcher.invoke(
+            create_search(end_published_date=datetime(2024, 10, 1))
+        )
+
+    assert len(payloads) == 2
+    assert second_sources[0].url == first_sources[0].url
+    assert second_sources[0].published_date == first_sources[0].published_date
+    assert second_sources[0].original_query == "moldova referendum results"
+    assert cost_manager.current_usage == pytest.approx(
+        2 * cost_of_first_search
+    )
+    assert cost_manager.cost_saved == pytest.approx(cost_of_first_search)
+    assert cache.cost_saved == pytest.approx(cost_of_first_search)
@@ -0,0 +1,76 @@
+from typing import Iterator
+
+import pytest
+
+from forecasting_tools.ai_models.ai_utils.token_count_cache import (
+    TokenCountCache,
+)
+from forecasting_tools.ai_models.basic_model_interfaces.token_limited_model import (
+    TokenLimitedModel,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+
+
+@pytest.fixture(autouse=True)
+def empty_token_count_cache() -> Iterator[None]:
+    TokenLimitedModel._token_count_cache.clear()
+    yield
+    TokenLimitedModel._token_count_cache.clear()
+
+
+def test_counts_are_cached_per_model() -> None:
+    cache = TokenCountCache()
+    calls: list[str] = []
+
+    def count_tokens(model: str) -> int:
+        calls.append(model)
+        return 10
+
+    for _ in range(3):
+        cache.get_or_count("a", "prompt", lambda: count_tokens("a"))
+    cache.get_or_count("b", "prompt", lambda: count_tokens("b"))
+    assert calls == ["a", "b"]
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_least_recently_used_counts_are_evicted() -> None:
+    cache = TokenCountCache(max_entries=2)
+    cache.get_or_count("model", "first", lambda: 1)
+    cache.get_or_count("model", "second", lambda: 2)
+    cache.get_or_count("model", "first", lambda: 1)
+    cache.get_or_count("model", "third", lambda: 3)
+    assert len(cache) == 2
+    assert cache.get_or_count("model", "first", lambda: -1) == 1
+    assert cache.get_or_count("model", "second", lambda: -1) == -1
+
+
+def test_estimate_is_constant_time_and_conservative() -> None:
+    estimate = TokenCountCache.estimate_tokens_from_characters(
+        400_000, characters_per_token=3
+    )
+    assert estimate > 400_000 / 4
+    with pytest.raises(ValueError):
+        TokenCountCache.estimate_tokens_from_characters(10, 0)
+
+
+def test_token_limited_model_only_tokenizes_a_prompt_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model = Gpt4o()
+    prompts_tokenized: list[str] = []
+
+    def fake_input_to_tokens(self: Gpt4o, prompt: str) -> int:
+        prompts_tokenized.append(prompt)
+        return len(prompt.split())
+
+    monkeypatch.setattr(Gpt4o, "input_to_tokens", fake_input_to_tokens)
+    first_count = model._count_tokens_for_token_limit("Some research")
+    second_count = model._count_tokens_for_token_limit("Some research")
+    assert first_count == second_count == 2
+    assert prompts_tokenized == ["Some research"]
+
+    large_prompt = "a" * (Gpt4o.APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT + 1)
+    estimate = model._count_tokens_for_token_limit(large_prompt)
+    assert estimate > len(large_prompt) / 4
+    assert large_prompt not in prompts_tokenized
@@ -0,0 +1,232 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Iterator
+
+import aiohttp
+import httpx
+import litellm
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher
+from forecasting_tools.ai_models.resource_managers.adaptive_retry_controller import (
+    AdaptiveRetryController,
+    ErrorCategory,
+)
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_controllers() -> Iterator[None]:
+    AdaptiveRetryController.clear()
+    yield
+    AdaptiveRetryController.clear()
+
+
+def create_aiohttp_error(
+    status: int, headers: dict[str, str] | None = None
+) -> aiohttp.ClientResponseError:
+    url = URL("https://api.exa.ai/search")
+    request_info = aiohttp.RequestInfo(
+        url, "POST", CIMultiDictProxy(CIMultiDict()), url
+    )
+    return aiohttp.ClientResponseError(
+        request_info,
+        (),
+        status=status,
+        headers=CIMultiDict(headers or {}),
+    )
+
+
+def create_litellm_rate_limit_error(
+    headers: dict[str, str],
+) -> litellm.RateLimitError:
+    response = httpx.Response(
+        429,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com"),
+    )
+    return litellm.RateLimitError(
+        "Rate limited", "openai", "gpt-4o", response=response
+    )
+
+
+@pytest.mark.parametrize(
+    "exception, expected_category",
+    [
+        (create_litellm_rate_limit_error({}), ErrorCategory.RATE_LIMITED),
+        (create_aiohttp_error(429), ErrorCategory.RATE_LIMITED),
+        (create_aiohttp_error(503), ErrorCategory.SERVER_ERROR),
+        (
+            litellm.InternalServerError("Error", "openai", "gpt-4o"),
+            ErrorCategory.SERVER_ERROR,
+        ),
+        (asyncio.TimeoutError(), ErrorCategory.TIMEOUT),
+        (
+            litellm.Timeout("Timed out", "gpt-4o", "openai"),
+            ErrorCategory.TIMEOUT,
+        ),
+        (
+            litellm.AuthenticationError("Bad key", "openai", "gpt-4o"),
+            ErrorCategory.FATAL,
+        ),
+        (create_aiohttp_error(400), ErrorCategory.FATAL),
+        (HardLimitExceededError("Over budget"), ErrorCategory.FATAL),
+        (Exception("Something else"), ErrorCategory.UNKNOWN),
+    ],
+)
+def test_errors_are_classified(
+    exception: Exception, expected_category: ErrorCategory
+) -> None:
+    assert (
+        AdaptiveRetryController.classify_error(exception) == expected_category
+    )
+
+
+def test_retry_after_headers_are_read() -> None:
+    controller = AdaptiveRetryController
+    assert controller.get_retry_after_seconds(
+        create_litellm_rate_limit_error({"retry-after": "2"})
+    ) == pytest.approx(2)
+    assert controller.get_retry_after_seconds(
+        create_litellm_rate_limit_error({"retry-after-ms": "250"})
+    ) == pytest.approx(0.25)
+    assert controller.get_retry_after_seconds(
+        create_aiohttp_error(429, {"Retry-After": "3"})
+    ) == pytest.approx(3)
+
+    retry_date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    seconds = controller.get_retry_after_seconds(
+        create_aiohttp_error(
+            429, {"Retry-After": format_datetime(retry_date, usegmt=True)}
+        )
+    )
+    assert seconds is not None and 25 < seconds <= 30
+
+    assert (
+        controller.get_retry_after_seconds(
+            create_aiohttp_error(429, {"Retry-After": "100000"})
+        )
+        == AdaptiveRetryController.MAX_RETRY_AFTER_SECONDS
+    )
+    assert (
+        controller.get_retry_after_seconds(create_aiohttp_error(429)) is None
+    )
+
+
+def test_rate_limits_use_retry_after_instead_of_slow_backoff() -> None:
+    controller = AdaptiveRetryController("test")
+    wait_time = controller.get_seconds_to_wait_before_retry(
+        create_aiohttp_error(429, {"Retry-After": "0.1"}), attempt_number=1
+    )
+    assert wait_time == pytest.approx(0.1)
+    assert controller.metrics.retry_after_headers_honored == 1
+
+    wait_time = controller.get_seconds_to_wait_before_retry(
+        create_aiohttp_error(503), attempt_number=1
+    )
+    assert wait_time <= 2
+    assert controller.metrics.retries == 2
+
+
+async def test_window_shrinks_on_rate_limit_and_grows_back() -> None:
+    controller = AdaptiveRetryController("test", max_window=8)
+    release_requests = asyncio.Event()
+
+    async def request(should_fail: bool) -> None:
+        async with controller.attempt():
+            await release_requests.wait()
+            if should_fail:
+                raise create_aiohttp_error(429)
+
+    tasks = [asyncio.create_task(request(should_fail=i < 2)) for i in range(8)]
+    await asyncio.sleep(0)
+    assert controller.requests_in_flight == 8
+    release_requests.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    window = controller.concurrency_window
+    assert window is not None and 4 <= window < 8
+    assert controller.metrics.window_decreases == 1
+    assert controller.metrics.errors_by_category == {
+        ErrorCategory.RATE_LIMITED: 2
+    }
+
+    for _ in range(40):
+        await request(should_fail=False)
+    assert controller.concurrency_window is None
+    assert controller.metrics.successes == 46
+
+
+async def test_window_limits_concurrent_requests() -> None:
+    controller = AdaptiveRetryController("test", max_window=100)
+    async with controller.attempt():
+        with pytest.raises(aiohttp.ClientResponseError):
+            async with controller.attempt():
+                raise create_aiohttp_error(429)
+        assert controller.concurrency_window == 1
+
+    running = 0
+    max_running = 0
+
+    async def request() -> None:
+        nonlocal running, max_running
+        async with controller.attempt():
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[request() for _ in range(5)])
+    assert max_running <= 2
+    assert controller.metrics.times_throttled > 0
+    assert controller.requests_in_flight == 0
+
+
+async def test_model_retries_rate_limits_without_long_waits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+    searcher = ExaSearcher()
+    searcher.allowed_tries = 3
+    responses: list[Exception | dict] = [
+        create_aiohttp_error(429, {"Retry-After": "0.01"}),
+        create_aiohttp_error(429, {"Retry-After": "0.01"}),
+        {"results": []},
+    ]
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+    result = await asyncio.wait_for(searcher.invoke("test query"), timeout=2)
+    assert result == []
+    metrics = searcher.retry_controller.metrics
+    assert metrics.retries == 2
+    assert metrics.retry_after_headers_honored == 2
+
+
+async def test_model_does_not_retry_fatal_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+    searcher = ExaSearcher()
+    calls = 0
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        nonlocal calls
+        calls += 1
+        raise create_aiohttp_error(401)
+
+    monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+    with pytest.raises(RuntimeError):
+        await searcher.invoke("test query")
+    assert calls == 1
+    assert searcher.retry_controller.metrics.retries == 0
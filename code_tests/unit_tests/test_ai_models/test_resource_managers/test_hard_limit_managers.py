@@ -344,3 +344,78 @@ def test_error_raised_when_hard_limit_is_negative(
 
     with pytest.raises(AssertionError):
         hard_limit_subclass(negative_limit)
+
+
+@pytest.mark.parametrize("hard_limit_subclass", HARD_LIMIT_MANAGER_LIST)
+def test_reservations_count_against_limit_until_settled(
+    hard_limit_subclass: type[HardLimitManager],
+) -> None:
+    with hard_limit_subclass(100) as cost_manager:
+        reservation = hard_limit_subclass.reserve(75)
+        assert cost_manager.reserved_usage == 75
+        assert cost_manager.amount_left == 25
+        with pytest.raises(
+            HardLimitExceededError, match=r"reserved usage 75 \+ amount 50"
+        ):
+            hard_limit_subclass.reserve(50)
+
+        reservation.settle(30)
+        assert cost_manager.reserved_usage == 0
+        assert cost_manager.current_usage == 30
+        with pytest.raises(RuntimeError):
+            reservation.settle(30)
+
+        with hard_limit_subclass.reserve(50):
+            assert cost_manager.amount_left == 20
+        assert cost_manager.amount_left == 70
+
+
+@pytest.mark.parametrize("hard_limit_subclass", HARD_LIMIT_MANAGER_LIST)
+async def test_waiting_reservations_run_when_others_settle(
+    hard_limit_subclass: type[HardLimitManager],
+) -> None:
+    with hard_limit_subclass(100) as cost_manager:
+        first_reservation = hard_limit_subclass.reserve(60)
+        waiting_reservation = asyncio.create_task(
+            hard_limit_subclass.reserve_when_available(60)
+        )
+        await asyncio.sleep(0.01)
+        assert not waiting_reservation.done()
+
+        first_reservation.settle(20)
+        second_reservation = await asyncio.wait_for(
+            waiting_reservation, timeout=1
+        )
+        assert cost_manager.amount_left == 20
+        second_reservation.release()
+
+        with pytest.raises(HardLimitExceededError):
+            await hard_limit_subclass.reserve_when_available(90)
+
+
+async def test_concurrent_calls_do_not_overrun_limit() -> None:
+    max_cost = 1
+    estimated_cost_per_call = 0.1
+    actual_cost_per_call = 0.08
+
+    async def call_with_reservation() -> None:
+        with await MonetaryCostManager.reserve_when_available(
+            estimated_cost_per_call
+        ) as reservation:
+            await asyncio.sleep(0.01)
+            reservation.settle(actual_cost_per_call)
+
+    with MonetaryCostManager(max_cost) as cost_manager:
+        results = await asyncio.gather(
+            *[call_with_reservation() for _ in range(50)],
+            return_exceptions=True,
+        )
+    successful_calls = [result for result in results if result is None]
+    assert all(
+        isinstance(result, HardLimitExceededError)
+        for result in results
+        if result is not None
+    )
+    assert len(successful_calls) == 12
+    assert cost_manager.current_usage <= max_cost
+    assert cost_manager.reserved_usage == pytest.approx(0)
@@ -0,0 +1,92 @@
+import asyncio
+
+from aiohttp import web
+
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+
+
+async def test_session_is_reused_within_event_loop() -> None:
+    async with HttpSessionPool() as pool:
+        first_session = await pool.get_session()
+        second_session = await pool.get_session()
+        assert first_session is second_session
+    assert first_session.closed
+
+
+async def test_new_session_created_after_close() -> None:
+    pool = HttpSessionPool()
+    first_session = await pool.get_session()
+    await pool.close()
+    second_session = await pool.get_session()
+    assert first_session is not second_session
+    assert not second_session.closed
+    await pool.close()
+
+
+def test_each_event_loop_gets_its_own_session() -> None:
+    pool = HttpSessionPool()
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first_session = first_loop.run_until_complete(pool.get_session())
+        second_session = second_loop.run_until_complete(pool.get_session())
+        assert first_session is not second_session
+        first_loop.run_until_complete(pool.close())
+        second_loop.run_until_complete(pool.close())
+        assert first_session.closed and second_session.closed
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+
+def test_sessions_of_closed_event_loops_are_dropped() -> None:
+    pool = HttpSessionPool()
+    for _ in range(3):
+        asyncio.run(pool.get_session())
+    assert pool.get_number_of_sessions() == 1
+
+    async def get_and_close_session() -> None:
+        await pool.get_session()
+        await pool.close()
+
+    asyncio.run(get_and_close_session())
+    assert pool.get_number_of_sessions() == 0
+
+
+def test_shared_pool_is_process_wide() -> None:
+    assert (
+        HttpSessionPool.get_shared_pool() is HttpSessionPool.get_shared_pool()
+    )
+    assert ExaSearcher().session_pool is HttpSessionPool.get_shared_pool()
+
+
+async def test_exa_searcher_requests_reuse_pooled_connection() -> None:
+    remote_ports: list[int] = []
+
+    async def handle_search(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        remote_ports.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"results": []})
+
+    app = web.Application()
+    app.router.add_post("/search", handle_search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    try:
+        async with HttpSessionPool() as pool:
+            searcher = ExaSearcher(session_pool=pool)
+            for _ in range(3):
+                response = await searcher._make_api_request(
+                    f"http://127.0.0.1:{port}/search", {}, {}
+                )
+                assert response == {"results": []}
+    finally:
+        await runner.cleanup()
+    assert len(remote_ports) == 3
+    assert len(set(remote_ports)) == 1
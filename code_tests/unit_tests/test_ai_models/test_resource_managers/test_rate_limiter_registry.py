@@ -0,0 +1,137 @@
+import asyncio
+import time
+from typing import Iterator
+
+import pytest
+
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher
+from forecasting_tools.ai_models.resource_managers.rate_limiter_registry import (
+    RateLimiterRegistry,
+)
+from forecasting_tools.util import async_batching
+
+
+@pytest.fixture(autouse=True)
+def empty_registry() -> Iterator[None]:
+    RateLimiterRegistry.clear()
+    yield
+    RateLimiterRegistry.clear()
+
+
+async def return_input(input: int) -> int:
+    return input
+
+
+async def test_rate_limit_is_shared_between_batching_calls() -> None:
+    start_time = time.time()
+    first_batch = async_batching.wrap_coroutines_with_rate_limit(
+        [return_input(i) for i in range(5)], 5, 1, limiter_name="shared"
+    )
+    second_batch = async_batching.wrap_coroutines_with_rate_limit(
+        [return_input(i) for i in range(5)], 5, 1, limiter_name="shared"
+    )
+    await asyncio.gather(*first_batch, *second_batch)
+    duration = time.time() - start_time
+    assert duration > 0.8, "Second batch did not wait on the shared limit"
+
+
+async def test_separate_batching_calls_without_name_are_not_shared() -> None:
+    start_time = time.time()
+    first_batch = async_batching.wrap_coroutines_with_rate_limit(
+        [return_input(i) for i in range(5)], 5, 1
+    )
+    second_batch = async_batching.wrap_coroutines_with_rate_limit(
+        [return_input(i) for i in range(5)], 5, 1
+    )
+    await asyncio.gather(*first_batch, *second_batch)
+    assert time.time() - start_time < 0.5
+
+
+async def test_concurrency_slots_are_enforced() -> None:
+    RateLimiterRegistry.configure("slots", max_concurrent_requests=2)
+    running = 0
+    max_running = 0
+
+    async def tracked_request() -> None:
+        nonlocal running, max_running
+        async with RateLimiterRegistry.limit("slots"):
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[tracked_request() for _ in range(10)])
+    assert max_running == 2
+
+
+def test_concurrency_slots_of_closed_event_loops_are_dropped() -> None:
+    limiter = RateLimiterRegistry.configure(
+        "slots_per_loop", max_concurrent_requests=1
+    )
+
+    async def make_contended_requests() -> None:
+        async def make_request() -> None:
+            async with limiter.acquire():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(make_request(), make_request())
+
+    for _ in range(3):
+        asyncio.run(make_contended_requests())
+    assert limiter.get_number_of_event_loops_tracked() == 1
+
+
+async def test_limit_does_nothing_for_unconfigured_name() -> None:
+    async with RateLimiterRegistry.limit("not configured"):
+        pass
+    assert RateLimiterRegistry.get("not configured") is None
+
+
+def test_get_or_create_keeps_first_configuration() -> None:
+    first = RateLimiterRegistry.get_or_create("name", requests_per_period=5)
+    second = RateLimiterRegistry.get_or_create("name", requests_per_period=50)
+    assert first is second
+    assert second.requests_per_period == 5
+    replaced = RateLimiterRegistry.configure("name", requests_per_period=50)
+    assert RateLimiterRegistry.get("name") is replaced
+
+
+def test_names_hash_api_keys() -> None:
+    api_key = "sk-secret-key"
+    first_name = RateLimiterRegistry.make_name(
+        "llm", "gpt-4o", api_key=api_key
+    )
+    second_name = RateLimiterRegistry.make_name(
+        "llm", "gpt-4o", api_key="sk-other-key"
+    )
+    assert first_name != second_name
+    assert first_name.startswith("llm/gpt-4o/key-")
+    assert api_key not in first_name
+    assert RateLimiterRegistry.make_name("llm", "gpt-4o") == "llm/gpt-4o"
+
+
+async def test_exa_searcher_requests_use_registry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+    searcher = ExaSearcher()
+    RateLimiterRegistry.configure(
+        searcher.rate_limiter_name, max_concurrent_requests=1
+    )
+    running = 0
+    max_running = 0
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"results": []}
+
+    monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+    search = searcher._get_cheap_input_for_invoke()
+    await asyncio.gather(
+        *[searcher._mockable_direct_call_to_model(search) for _ in range(3)]
+    )
+    assert max_running == 1
@@ -2,6 +2,7 @@ import asyncio
 import logging
 import random
 import time
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -428,3 +429,60 @@ def assert_whether_rate_limit_is_respected_and_resources_tracked_right(
         over_rate_allowed=1.2,
         under_rate_allowed=0.9,
     )
+
+
+def test_waiters_are_served_in_fifo_order() -> None:
+    resource_limiter = RefreshingBucketRateLimiter(
+        capacity=5, refresh_rate=500
+    )
+    number_of_waiters = 50
+    order_served: list[int] = []
+
+    async def acquire(waiter_number: int) -> None:
+        await resource_limiter.wait_till_able_to_acquire_resources(1)
+        order_served.append(waiter_number)
+
+    async def run_all() -> None:
+        await asyncio.gather(*[acquire(i) for i in range(number_of_waiters)])
+
+    asyncio.run(run_all())
+    assert order_served == list(range(number_of_waiters))
+    assert resource_limiter.number_of_waiters == 0
+
+
+def test_resource_history_is_bounded() -> None:
+    max_history_entries = 10
+    resource_limiter = RefreshingBucketRateLimiter(
+        capacity=100, refresh_rate=0, max_history_entries=max_history_entries
+    )
+    start_time = datetime.now()
+
+    async def acquire_many() -> None:
+        for _ in range(50):
+            await resource_limiter.wait_till_able_to_acquire_resources(1)
+
+    asyncio.run(acquire_many())
+    end_time = datetime.now() + timedelta(seconds=1)
+    resources_in_history = (
+        resource_limiter.calculate_resources_passed_into_acquire_in_time_range(
+            start_time, end_time
+        )
+    )
+    assert resources_in_history == max_history_entries
+
+
+def test_limiter_can_be_reused_after_waiters_event_loop_closes() -> None:
+    resource_limiter = RefreshingBucketRateLimiter(capacity=1, refresh_rate=1)
+
+    async def acquire_with_timeout() -> None:
+        await resource_limiter.wait_till_able_to_acquire_resources(1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                resource_limiter.wait_till_able_to_acquire_resources(1),
+                timeout=0.1,
+            )
+
+    asyncio.run(acquire_with_timeout())
+    start_time = time.time()
+    asyncio.run(resource_limiter.wait_till_able_to_acquire_resources(1))
+    assert time.time() - start_time < 1.5
@@ -0,0 +1,149 @@
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.ai_models.resource_managers.request_coalescer import (
+    RequestCoalescer,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_coalescer() -> Iterator[None]:
+    RequestCoalescer.clear()
+    yield
+    RequestCoalescer.clear()
+
+
+class FakeProvider:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.error = error
+
+    async def call(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.error is not None:
+            raise self.error
+        return f"Response to {prompt}"
+
+
+async def test_concurrent_identical_requests_share_one_call() -> None:
+    provider = FakeProvider()
+    responses = await asyncio.gather(
+        *[
+            RequestCoalescer.run("key", lambda: provider.call("prompt"))
+            for _ in range(5)
+        ],
+        RequestCoalescer.run("other key", lambda: provider.call("other")),
+    )
+    assert responses == ["Response to prompt"] * 5 + ["Response to other"]
+    assert provider.calls == 2
+    assert RequestCoalescer.requests_coalesced == 4
+    assert RequestCoalescer.get_number_of_calls_in_flight() == 0
+
+    await RequestCoalescer.run("key", lambda: provider.call("prompt"))
+    assert provider.calls == 3
+
+
+async def test_errors_are_given_to_every_awaiter() -> None:
+    provider = FakeProvider(error=RuntimeError("Provider is down"))
+    results = await asyncio.gather(
+        *[
+            RequestCoalescer.run("key", lambda: provider.call("prompt"))
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+    assert provider.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelling_one_awaiter_does_not_cancel_the_call() -> None:
+    provider = FakeProvider()
+    first_request = asyncio.create_task(
+        RequestCoalescer.run("key", lambda: provider.call("prompt"))
+    )
+    second_request = asyncio.create_task(
+        RequestCoalescer.run("key", lambda: provider.call("prompt"))
+    )
+    await asyncio.sleep(0.01)
+    first_request.cancel()
+    assert await second_request == "Response to prompt"
+    assert first_request.cancelled()
+    assert provider.calls == 1
+
+
+async def test_only_requests_that_join_a_call_get_the_shared_result() -> None:
+    provider = FakeProvider()
+    shared_results: list[str] = []
+    await asyncio.gather(
+        *[
+            RequestCoalescer.run(
+                "key",
+                lambda: provider.call("prompt"),
+                shared_results.append,
+            )
+            for _ in range(3)
+        ]
+    )
+    assert shared_results == ["Response to prompt"] * 2
+
+
+async def test_exa_searcher_coalesces_identical_searches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+    payloads: list[dict] = []
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        payloads.append(payload)
+        await asyncio.sleep(0.05)
+        return {"results": [{"title": "Result", "url": "https://a.com"}]}
+
+    searchers = [ExaSearcher() for _ in range(2)] + [
+        ExaSearcher(coalesce_identical_searches=False)
+    ]
+    for searcher in searchers:
+        monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+    results = await asyncio.gather(
+        searchers[0].invoke("Moldova referendum"),
+        searchers[1].invoke("moldova  referendum"),
+        searchers[2].invoke("Moldova referendum"),
+    )
+    assert len(payloads) == 2
+    assert results[0][0].original_query == "Moldova referendum"
+    assert results[1][0].original_query == "moldova  referendum"
+    assert results[0][0].url == results[1][0].url
+
+
+async def test_coalesced_searches_record_cost_saved_in_their_own_managers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("EXA_API_KEY", "fake-key")
+
+    async def fake_api_request(url: str, headers: dict, payload: dict) -> dict:
+        await asyncio.sleep(0.05)
+        return {"results": [{"title": "Result", "url": "https://a.com"}]}
+
+    searcher = ExaSearcher()
+    monkeypatch.setattr(searcher, "_make_api_request", fake_api_request)
+
+    async def search_in_own_manager() -> MonetaryCostManager:
+        with MonetaryCostManager() as cost_manager:
+            await searcher.invoke("Moldova referendum")
+        return cost_manager
+
+    first_manager, second_manager = await asyncio.gather(
+        search_in_own_manager(), search_in_own_manager()
+    )
+    assert first_manager.current_usage > 0
+    assert first_manager.cost_saved == 0
+    assert second_manager.current_usage == 0
+    assert second_manager.cost_saved == pytest.approx(
+        first_manager.current_usage
+    )
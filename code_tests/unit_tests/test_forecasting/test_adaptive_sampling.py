@@ -0,0 +1,45 @@
+import pytest
+
+from forecasting_tools.forecasting.forecast_bots.adaptive_sampling import (
+    AdaptiveSamplingPolicy,
+)
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+
+
+def test_waves_sample_least_sampled_reports_first() -> None:
+    policy = AdaptiveSamplingPolicy(predictions_per_wave=4)
+    assert policy.plan_wave([0, 0, 0], 5) == [2, 1, 1]
+    assert policy.plan_wave([2, 1, 1], 5) == [1, 2, 1]
+    assert policy.plan_wave([4, 5, 4], 5) == [1, 0, 1]
+    assert policy.plan_wave([5, 5], 5) == [0, 0]
+
+
+def test_default_wave_is_one_prediction_per_report() -> None:
+    assert AdaptiveSamplingPolicy().plan_wave([1, 1, 1], 3) == [1, 1, 1]
+
+
+def test_sampling_stops_once_predictions_agree() -> None:
+    policy = AdaptiveSamplingPolicy(spread_tolerance=0.05, min_predictions=3)
+    assert policy.get_stopping_reason([0.3, 0.3], BinaryReport, 0, 0) is None
+    assert (
+        policy.get_stopping_reason([0.3, 0.6, 0.4, 0.2], BinaryReport, 0, 0)
+        is None
+    )
+    reason = policy.get_stopping_reason([0.3, 0.31, 0.32], BinaryReport, 0, 0)
+    assert reason is not None and "Spread" in reason
+
+
+@pytest.mark.parametrize(
+    "cost_so_far, minutes_so_far, should_stop",
+    [(0.5, 1, False), (1.0, 1, True), (0.5, 2, True)],
+)
+def test_sampling_stops_when_budget_is_used(
+    cost_so_far: float, minutes_so_far: float, should_stop: bool
+) -> None:
+    policy = AdaptiveSamplingPolicy(max_cost=1, max_minutes=2)
+    reason = policy.get_stopping_reason(
+        [0.1, 0.9], BinaryReport, cost_so_far, minutes_so_far
+    )
+    assert (reason is not None) == should_stop
@@ -0,0 +1,151 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+
+import pytest
+from aiohttp import web
+
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+from forecasting_tools.forecasting.helpers.asknews_searcher import (
+    AskNewsSearcher,
+)
+
+
+class FakeAskNewsServer:
+    def __init__(self) -> None:
+        self.token_requests = 0
+        self.search_params: list[dict[str, str]] = []
+        self.running_searches = 0
+        self.max_running_searches = 0
+        self.base_url = ""
+
+    async def handle_token(self, request: web.Request) -> web.Response:
+        self.token_requests += 1
+        assert request.headers["Authorization"].startswith("Basic ")
+        return web.json_response(
+            {"access_token": "fake-token", "expires_in": 3600}
+        )
+
+    async def handle_search(self, request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == "Bearer fake-token"
+        self.search_params.append(dict(request.query))
+        self.running_searches += 1
+        self.max_running_searches = max(
+            self.max_running_searches, self.running_searches
+        )
+        await asyncio.sleep(0.05)
+        self.running_searches -= 1
+        strategy = request.query["strategy"]
+        return web.json_response(
+            {
+                "as_string": strategy,
+                "as_dicts": [
+                    self.create_article(f"Older {strategy}", "2025-01-01"),
+                    self.create_article(f"Newer {strategy}", "2025-02-01"),
+                ],
+            }
+        )
+
+    @staticmethod
+    def create_article(title: str, date: str) -> dict:
+        return {
+            "eng_title": title,
+            "summary": "Summary",
+            "language": "en",
+            "pub_date": f"{date}T12:00:00Z",
+            "source_id": "Source",
+            "article_url": "https://example.com",
+        }
+
+
+@pytest.fixture(autouse=True)
+def clear_asknews_caches() -> Iterator[None]:
+    AskNewsSearcher.clear_caches()
+    yield
+    AskNewsSearcher.clear_caches()
+
+
+@pytest.fixture
+async def fake_server() -> AsyncIterator[FakeAskNewsServer]:
+    server = FakeAskNewsServer()
+    app = web.Application()
+    app.router.add_post("/token", server.handle_token)
+    app.router.add_get("/v1/news/search", server.handle_search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    server.base_url = f"http://127.0.0.1:{port}"
+    try:
+        yield server
+    finally:
+        await runner.cleanup()
+
+
+def create_searcher(
+    server: FakeAskNewsServer, pool: HttpSessionPool, client_id: str = "id"
+) -> AskNewsSearcher:
+    searcher = AskNewsSearcher(
+        client_id=client_id, client_secret="secret", session_pool=pool
+    )
+    searcher.base_url = f"{server.base_url}/v1"
+    searcher.token_url = f"{server.base_url}/token"
+    return searcher
+
+
+async def test_strategies_run_concurrently_and_are_formatted(
+    fake_server: FakeAskNewsServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        news = await create_searcher(
+            fake_server, pool
+        ).get_formatted_news_async("Moldova referendum")
+
+    assert fake_server.max_running_searches == 2
+    assert news.index("Newer latest news") < news.index("Older latest news")
+    assert news.index("Older latest news") < news.index("Newer news knowledge")
+    assert "Publish date: February 01, 2025 12:00 PM" in news
+    params = fake_server.search_params[0]
+    assert params["categories"] == "All"
+    assert params["historical"] == "false"
+
+
+async def test_tokens_and_results_are_shared_between_searchers(
+    fake_server: FakeAskNewsServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        first_news, second_news = await asyncio.gather(
+            create_searcher(fake_server, pool).get_formatted_news_async(
+                "Moldova referendum"
+            ),
+            create_searcher(fake_server, pool).get_formatted_news_async(
+                "Moldova referendum"
+            ),
+        )
+        third_news = await create_searcher(
+            fake_server, pool
+        ).get_formatted_news_async("Moldova referendum")
+        await create_searcher(fake_server, pool).get_formatted_news_async(
+            "Romanian election"
+        )
+
+    assert first_news == second_news == third_news
+    assert fake_server.token_requests == 1
+    assert len(fake_server.search_params) == 4
+
+
+async def test_results_are_not_shared_between_credentials(
+    fake_server: FakeAskNewsServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        await create_searcher(fake_server, pool).get_formatted_news_async(
+            "Moldova referendum"
+        )
+        await create_searcher(
+            fake_server, pool, client_id="other-id"
+        ).get_formatted_news_async("Moldova referendum")
+
+    assert fake_server.token_requests == 2
+    assert len(fake_server.search_params) == 4
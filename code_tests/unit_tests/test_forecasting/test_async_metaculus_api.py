@@ -0,0 +1,138 @@
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator
+
+import pytest
+from aiohttp import web
+
+from code_tests.unit_tests.test_forecasting.forecasting_test_manager import (
+    MockBot,
+)
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+from forecasting_tools.forecasting.helpers.async_metaculus_api import (
+    AsyncMetaculusApi,
+)
+from forecasting_tools.forecasting.helpers.metaculus_api import (
+    ApiFilter,
+    MetaculusApi,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+)
+
+
+class StubMetaculusServer:
+    def __init__(self, number_of_posts: int) -> None:
+        self.number_of_posts = number_of_posts
+        self.requested_offsets: list[int] = []
+        self.not_modified_responses = 0
+        self.active_requests = 0
+        self.max_active_requests = 0
+
+    def create_post_json(self, post_id: int) -> dict:
+        return {
+            "id": post_id,
+            "nr_forecasters": post_id,
+            "forecasts_count": post_id,
+            "question": {
+                "id": post_id,
+                "type": "binary",
+                "status": "open",
+                "title": f"Question {post_id}",
+                "include_bots_in_aggregates": False,
+            },
+        }
+
+    async def handle_posts(self, request: web.Request) -> web.Response:
+        offset = int(request.query["offset"])
+        limit = int(request.query["limit"])
+        self.requested_offsets.append(offset)
+        etag = f'"page-{offset}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified_responses += 1
+            return web.Response(status=304)
+
+        self.active_requests += 1
+        self.max_active_requests = max(
+            self.max_active_requests, self.active_requests
+        )
+        await asyncio.sleep(0.01)
+        self.active_requests -= 1
+        post_ids = range(offset, min(offset + limit, self.number_of_posts))
+        return web.json_response(
+            {"results": [self.create_post_json(i) for i in post_ids]},
+            headers={"ETag": etag},
+        )
+
+
+@pytest.fixture
+async def stub_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[StubMetaculusServer]:
+    server = StubMetaculusServer(number_of_posts=450)
+    app = web.Application()
+    app.router.add_get("/api/posts/", server.handle_posts)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    monkeypatch.setattr(
+        MetaculusApi, "API_BASE_URL", f"http://127.0.0.1:{port}/api"
+    )
+    monkeypatch.setenv("METACULUS_TOKEN", "fake-token")
+    monkeypatch.setattr(AsyncMetaculusApi, "_etag_cache", OrderedDict())
+    try:
+        yield server
+    finally:
+        await runner.cleanup()
+
+
+async def test_all_pages_are_fetched_concurrently(
+    stub_server: StubMetaculusServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        api = AsyncMetaculusApi(session_pool=pool, max_concurrent_requests=3)
+        questions = await api.get_all_open_questions_from_tournament(1)
+    assert [question.id_of_post for question in questions] == list(range(450))
+    assert all(isinstance(question, BinaryQuestion) for question in questions)
+    assert stub_server.max_active_requests == 3
+
+
+async def test_local_filters_are_applied(
+    stub_server: StubMetaculusServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        api = AsyncMetaculusApi(session_pool=pool)
+        questions = await api.get_questions_matching_filter(
+            ApiFilter(num_forecasters_gte=400), num_questions=20
+        )
+    assert [question.id_of_post for question in questions] == list(
+        range(400, 420)
+    )
+
+
+async def test_unchanged_pages_are_revalidated_with_etag(
+    stub_server: StubMetaculusServer,
+) -> None:
+    async with HttpSessionPool() as pool:
+        api = AsyncMetaculusApi(session_pool=pool)
+        first_questions = await api.get_questions_matching_filter(ApiFilter())
+        second_questions = await api.get_questions_matching_filter(ApiFilter())
+    assert stub_server.requested_offsets == [0, 0]
+    assert stub_server.not_modified_responses == 1
+    assert [question.id_of_post for question in first_questions] == [
+        question.id_of_post for question in second_questions
+    ]
+
+
+async def test_forecast_on_tournament_forecasts_every_page(
+    stub_server: StubMetaculusServer,
+) -> None:
+    bot = MockBot()
+    reports = await bot.forecast_on_tournament(1)
+    assert [report.question.id_of_post for report in reports] == list(
+        range(stub_server.number_of_posts)
+    )
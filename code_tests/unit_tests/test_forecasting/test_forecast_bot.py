@@ -6,6 +6,9 @@ from code_tests.unit_tests.test_forecasting.forecasting_test_manager import (
     ForecastingTestManager,
     MockBot,
 )
+from forecasting_tools.forecasting.forecast_bots.adaptive_sampling import (
+    AdaptiveSamplingPolicy,
+)
 from forecasting_tools.forecasting.forecast_bots.bot_lists import (
     get_all_official_bot_classes,
 )
@@ -13,6 +16,9 @@ from forecasting_tools.forecasting.forecast_bots.forecast_bot import (
     ForecastBot,
     ForecastReport,
 )
+from forecasting_tools.forecasting.forecast_bots.forecast_pipeline import (
+    ForecastPipelineSettings,
+)
 from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
     ReasonedPrediction,
 )
@@ -154,6 +160,180 @@ async def test_research_reports_and_predictions_per_question_counts() -> None:
     assert prediction_call_count == research_reports * predictions_per_report
 
 
+async def test_predictions_can_be_made_in_one_request() -> None:
+    bot = MockBot(
+        research_reports_per_question=2,
+        predictions_per_research_report=3,
+        make_predictions_in_one_request=True,
+    )
+    test_question = ForecastingTestManager.get_fake_binary_questions()
+
+    requested_forecast_counts: list[int] = []
+
+    async def make_forecasts(
+        question: BinaryQuestion, research: str, number_of_forecasts: int
+    ) -> list[ReasonedPrediction[float] | BaseException]:
+        requested_forecast_counts.append(number_of_forecasts)
+        reasonings = ["Probability: 40%"] * (number_of_forecasts - 1) + [
+            "Unparseable reasoning"
+        ]
+
+        def parse(reasoning: str) -> ReasonedPrediction[float]:
+            if "Probability" not in reasoning:
+                raise ValueError("Could not find a probability")
+            return ReasonedPrediction(
+                prediction_value=0.4, reasoning=reasoning
+            )
+
+        return bot._parse_each_reasoning(reasonings, parse)
+
+    bot._run_forecasts_on_binary = make_forecasts  # type: ignore
+
+    report = await bot.forecast_question(test_question)
+    assert requested_forecast_counts == [3, 3]
+    assert report.prediction == pytest.approx(0.4)
+    assert len(report.errors) == 2
+    assert "Could not find a probability" in report.errors[0]
+
+
+async def test_failed_samples_from_one_request_are_kept_as_errors() -> None:
+    bot = MockBot(
+        predictions_per_research_report=3,
+        make_predictions_in_one_request=True,
+    )
+    test_question = ForecastingTestManager.get_fake_binary_questions()
+
+    async def make_forecasts(
+        question: BinaryQuestion, research: str, number_of_forecasts: int
+    ) -> list[ReasonedPrediction[float] | BaseException]:
+        reasonings: list[str | BaseException] = [
+            "Probability: 30%",
+            ValueError("Choice 1 of the call returned no content"),
+            "Probability: 30%",
+        ]
+        return bot._parse_each_reasoning(
+            reasonings,
+            lambda reasoning: ReasonedPrediction(
+                prediction_value=0.3, reasoning=reasoning
+            ),
+        )
+
+    bot._run_forecasts_on_binary = make_forecasts  # type: ignore
+
+    report = await bot.forecast_question(test_question)
+    assert report.prediction == pytest.approx(0.3)
+    assert len(report.errors) == 1
+    assert "returned no content" in report.errors[0]
+
+
+async def test_predictions_in_one_request_default_to_separate_calls() -> None:
+    bot = MockBot(
+        predictions_per_research_report=3,
+        make_predictions_in_one_request=True,
+    )
+    test_question = ForecastingTestManager.get_fake_binary_questions()
+
+    prediction_call_count = 0
+
+    async def count_predictions(*args, **kwargs):
+        nonlocal prediction_call_count
+        prediction_call_count += 1
+        return ReasonedPrediction(
+            prediction_value=0.5, reasoning="test reasoning"
+        )
+
+    bot._run_forecast_on_binary = count_predictions
+
+    await bot.forecast_question(test_question)
+    assert prediction_call_count == 3
+
+
+@pytest.mark.parametrize(
+    "predictions_agree, expected_predictions", [(True, 4), (False, 10)]
+)
+async def test_adaptive_sampling_stops_once_predictions_agree(
+    predictions_agree: bool, expected_predictions: int
+) -> None:
+    bot = MockBot(
+        research_reports_per_question=2,
+        predictions_per_research_report=5,
+        adaptive_sampling=AdaptiveSamplingPolicy(
+            spread_tolerance=0.05, min_predictions=4
+        ),
+    )
+    test_question = ForecastingTestManager.get_fake_binary_questions()
+
+    prediction_call_count = 0
+
+    async def make_prediction(*args, **kwargs):
+        nonlocal prediction_call_count
+        prediction_call_count += 1
+        prediction = (
+            0.5
+            if predictions_agree
+            else 0.1 + 0.8 * (prediction_call_count % 2)
+        )
+        return ReasonedPrediction(
+            prediction_value=prediction, reasoning="test reasoning"
+        )
+
+    bot._run_forecast_on_binary = make_prediction
+
+    report = await bot.forecast_question(test_question)
+    assert prediction_call_count == expected_predictions
+    assert report.predictions_used == expected_predictions
+
+
+async def test_pipeline_forecasts_every_question_in_order() -> None:
+    bot = MockBot(
+        research_reports_per_question=2,
+        predictions_per_research_report=2,
+        pipeline=ForecastPipelineSettings(
+            research_workers=2, forecast_workers=1, queue_size=1
+        ),
+    )
+    test_questions = [
+        ForecastingTestManager.get_fake_binary_questions() for _ in range(5)
+    ]
+    for i, question in enumerate(test_questions):
+        question.question_text = f"Question {i}"
+
+    research_call_count = 0
+    prediction_call_count = 0
+
+    async def count_research(question, *args, **kwargs):
+        nonlocal research_call_count
+        research_call_count += 1
+        if question.question_text == "Question 3":
+            raise RuntimeError("Test error")
+        return "test research"
+
+    async def count_predictions(*args, **kwargs):
+        nonlocal prediction_call_count
+        prediction_call_count += 1
+        return ReasonedPrediction(
+            prediction_value=0.5, reasoning="test reasoning"
+        )
+
+    bot.run_research = count_research
+    bot._run_forecast_on_binary = count_predictions
+
+    reports = await bot.forecast_questions(
+        test_questions, return_exceptions=True
+    )
+    assert research_call_count == 10
+    assert prediction_call_count == 16
+    assert isinstance(reports[3], RuntimeError)
+    for i in [0, 1, 2, 4]:
+        report = reports[i]
+        assert isinstance(report, ForecastReport)
+        assert report.question.question_text == f"Question {i}"
+        assert report.predictions_used == 4
+
+    with pytest.raises(RuntimeError):
+        await bot.forecast_questions(test_questions)
+
+
 async def test_use_research_summary_for_forecast() -> None:
     bot = MockBot(use_research_summary_to_forecast=True)
     test_question = ForecastingTestManager.get_fake_binary_questions()
@@ -0,0 +1,136 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+import pytest
+
+from forecasting_tools.forecasting.forecast_bots.forecast_pipeline import (
+    AsyncPipeline,
+    PipelineStage,
+)
+
+
+class StageTracker:
+    def __init__(self, seconds_per_item: float) -> None:
+        self.seconds_per_item = seconds_per_item
+        self.running = 0
+        self.max_running = 0
+
+    async def process(self, value: Any) -> Any:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.seconds_per_item)
+        self.running -= 1
+        if value == "fail":
+            raise RuntimeError("Stage failed")
+        return value
+
+
+async def iterate_items(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def test_stages_run_concurrently_with_their_own_worker_counts() -> None:
+    research = StageTracker(0.05)
+    forecast = StageTracker(0.05)
+    pipeline = AsyncPipeline(
+        [
+            PipelineStage("research", 3, research.process),
+            PipelineStage("forecast", 2, forecast.process),
+        ],
+        queue_size=2,
+    )
+    results: dict[int, Any] = {}
+
+    async def record(index: int, result: Any) -> None:
+        results[index] = result
+
+    number_of_items = await pipeline.run(
+        iterate_items(list(range(12))), record
+    )
+
+    assert number_of_items == 12
+    assert results == {i: i for i in range(12)}
+    assert research.max_running == 3
+    assert forecast.max_running == 2
+
+
+async def test_failed_items_skip_later_stages() -> None:
+    second_stage_values: list[Any] = []
+
+    async def record_value(value: Any) -> Any:
+        second_stage_values.append(value)
+        return value
+
+    pipeline = AsyncPipeline(
+        [
+            PipelineStage("first", 2, StageTracker(0).process),
+            PipelineStage("second", 2, record_value),
+        ],
+        queue_size=1,
+    )
+    results: dict[int, Any] = {}
+
+    async def record(index: int, result: Any) -> None:
+        results[index] = result
+
+    await pipeline.run(iterate_items(["a", "fail", "b"]), record)
+
+    assert results[0] == "a" and results[2] == "b"
+    assert isinstance(results[1], RuntimeError)
+    assert sorted(second_stage_values) == ["a", "b"]
+
+
+async def test_queues_hold_back_loading_items() -> None:
+    loaded_items = 0
+
+    async def count_loaded_items() -> AsyncIterator[int]:
+        nonlocal loaded_items
+        for i in range(50):
+            loaded_items += 1
+            yield i
+
+    async def wait_forever(value: Any) -> Any:
+        await asyncio.Event().wait()
+
+    pipeline = AsyncPipeline(
+        [PipelineStage("stuck", 1, wait_forever)], queue_size=2
+    )
+
+    async def record(index: int, result: Any) -> None:
+        pass
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            pipeline.run(count_loaded_items(), record), timeout=0.1
+        )
+    assert loaded_items <= 4
+
+
+async def test_errors_handling_results_stop_the_pipeline() -> None:
+    pipeline = AsyncPipeline(
+        [PipelineStage("only", 2, StageTracker(0.01).process)], queue_size=2
+    )
+
+    async def record(index: int, result: Any) -> None:
+        if isinstance(result, BaseException):
+            raise result
+
+    with pytest.raises(RuntimeError, match="Stage failed"):
+        await pipeline.run(iterate_items(["a", "fail"] + ["b"] * 20), record)
+
+
+async def test_errors_loading_items_stop_the_pipeline() -> None:
+    async def failing_items() -> AsyncIterator[str]:
+        yield "a"
+        raise ValueError("Could not load page")
+
+    pipeline = AsyncPipeline(
+        [PipelineStage("only", 1, StageTracker(0).process)], queue_size=2
+    )
+
+    async def record(index: int, result: Any) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="Could not load page"):
+        await pipeline.run(failing_items(), record)
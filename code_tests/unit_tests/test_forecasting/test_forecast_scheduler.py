@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from code_tests.unit_tests.test_forecasting.forecasting_test_manager import (
+    ForecastingTestManager,
+    MockBot,
+)
+from forecasting_tools.forecasting.forecast_bots.forecast_scheduler import (
+    ForecastScheduler,
+    SchedulingOrder,
+    TaskType,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+
+
+async def test_scheduler_never_exceeds_limit() -> None:
+    limit = 3
+    scheduler = ForecastScheduler(max_concurrent_research=limit)
+    running = 0
+    max_running = 0
+
+    async def task() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await asyncio.gather(
+        *[scheduler.run(TaskType.RESEARCH, task()) for _ in range(20)]
+    )
+    assert max_running == limit
+    assert scheduler.get_active_count(TaskType.RESEARCH) == 0
+    assert scheduler.get_waiting_count(TaskType.RESEARCH) == 0
+
+
+@pytest.mark.parametrize(
+    "order, expected_order",
+    [
+        (SchedulingOrder.FIFO, [1, 2, 3, 4]),
+        (SchedulingOrder.PRIORITY, [4, 3, 2, 1]),
+    ],
+)
+async def test_waiting_tasks_start_in_scheduling_order(
+    order: SchedulingOrder, expected_order: list[int]
+) -> None:
+    scheduler = ForecastScheduler(max_concurrent_questions=1, order=order)
+    started: list[int] = []
+    blocker = asyncio.Event()
+
+    async def task(task_id: int) -> None:
+        started.append(task_id)
+        if task_id == 0:
+            await blocker.wait()
+
+    first_task = asyncio.create_task(
+        scheduler.run(TaskType.QUESTION, task(0), priority=0)
+    )
+    await asyncio.sleep(0)
+    waiting_tasks = [
+        asyncio.create_task(
+            scheduler.run(TaskType.QUESTION, task(task_id), priority=task_id)
+        )
+        for task_id in [1, 2, 3, 4]
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.get_waiting_count(TaskType.QUESTION) == 4
+    blocker.set()
+    await asyncio.gather(first_task, *waiting_tasks)
+    assert started == [0] + expected_order
+
+
+async def test_cancelled_waiter_does_not_leak_slot() -> None:
+    scheduler = ForecastScheduler(max_concurrent_predictions=1)
+    blocker = asyncio.Event()
+
+    async def task() -> None:
+        await blocker.wait()
+
+    running_task = asyncio.create_task(
+        scheduler.run(TaskType.PREDICTION, task())
+    )
+    waiting_task = asyncio.create_task(
+        scheduler.run(TaskType.PREDICTION, task())
+    )
+    await asyncio.sleep(0)
+    waiting_task.cancel()
+    blocker.set()
+    await running_task
+    with pytest.raises(asyncio.CancelledError):
+        await waiting_task
+    assert scheduler.get_active_count(TaskType.PREDICTION) == 0
+
+
+def test_invalid_limit_raises_error() -> None:
+    with pytest.raises(ValueError):
+        ForecastScheduler(max_concurrent_questions=0)
+
+
+async def test_bot_respects_scheduler_limits() -> None:
+    scheduler = ForecastScheduler(
+        max_concurrent_questions=2,
+        max_concurrent_research=1,
+        max_concurrent_predictions=2,
+    )
+    bot = MockBot(
+        research_reports_per_question=2,
+        predictions_per_research_report=3,
+        scheduler=scheduler,
+    )
+    running_research = 0
+    max_running_research = 0
+    original_research = bot.run_research
+
+    async def tracked_research(*args, **kwargs):
+        nonlocal running_research, max_running_research
+        running_research += 1
+        max_running_research = max(max_running_research, running_research)
+        await asyncio.sleep(0.01)
+        running_research -= 1
+        return await original_research(*args, **kwargs)
+
+    bot.run_research = tracked_research
+    questions = [
+        ForecastingTestManager.get_fake_binary_questions() for _ in range(5)
+    ]
+    reports = await bot.forecast_questions(questions)
+    assert len(reports) == 5
+    assert all(isinstance(report, ForecastReport) for report in reports)
+    assert max_running_research == 1
+
+
+def test_bot_without_scheduler_is_unbounded() -> None:
+    scheduler = MockBot().scheduler
+    assert scheduler.max_concurrent_questions is None
+    assert scheduler.max_concurrent_research is None
+    assert scheduler.max_concurrent_predictions is None
@@ -0,0 +1,140 @@
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from forecasting_tools.forecasting.helpers import metaculus_api
+from forecasting_tools.forecasting.helpers.metaculus_api import (
+    ApiFilter,
+    MetaculusApi,
+)
+
+
+class FakePostsEndpoint:
+    def __init__(self, number_of_posts: int, returns_count: bool) -> None:
+        self.number_of_posts = number_of_posts
+        self.returns_count = returns_count
+        self.requested_params: list[dict[str, Any]] = []
+
+    def get_posts_json(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.requested_params.append(dict(params))
+        offset = params["offset"]
+        post_ids = range(
+            offset, min(offset + params["limit"], self.number_of_posts)
+        )
+        data: dict[str, Any] = {
+            "results": [self.create_post_json(i) for i in post_ids]
+        }
+        if self.returns_count:
+            data["count"] = self.number_of_posts
+        return data
+
+    @staticmethod
+    def create_post_json(post_id: int) -> dict:
+        return {
+            "id": post_id,
+            "nr_forecasters": 100,
+            "forecasts_count": 100,
+            "question": {
+                "id": post_id,
+                "type": "binary",
+                "status": "open",
+                "title": f"Question {post_id}",
+                "include_bots_in_aggregates": False,
+            },
+        }
+
+
+def use_fake_endpoint(
+    monkeypatch: pytest.MonkeyPatch, endpoint: FakePostsEndpoint
+) -> None:
+    monkeypatch.setattr(
+        MetaculusApi, "_get_posts_json", endpoint.get_posts_json
+    )
+    monkeypatch.setattr(MetaculusApi, "_page_cache", {})
+
+
+def test_count_is_read_from_a_single_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts=1234, returns_count=True)
+    use_fake_endpoint(monkeypatch, endpoint)
+    count = MetaculusApi._determine_how_many_questions_match_filter(
+        ApiFilter()
+    )
+    assert count == 1234
+    assert len(endpoint.requested_params) == 1
+    assert endpoint.requested_params[0]["limit"] == 1
+
+
+@pytest.mark.parametrize("number_of_posts", [0, 1, 2, 99, 100, 101, 4097])
+def test_count_is_exact_when_api_does_not_return_count(
+    monkeypatch: pytest.MonkeyPatch, number_of_posts: int
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts, returns_count=False)
+    use_fake_endpoint(monkeypatch, endpoint)
+    count = MetaculusApi._determine_how_many_questions_match_filter(
+        ApiFilter()
+    )
+    assert count == number_of_posts
+    assert all(params["limit"] == 1 for params in endpoint.requested_params)
+    assert len(endpoint.requested_params) <= 30
+
+
+async def test_random_sampling_uses_few_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts=5000, returns_count=True)
+    use_fake_endpoint(monkeypatch, endpoint)
+    questions = await MetaculusApi.get_questions_matching_filter(
+        ApiFilter(), num_questions=50, randomly_sample=True
+    )
+    assert len(questions) == 50
+    assert len({question.id_of_post for question in questions}) == 50
+    assert len(endpoint.requested_params) == 2
+
+
+def test_pages_are_cached_between_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts=150, returns_count=True)
+    use_fake_endpoint(monkeypatch, endpoint)
+    first_page, _ = MetaculusApi._grab_filtered_questions_with_offset(
+        ApiFilter(), 0, use_page_cache=True
+    )
+    second_page, _ = MetaculusApi._grab_filtered_questions_with_offset(
+        ApiFilter(), 0, use_page_cache=True
+    )
+    assert [question.id_of_post for question in first_page] == [
+        question.id_of_post for question in second_page
+    ]
+    assert len(endpoint.requested_params) == 1
+
+
+def test_pages_are_not_cached_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts=150, returns_count=True)
+    use_fake_endpoint(monkeypatch, endpoint)
+    for _ in range(2):
+        MetaculusApi._grab_filtered_questions_with_offset(ApiFilter(), 0)
+    assert len(endpoint.requested_params) == 2
+
+
+def test_posting_a_prediction_clears_page_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    endpoint = FakePostsEndpoint(number_of_posts=150, returns_count=True)
+    use_fake_endpoint(monkeypatch, endpoint)
+    monkeypatch.setenv("METACULUS_TOKEN", "fake-token")
+    monkeypatch.setattr(
+        metaculus_api.requests, "post", lambda *args, **kwargs: Mock()
+    )
+    MetaculusApi._grab_filtered_questions_with_offset(
+        ApiFilter(), 0, use_page_cache=True
+    )
+    MetaculusApi.post_binary_question_prediction(1, 0.5)
+    MetaculusApi._grab_filtered_questions_with_offset(
+        ApiFilter(), 0, use_page_cache=True
+    )
+    assert len(endpoint.requested_params) == 2
@@ -0,0 +1,198 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from forecasting_tools.forecasting.helpers.metaculus_api import (
+    ApiFilter,
+    MetaculusApi,
+)
+from forecasting_tools.forecasting.helpers.question_store import QuestionStore
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    MetaculusQuestion,
+    QuestionState,
+)
+
+
+class FakePostsEndpoint:
+    def __init__(self, number_of_posts: int) -> None:
+        self.number_of_posts = number_of_posts
+        self.requested_offsets: list[int] = []
+        self.updated_posts: dict[int, dict] = {}
+
+    def get_posts_json(self, params: dict[str, Any]) -> dict[str, Any]:
+        assert params["order_by"] == "-published_at"
+        offset = params["offset"]
+        self.requested_offsets.append(offset)
+        posts = [
+            self.get_post_json(post_id)
+            for post_id in range(self.number_of_posts - 1, -1, -1)
+        ]
+        if "statuses" in params:
+            posts = [
+                post
+                for post in posts
+                if post["question"]["status"] in params["statuses"]
+            ]
+        return {"results": posts[offset : offset + params["limit"]]}
+
+    def get_question_by_post_id(self, post_id: int) -> MetaculusQuestion:
+        return MetaculusApi._metaculus_api_json_to_question(
+            self.get_post_json(post_id)
+        )
+
+    def get_post_json(self, post_id: int) -> dict:
+        return self.updated_posts.get(post_id) or self.create_post_json(
+            post_id
+        )
+
+    @staticmethod
+    def create_post_json(post_id: int) -> dict:
+        return {
+            "id": post_id,
+            "nr_forecasters": post_id,
+            "forecasts_count": post_id,
+            "published_at": f"2024-01-01T00:{post_id // 60:02d}:{post_id % 60:02d}Z",
+            "scheduled_close_time": f"2025-01-{post_id % 28 + 1:02d}T00:00:00Z",
+            "projects": {
+                "tournament": (
+                    [{"id": 32506, "slug": "aibq4"}] if post_id % 2 else []
+                )
+            },
+            "question": {
+                "id": post_id,
+                "type": "binary",
+                "status": "open",
+                "title": f"Question {post_id}",
+                "include_bots_in_aggregates": False,
+            },
+        }
+
+
+@pytest.fixture
+def endpoint(monkeypatch: pytest.MonkeyPatch) -> FakePostsEndpoint:
+    endpoint = FakePostsEndpoint(number_of_posts=250)
+    monkeypatch.setattr(
+        MetaculusApi, "_get_posts_json", endpoint.get_posts_json
+    )
+    monkeypatch.setattr(
+        MetaculusApi,
+        "get_question_by_post_id",
+        endpoint.get_question_by_post_id,
+    )
+    return endpoint
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> QuestionStore:
+    return QuestionStore(str(tmp_path / "questions.sqlite"))
+
+
+def test_sync_stores_every_question(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    assert store.sync(refresh_unresolved_questions=False) == 250
+    assert len(store) == 250
+    assert endpoint.requested_offsets == [0, 100, 200]
+    question = store.get_question_by_post_id(42)
+    assert question is not None
+    assert question.question_text == "Question 42"
+    assert store.get_question_by_post_id(1000) is None
+
+
+def test_second_sync_only_downloads_new_pages(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    store.sync(refresh_unresolved_questions=False)
+    endpoint.number_of_posts = 300
+    endpoint.requested_offsets.clear()
+    assert store.sync(refresh_unresolved_questions=False) == 100
+    assert endpoint.requested_offsets == [0]
+    assert len(store) == 300
+
+
+def test_sync_stopped_by_max_pages_is_resumed_by_next_sync(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    assert store.sync(max_pages=1, refresh_unresolved_questions=False) == 100
+    assert len(store) == 100
+    endpoint.number_of_posts = 270
+    endpoint.requested_offsets.clear()
+
+    store.sync(refresh_unresolved_questions=False)
+    assert len(store) == 270
+    assert endpoint.requested_offsets == [100, 200, 0]
+
+    endpoint.requested_offsets.clear()
+    assert store.sync(refresh_unresolved_questions=False) == 100
+    assert endpoint.requested_offsets == [0]
+
+
+def test_sync_refreshes_questions_that_changed_after_publishing(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    store.sync()
+    updated_post = endpoint.create_post_json(10)
+    updated_post["nr_forecasters"] = 500
+    resolved_post = endpoint.create_post_json(20)
+    resolved_post["question"]["status"] = "resolved"
+    endpoint.updated_posts = {10: updated_post, 20: resolved_post}
+
+    assert store.sync() == 250
+    updated_question = store.get_question_by_post_id(10)
+    resolved_question = store.get_question_by_post_id(20)
+    assert updated_question is not None and resolved_question is not None
+    assert updated_question.num_forecasters == 500
+    assert resolved_question.state == QuestionState.RESOLVED
+    open_questions = store.get_questions_matching_filter(
+        ApiFilter(allowed_statuses=["open"])
+    )
+    assert 20 not in {question.id_of_post for question in open_questions}
+
+
+def test_filters_are_answered_locally(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    store.sync()
+    endpoint.requested_offsets.clear()
+    api_filter = ApiFilter(
+        allowed_tournaments=["aibq4"],
+        num_forecasters_gte=200,
+        close_time_lt=datetime(2025, 1, 10),
+    )
+    questions = store.get_questions_matching_filter(api_filter)
+
+    expected_ids = [
+        post_id
+        for post_id in range(249, 199, -1)
+        if post_id % 2 and post_id % 28 + 1 < 10
+    ]
+    assert [question.id_of_post for question in questions] == expected_ids
+    assert endpoint.requested_offsets == []
+    assert questions == MetaculusApi._apply_local_filters(
+        questions, api_filter
+    )
+
+
+def test_tournaments_can_be_selected_by_id(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    store.sync()
+    questions = store.get_questions_matching_filter(
+        ApiFilter(allowed_tournaments=[32506])
+    )
+    assert len(questions) == 125
+    assert all(question.id_of_post % 2 for question in questions)
+
+
+def test_random_sampling(
+    store: QuestionStore, endpoint: FakePostsEndpoint
+) -> None:
+    store.sync()
+    questions = store.get_questions_matching_filter(
+        ApiFilter(), num_questions=30, randomly_sample=True
+    )
+    assert len({question.id_of_post for question in questions}) == 30
+    with pytest.raises(ValueError):
+        store.get_questions_matching_filter(ApiFilter(), num_questions=251)
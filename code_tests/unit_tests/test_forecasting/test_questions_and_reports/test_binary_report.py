@@ -155,3 +155,10 @@ def test_calculate_average_deviation_points() -> None:
     ]
     with pytest.raises(AssertionError):
         BinaryReport.calculate_average_deviation_points(reports_with_none)
+
+
+def test_prediction_spread_is_interquartile_range() -> None:
+    assert BinaryReport.calculate_prediction_spread(
+        [0.1, 0.2, 0.3, 0.4, 0.5]
+    ) == pytest.approx(0.2)
+    assert BinaryReport.calculate_prediction_spread([0.7]) == 0
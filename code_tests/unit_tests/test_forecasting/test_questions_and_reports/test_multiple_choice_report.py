@@ -97,3 +97,18 @@ async def test_aggregate_predictions_with_different_options() -> None:
     question = create_test_mc_question()
     with pytest.raises(Exception):
         await MultipleChoiceReport.aggregate_predictions(predictions, question)
+
+
+def test_prediction_spread_is_largest_option_spread() -> None:
+    predictions = [
+        PredictedOptionList(
+            predicted_options=[
+                PredictedOption(option_name="Option A", probability=a),
+                PredictedOption(option_name="Option B", probability=1 - a),
+            ]
+        )
+        for a in [0.2, 0.3, 0.4, 0.6, 0.8]
+    ]
+    assert MultipleChoiceReport.calculate_prediction_spread(
+        predictions
+    ) == pytest.approx(0.3)
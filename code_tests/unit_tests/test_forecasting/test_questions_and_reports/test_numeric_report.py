@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
+    NumericAggregationMethod,
     NumericDistribution,
     NumericReport,
     Percentile,
@@ -222,3 +224,184 @@ def test_close_bound_distribution(percentiles: list[Percentile]) -> None:
         assert (
             distribution.cdf[i + 1].value - distribution.cdf[i].value > 0.00001
         )
+
+
+def test_cdf_arrays_match_cdf_list_and_are_cached() -> None:
+    distribution = NumericDistribution(
+        declared_percentiles=[
+            Percentile(value=10.0, percentile=0.1),
+            Percentile(value=20.0, percentile=0.5),
+            Percentile(value=30.0, percentile=0.9),
+        ],
+        open_upper_bound=True,
+        open_lower_bound=False,
+        upper_bound=100.0,
+        lower_bound=1.0,
+        zero_point=0.0,
+    )
+    cdf = distribution.cdf
+    assert [p.value for p in cdf] == distribution.cdf_values.tolist()
+    assert [p.percentile for p in cdf] == distribution.cdf_percentiles.tolist()
+    assert distribution.cdf_percentiles is distribution.cdf_percentiles
+    assert np.all(np.diff(distribution.cdf_percentiles) >= 0)
+    with pytest.raises(ValueError):
+        distribution.cdf_percentiles[0] = 0.5
+
+    uncached_copy = NumericDistribution(**distribution.model_dump())
+    assert uncached_copy == distribution
+    assert uncached_copy.model_dump() == distribution.model_dump()
+
+
+def test_cdf_is_recalculated_after_distribution_changes() -> None:
+    distribution = NumericDistribution(
+        declared_percentiles=[
+            Percentile(value=10.0, percentile=0.1),
+            Percentile(value=20.0, percentile=0.5),
+            Percentile(value=30.0, percentile=0.9),
+        ],
+        open_upper_bound=False,
+        open_lower_bound=False,
+        upper_bound=100.0,
+        lower_bound=0.0,
+        zero_point=None,
+    )
+    original_percentiles = distribution.cdf_percentiles
+    distribution.declared_percentiles = [
+        Percentile(value=50.0, percentile=0.1),
+        Percentile(value=60.0, percentile=0.5),
+        Percentile(value=70.0, percentile=0.9),
+    ]
+    assert np.all(distribution.cdf_percentiles <= original_percentiles)
+    assert distribution.cdf_percentiles[100] < original_percentiles[100]
+
+
+def test_aggregate_cdfs_methods() -> None:
+    stacked_cdfs = np.array(
+        [
+            [0.0, 0.1, 0.2, 1.0],
+            [0.0, 0.2, 0.4, 1.0],
+            [0.0, 0.3, 0.6, 1.0],
+            [0.0, 0.4, 0.8, 1.0],
+            [0.0, 0.9, 0.95, 1.0],
+        ]
+    )
+    median = NumericReport.aggregate_cdfs(
+        stacked_cdfs, NumericAggregationMethod.MEDIAN
+    )
+    mean = NumericReport.aggregate_cdfs(
+        stacked_cdfs, NumericAggregationMethod.MEAN
+    )
+    trimmed_mean = NumericReport.aggregate_cdfs(
+        stacked_cdfs,
+        NumericAggregationMethod.TRIMMED_MEAN,
+        trimmed_proportion=0.2,
+    )
+    assert median.tolist() == pytest.approx([0.0, 0.3, 0.6, 1.0])
+    assert mean.tolist() == pytest.approx([0.0, 0.38, 0.59, 1.0])
+    assert trimmed_mean.tolist() == pytest.approx([0.0, 0.3, 0.6, 1.0])
+
+    log_pool = NumericReport.aggregate_cdfs(
+        stacked_cdfs, NumericAggregationMethod.LOG_POOL
+    )
+    assert log_pool[0] == pytest.approx(0.0)
+    assert log_pool[-1] == pytest.approx(1.0)
+    assert np.all(np.diff(log_pool) > 0)
+
+    identical_cdfs = np.array([[0.0, 0.25, 0.5, 1.0]] * 3)
+    assert NumericReport.aggregate_cdfs(
+        identical_cdfs, NumericAggregationMethod.LOG_POOL
+    ).tolist() == pytest.approx([0.0, 0.25, 0.5, 1.0])
+
+
+@pytest.mark.parametrize("aggregation_method", list(NumericAggregationMethod))
+async def test_aggregate_predictions_with_each_method(
+    aggregation_method: NumericAggregationMethod,
+) -> None:
+    question = NumericQuestion(
+        id_of_post=1,
+        question_text="Test question",
+        upper_bound=100.0,
+        lower_bound=0.0,
+        open_upper_bound=True,
+        open_lower_bound=False,
+        zero_point=None,
+    )
+    predictions = [
+        NumericDistribution(
+            declared_percentiles=[
+                Percentile(value=center - 10, percentile=0.1),
+                Percentile(value=center, percentile=0.5),
+                Percentile(value=center + 10, percentile=0.9),
+            ],
+            open_upper_bound=True,
+            open_lower_bound=False,
+            upper_bound=100.0,
+            lower_bound=0.0,
+            zero_point=None,
+        )
+        for center in [30.0, 40.0, 50.0]
+    ]
+    aggregated = await NumericReport.aggregate_predictions(
+        predictions, question, aggregation_method
+    )
+    assert len(aggregated.declared_percentiles) == 201
+    assert aggregated.cdf_values.tolist() == predictions[0].cdf_values.tolist()
+    assert 0.3 < aggregated.cdf_percentiles[80] < 0.7
+
+
+async def test_aggregate_predictions_requires_same_x_axis() -> None:
+    question = NumericQuestion(
+        id_of_post=1,
+        question_text="Test question",
+        upper_bound=100.0,
+        lower_bound=0.0,
+        open_upper_bound=False,
+        open_lower_bound=False,
+        zero_point=None,
+    )
+    percentiles = [
+        Percentile(value=20.0, percentile=0.1),
+        Percentile(value=30.0, percentile=0.9),
+    ]
+    predictions = [
+        NumericDistribution(
+            declared_percentiles=percentiles,
+            open_upper_bound=False,
+            open_lower_bound=False,
+            upper_bound=upper_bound,
+            lower_bound=0.0,
+            zero_point=None,
+        )
+        for upper_bound in [100.0, 200.0]
+    ]
+    with pytest.raises(ValueError, match="X axis"):
+        await NumericReport.aggregate_predictions(predictions, question)
+
+
+def test_prediction_spread_is_largest_cdf_spread() -> None:
+    def create_distribution(shift: float) -> NumericDistribution:
+        return NumericDistribution(
+            declared_percentiles=[
+                Percentile(value=40.0 + shift, percentile=0.1),
+                Percentile(value=50.0 + shift, percentile=0.5),
+                Percentile(value=60.0 + shift, percentile=0.9),
+            ],
+            open_upper_bound=False,
+            open_lower_bound=False,
+            upper_bound=100.0,
+            lower_bound=0.0,
+            zero_point=None,
+        )
+
+    identical_predictions = [create_distribution(0) for _ in range(3)]
+    assert NumericReport.calculate_prediction_spread(
+        identical_predictions
+    ) == pytest.approx(0)
+
+    close_spread = NumericReport.calculate_prediction_spread(
+        [create_distribution(shift) for shift in [-1, 0, 1]]
+    )
+    wide_spread = NumericReport.calculate_prediction_spread(
+        [create_distribution(shift) for shift in [-20, 0, 20]]
+    )
+    assert 0 < close_spread < wide_spread <= 1
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+
+from code_tests.unit_tests.test_forecasting.forecasting_test_manager import (
+    ForecastingTestManager,
+    MockBot,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.report_sink import (
+    JsonlReportSink,
+)
+
+
+@pytest.fixture
+def sink(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> JsonlReportSink:
+    monkeypatch.setenv("FILE_WRITING_ALLOWED", "TRUE")
+    return JsonlReportSink(str(tmp_path / "reports.jsonl"))
+
+
+def test_reports_are_appended_one_per_line(sink: JsonlReportSink) -> None:
+    assert sink.load_reports() == []
+    first_report = ForecastingTestManager.get_fake_forecast_report(
+        prediction=0.1
+    )
+    second_report = ForecastingTestManager.get_fake_forecast_report(
+        prediction=0.9
+    )
+    sink.add_report(first_report)
+    sink.add_reports([second_report])
+
+    with open(sink.file_path, "r") as file:
+        assert len(file.readlines()) == 2
+    loaded_reports = sink.load_reports()
+    assert [report.prediction for report in loaded_reports] == [0.1, 0.9]
+
+
+def test_partially_written_last_line_is_ignored(
+    sink: JsonlReportSink,
+) -> None:
+    sink.add_report(ForecastingTestManager.get_fake_forecast_report())
+    with open(sink.file_path, "a") as file:
+        file.write('{"question": {"question_text": "Will')
+    assert len(sink.load_reports()) == 1
+
+
+def test_reports_appended_after_a_truncated_line_can_be_loaded(
+    sink: JsonlReportSink,
+) -> None:
+    sink.add_report(
+        ForecastingTestManager.get_fake_forecast_report(prediction=0.1)
+    )
+    with open(sink.file_path, "a") as file:
+        file.write('{"question": {"question_text": "Will')
+    sink.add_report(
+        ForecastingTestManager.get_fake_forecast_report(prediction=0.9)
+    )
+    sink.add_report(
+        ForecastingTestManager.get_fake_forecast_report(prediction=0.5)
+    )
+
+    loaded_reports = sink.load_reports()
+    assert [report.prediction for report in loaded_reports] == [0.1, 0.9, 0.5]
+    with open(sink.file_path, "r") as file:
+        assert len(file.readlines()) == 3
+
+
+def test_malformed_lines_are_skipped(sink: JsonlReportSink) -> None:
+    sink.add_report(ForecastingTestManager.get_fake_forecast_report())
+    with open(sink.file_path, "a") as file:
+        file.write('{"question": {"question_text": "Will\n')
+    sink.add_report(ForecastingTestManager.get_fake_forecast_report())
+    assert len(sink.load_reports()) == 2
+
+
+async def test_bot_writes_each_report_to_sink(sink: JsonlReportSink) -> None:
+    bot = MockBot(report_sink=sink)
+    questions = [ForecastingTestManager.get_fake_binary_questions()]
+    reports = await bot.forecast_questions(questions)
+    assert len(sink.load_reports()) == len(reports) == 1
+
+
+async def test_bot_resumes_from_sink(sink: JsonlReportSink) -> None:
+    finished_question = ForecastingTestManager.get_fake_binary_questions()
+    unfinished_question = finished_question.model_copy(
+        update={"id_of_post": 1}
+    )
+    previous_report = ForecastingTestManager.get_fake_forecast_report(
+        prediction=0.123
+    )
+    sink.add_report(previous_report)
+    bot = MockBot(report_sink=sink, resume_from_report_sink=True)
+    research_calls_before = MockBot.research_calls
+
+    reports = await bot.forecast_questions(
+        [finished_question, unfinished_question]
+    )
+
+    assert MockBot.research_calls == research_calls_before + 1
+    assert len(reports) == 2
+    assert all(isinstance(report, ForecastReport) for report in reports)
+    assert reports[0].prediction == 0.123
+    assert reports[1].question.id_of_post == 1
+    assert sink.get_finished_question_ids() == {0, 1}
+
+
+def test_resuming_requires_sink() -> None:
+    with pytest.raises(AssertionError):
+        MockBot(resume_from_report_sink=True)
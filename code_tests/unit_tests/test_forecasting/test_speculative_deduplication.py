@@ -0,0 +1,144 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from forecasting_tools.forecasting.sub_question_researchers.deduplicator import (
+    Deduplicator,
+)
+
+ITEMS = [
+    "apple pie",
+    "banana bread",
+    "apple tart",
+    "cherry jam",
+    "banana split",
+    "date loaf",
+    "cherry pie",
+    "elderberry wine",
+    "fig roll",
+    "date syrup",
+]
+
+
+class FakeDuplicateChecker:
+    """
+    Items are duplicates if they start with the same word. Each check sleeps
+    so concurrent checks can be measured
+    """
+
+    def __init__(self, seconds_per_check: float = 0) -> None:
+        self.seconds_per_check = seconds_per_check
+        self.checks = 0
+        self.running_checks = 0
+        self.max_running_checks = 0
+
+    async def __call__(
+        self,
+        item: str,
+        list_to_check: list[str],
+        use_internet_search: bool = False,
+        threshold_for_initial_semantic_check: float = 0.85,
+    ) -> bool:
+        self.checks += 1
+        self.running_checks += 1
+        self.max_running_checks = max(
+            self.max_running_checks, self.running_checks
+        )
+        await asyncio.sleep(self.seconds_per_check)
+        self.running_checks -= 1
+        first_word = item.split()[0]
+        return any(other.split()[0] == first_word for other in list_to_check)
+
+
+@pytest.mark.parametrize("max_concurrent_checks", [2, 3, 4, 10, 20])
+async def test_speculative_mode_matches_sequential_mode(
+    monkeypatch: pytest.MonkeyPatch, max_concurrent_checks: int
+) -> None:
+    monkeypatch.setattr(
+        Deduplicator, "determine_if_item_is_duplicate", FakeDuplicateChecker()
+    )
+    sequential_items = await Deduplicator.deduplicate_list_one_item_at_a_time(
+        ITEMS
+    )
+    speculative_items = await Deduplicator.deduplicate_list_one_item_at_a_time(
+        ITEMS, max_concurrent_checks=max_concurrent_checks
+    )
+    assert sequential_items == [
+        "apple pie",
+        "banana bread",
+        "cherry jam",
+        "date loaf",
+        "elderberry wine",
+        "fig roll",
+    ]
+    assert speculative_items == sequential_items
+
+
+@pytest.mark.parametrize("max_concurrent_checks", [1, 2, 3])
+async def test_duplicates_are_not_assumed_to_be_transitive(
+    monkeypatch: pytest.MonkeyPatch, max_concurrent_checks: int
+) -> None:
+    async def is_duplicate(item: str, list_to_check: list[str], *args) -> bool:
+        duplicate_pairs = {("b", "a"), ("c", "b")}
+        return any((item, other) in duplicate_pairs for other in list_to_check)
+
+    monkeypatch.setattr(
+        Deduplicator, "determine_if_item_is_duplicate", is_duplicate
+    )
+    assert await Deduplicator.deduplicate_list_one_item_at_a_time(
+        ["a", "b", "c"], max_concurrent_checks=max_concurrent_checks
+    ) == ["a", "c"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+async def test_speculative_mode_matches_sequential_mode_for_any_duplicates(
+    monkeypatch: pytest.MonkeyPatch, seed: int
+) -> None:
+    generator = random.Random(seed)
+    items = [f"item {i}" for i in range(12)]
+    duplicate_pairs = {
+        (item, other)
+        for item in items
+        for other in items
+        if item != other and generator.random() < 0.2
+    }
+
+    async def is_duplicate(item: str, list_to_check: list[str], *args) -> bool:
+        return any((item, other) in duplicate_pairs for other in list_to_check)
+
+    monkeypatch.setattr(
+        Deduplicator, "determine_if_item_is_duplicate", is_duplicate
+    )
+    sequential_items = await Deduplicator.deduplicate_list_one_item_at_a_time(
+        items
+    )
+    for max_concurrent_checks in [2, 5, 12]:
+        assert (
+            await Deduplicator.deduplicate_list_one_item_at_a_time(
+                items, max_concurrent_checks=max_concurrent_checks
+            )
+            == sequential_items
+        )
+
+
+async def test_speculative_mode_runs_checks_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checker = FakeDuplicateChecker(seconds_per_check=0.05)
+    monkeypatch.setattr(
+        Deduplicator, "determine_if_item_is_duplicate", checker
+    )
+    start_time = time.time()
+    await Deduplicator.deduplicate_list_one_item_at_a_time(
+        ITEMS, max_concurrent_checks=len(ITEMS)
+    )
+    duration = time.time() - start_time
+
+    assert checker.max_running_checks == len(ITEMS)
+    assert duration < checker.seconds_per_check * len(ITEMS) / 2
+    with pytest.raises(ValueError):
+        await Deduplicator.deduplicate_list_one_item_at_a_time(
+            ITEMS, max_concurrent_checks=0
+        )
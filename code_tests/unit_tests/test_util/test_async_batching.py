@@ -325,3 +325,122 @@ def test__run_coroutines_with_action_called_on_exception__handles_no_matching_in
         [isinstance(result, int) for result in results]
     ), "Not all results were integers"
     assert all(inputs == None for inputs in inputs), "Not all inputs were None"
+
+
+async def test_gather_removing_exceptions_runs_inside_event_loop() -> None:
+    async def failing_coroutine() -> int:
+        raise RuntimeError("Test exception")
+
+    async def waiting_coroutine(input: int) -> int:
+        await asyncio.sleep(0.1)
+        return input
+
+    coroutines = [waiting_coroutine(i) for i in range(20)] + [
+        failing_coroutine()
+    ]
+    inputs = list(range(21))
+    errors: list[tuple[Exception, int]] = []
+    start_time = time.time()
+    results, successful_inputs = (
+        await async_batching.gather_removing_exceptions(
+            coroutines, inputs, lambda e, i: errors.append((e, i))
+        )
+    )
+    duration = time.time() - start_time
+
+    assert results == list(range(20))
+    assert successful_inputs == list(range(20))
+    assert len(errors) == 1 and errors[0][1] == 20
+    assert duration < 0.5, "Coroutines did not run concurrently"
+
+
+async def test_gather_removing_exceptions_respects_max_concurrency() -> None:
+    running = 0
+    max_running = 0
+
+    async def tracked_coroutine(input: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return input
+
+    results, _ = await async_batching.gather_removing_exceptions(
+        [tracked_coroutine(i) for i in range(20)], max_concurrency=3
+    )
+    assert results == list(range(20))
+    assert max_running == 3
+
+    with pytest.raises(ValueError):
+        await async_batching.gather_removing_exceptions([], max_concurrency=0)
+
+
+async def test_iterate_as_completed_yields_in_finishing_order() -> None:
+    async def wait_and_return(input: int, seconds_to_wait: float) -> int:
+        await asyncio.sleep(seconds_to_wait)
+        return input
+
+    coroutines = [
+        wait_and_return(0, 0.15),
+        wait_and_return(1, 0.05),
+        wait_and_return(2, 0.1),
+    ]
+    completed = [
+        (index, result)
+        async for index, result in async_batching.iterate_as_completed(
+            coroutines
+        )
+    ]
+    assert completed == [(1, 1), (2, 2), (0, 0)]
+
+
+async def test_iterate_as_completed_starts_next_when_one_finishes() -> None:
+    start_order: list[int] = []
+
+    async def record_start(input: int) -> int:
+        start_order.append(input)
+        await asyncio.sleep(0.01 * (5 - input))
+        return input
+
+    completed = [
+        index
+        async for index, _ in async_batching.iterate_as_completed(
+            [record_start(i) for i in range(5)], max_concurrency=2
+        )
+    ]
+    assert start_order == [0, 1, 2, 3, 4]
+    assert sorted(completed) == list(range(5))
+
+
+async def test_run_in_task_group_cancels_others_on_failure() -> None:
+    cancelled: list[int] = []
+
+    async def slow_coroutine(input: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(input)
+            raise
+        return input
+
+    async def failing_coroutine() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Test exception")
+
+    with pytest.raises(RuntimeError, match="Test exception"):
+        await async_batching.run_in_task_group(
+            [slow_coroutine(0), failing_coroutine(), slow_coroutine(2)]
+        )
+    assert sorted(cancelled) == [0, 2]
+
+
+async def test_run_in_task_group_returns_results_in_order() -> None:
+    async def wait_and_return(input: int) -> int:
+        await asyncio.sleep(0.01 * (10 - input))
+        return input
+
+    results = await async_batching.run_in_task_group(
+        [wait_and_return(i) for i in range(10)], max_concurrency=4
+    )
+    assert results == list(range(10))
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+
+from forecasting_tools.ai_models.ai_utils.embedding_providers import (
+    EmbeddingProvider,
+    get_default_embedding_providers,
+)
+from forecasting_tools.util import file_manipulation
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingIndex:
+    """
+    Embeds each string once, in batched requests, and caches the embeddings
+    by model and text hash (in memory and in a SQLite file) so strings seen by
+    earlier deduplication passes are never embedded again.
+
+    Providers are tried in order (see get_default_embedding_providers). All
+    embeddings returned by one call come from the same provider, since vectors
+    from different models cannot be compared.
+
+    Similarity checks normalize the embeddings once and use matrix products,
+    so deduplicating n items is one embedding pass plus one n x n product.
+
+    The async methods run local providers in a process pool and network
+    providers in a thread, so embedding does not block the event loop.
+    """
+
+    DEFAULT_FILE_PATH = "logs/cache/embedding_cache.sqlite"
+    _shared_process_pool: ProcessPoolExecutor | None = None
+
+    def __init__(
+        self,
+        file_path: str | None = DEFAULT_FILE_PATH,
+        providers: list[EmbeddingProvider] | None = None,
+        batch_size: int = 64,
+        local_executor: Executor | None = None,
+    ) -> None:
+        """
+        Set file_path to None to only cache embeddings in memory.
+        local_executor defaults to a process pool shared by every index
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.file_path = (
+            file_manipulation.get_absolute_path(file_path)
+            if file_path is not None
+            else None
+        )
+        self.providers = (
+            providers
+            if providers is not None
+            else get_default_embedding_providers()
+        )
+        if not self.providers:
+            raise ValueError("At least one embedding provider is required")
+        self.batch_size = batch_size
+        self.local_executor = local_executor
+        self.texts_embedded: int = 0
+        self.cache_hits: int = 0
+        self.__vectors: dict[tuple[str, str], np.ndarray] = {}
+        self.__lock = threading.Lock()
+        self.__connection = (
+            self.__create_connection() if self.file_path is not None else None
+        )
+
+    def get_embeddings(self, texts: list[str]) -> np.ndarray:
+        """
+        Returns a (len(texts), dimensions) array of unit length embeddings
+        """
+        if not texts:
+            return np.zeros((0, 0))
+        errors: list[Exception] = []
+        for provider in self.providers:
+            try:
+                keys, batches = self.__get_batches_to_embed(texts, provider)
+                for batch_keys, batch_texts in batches:
+                    self.__store_vectors(
+                        batch_keys, batch_texts, provider.embed(batch_texts)
+                    )
+                return self.__stack_vectors(keys)
+            except Exception as e:
+                self.__log_provider_failure(provider, e)
+                errors.append(e)
+        raise RuntimeError(f"All embedding providers failed. Errors: {errors}")
+
+    async def get_embeddings_async(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0))
+        errors: list[Exception] = []
+        for provider in self.providers:
+            try:
+                keys, batches = self.__get_batches_to_embed(texts, provider)
+                batch_vectors = await asyncio.gather(
+                    *[
+                        self.__embed_off_event_loop(provider, batch_texts)
+                        for _, batch_texts in batches
+                    ]
+                )
+                for (batch_keys, batch_texts), vectors in zip(
+                    batches, batch_vectors
+                ):
+                    self.__store_vectors(batch_keys, batch_texts, vectors)
+                return self.__stack_vectors(keys)
+            except Exception as e:
+                self.__log_provider_failure(provider, e)
+                errors.append(e)
+        raise RuntimeError(f"All embedding providers failed. Errors: {errors}")
+
+    def deduplicate(self, texts: list[str], threshold: float) -> list[str]:
+        """
+        Greedily keeps each text unless its cosine similarity to an
+        already kept text is above the threshold
+        """
+        if not texts:
+            return []
+        return self.__deduplicate_embeddings(
+            texts, self.get_embeddings(texts), threshold
+        )
+
+    async def deduplicate_async(
+        self, texts: list[str], threshold: float
+    ) -> list[str]:
+        if not texts:
+            return []
+        return self.__deduplicate_embeddings(
+            texts, await self.get_embeddings_async(texts), threshold
+        )
+
+    def text_is_similar_to_any(
+        self, text: str, texts_to_compare_to: list[str], threshold: float
+    ) -> bool:
+        if not texts_to_compare_to:
+            return False
+        embeddings = self.get_embeddings([text] + texts_to_compare_to)
+        return self.__first_is_similar_to_any(embeddings, threshold)
+
+    async def text_is_similar_to_any_async(
+        self, text: str, texts_to_compare_to: list[str], threshold: float
+    ) -> bool:
+        if not texts_to_compare_to:
+            return False
+        embeddings = await self.get_embeddings_async(
+            [text] + texts_to_compare_to
+        )
+        return self.__first_is_similar_to_any(embeddings, threshold)
+
+    @staticmethod
+    def __deduplicate_embeddings(
+        texts: list[str], embeddings: np.ndarray, threshold: float
+    ) -> list[str]:
+        similarities = embeddings @ embeddings.T
+        kept_indexes: list[int] = []
+        for i in range(len(texts)):
+            if (
+                kept_indexes
+                and similarities[i, kept_indexes].max() > threshold
+            ):
+                continue
+            kept_indexes.append(i)
+        return [texts[i] for i in kept_indexes]
+
+    @staticmethod
+    def __first_is_similar_to_any(
+        embeddings: np.ndarray, threshold: float
+    ) -> bool:
+        similarities = embeddings[1:] @ embeddings[0]
+        return bool(similarities.max() > threshold)
+
+    async def __embed_off_event_loop(
+        self, provider: EmbeddingProvider, texts: list[str]
+    ) -> list[list[float]]:
+        if not provider.RUNS_LOCALLY:
+            return await asyncio.to_thread(provider.embed, texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__get_local_executor(), provider.embed, texts
+        )
+
+    def __get_local_executor(self) -> Executor:
+        if self.local_executor is not None:
+            return self.local_executor
+        if EmbeddingIndex._shared_process_pool is None:
+            EmbeddingIndex._shared_process_pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1)
+            )
+        return EmbeddingIndex._shared_process_pool
+
+    def __get_batches_to_embed(
+        self, texts: list[str], provider: EmbeddingProvider
+    ) -> tuple[
+        list[tuple[str, str]], list[tuple[list[tuple[str, str]], list[str]]]
+    ]:
+        keys = [(provider.model_name, self.hash_text(text)) for text in texts]
+        missing_texts_by_key: dict[tuple[str, str], str] = {}
+        with self.__lock:
+            for key, text in zip(keys, texts):
+                if key in self.__vectors or key in missing_texts_by_key:
+                    continue
+                vector = self.__read_vector_from_disk(key)
+                if vector is not None:
+                    self.__vectors[key] = vector
+                    self.cache_hits += 1
+                else:
+                    missing_texts_by_key[key] = text
+
+        missing_keys = list(missing_texts_by_key.keys())
+        batches = []
+        for start in range(0, len(missing_keys), self.batch_size):
+            batch_keys = missing_keys[start : start + self.batch_size]
+            batch_texts = [missing_texts_by_key[key] for key in batch_keys]
+            batches.append((batch_keys, batch_texts))
+        return keys, batches
+
+    def __stack_vectors(self, keys: list[tuple[str, str]]) -> np.ndarray:
+        with self.__lock:
+            return np.stack([self.__vectors[key] for key in keys])
+
+    def __store_vectors(
+        self,
+        keys: list[tuple[str, str]],
+        texts: list[str],
+        vectors: list[list[float]],
+    ) -> None:
+        if len(vectors) != len(texts):
+            raise ValueError(
+                f"Provider returned {len(vectors)} embeddings for {len(texts)} texts"
+            )
+        normalized_vectors = self.normalize(
+            np.asarray(vectors, dtype=np.float32)
+        )
+        with self.__lock:
+            for key, vector in zip(keys, normalized_vectors):
+                self.__vectors[key] = vector
+            self.texts_embedded += len(keys)
+            if self.__connection is None:
+                return
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) "
+                "VALUES (?, ?, ?)",
+                [
+                    (model, text_hash, vector.tobytes())
+                    for (model, text_hash), vector in zip(
+                        keys, normalized_vectors
+                    )
+                ],
+            )
+            self.__connection.commit()
+
+    @staticmethod
+    def __log_provider_failure(
+        provider: EmbeddingProvider, error: Exception
+    ) -> None:
+        logger.warning(
+            f"Could not get embeddings using {provider.model_name}. Trying next provider. Error: {error}"
+        )
+
+    def __read_vector_from_disk(
+        self, key: tuple[str, str]
+    ) -> np.ndarray | None:
+        if self.__connection is None:
+            return None
+        row = self.__connection.execute(
+            "SELECT vector FROM embeddings WHERE model = ? AND text_hash = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def __create_connection(self) -> sqlite3.Connection:
+        assert self.file_path is not None
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, "
+            "text_hash TEXT NOT NULL, "
+            "vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+        connection.commit()
+        return connection
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @staticmethod
+    def normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return vectors / norms
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import logging
+import math
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+import requests
+from openai import OpenAI
+
+from forecasting_tools.util.misc import raise_for_status_with_additional_info
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingProvider(ABC):
+    """
+    Turns texts into embedding vectors for the EmbeddingIndex.
+
+    Providers that do their work on the local CPU set RUNS_LOCALLY so the
+    index runs them in a process pool (they must be picklable). Network
+    providers are run in a thread so they do not block the event loop.
+    """
+
+    RUNS_LOCALLY: bool = False
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """
+        Identifies the vectors the provider makes (used in cache keys).
+        Vectors are only compared with vectors of the same model name
+        """
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        pass
+
+
+class HuggingFaceEmbeddingProvider(EmbeddingProvider):
+    def __init__(
+        self, model_id: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ) -> None:
+        self.model_id = model_id
+
+    @property
+    def model_name(self) -> str:
+        return f"huggingface/{self.model_id}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        api_url = f"https://api-inference.huggingface.co/pipeline/feature-extraction/{self.model_id}"
+        api_key = os.getenv("HUGGINGFACE_API_KEY")
+        assert api_key is not None, "HUGGINGFACE_API_KEY is not set"
+        headers = {"Authorization": f"Bearer {api_key}"}
+        response = requests.post(
+            api_url,
+            headers=headers,
+            json={"inputs": texts, "options": {"wait_for_model": True}},
+        )
+        raise_for_status_with_additional_info(response)
+        return response.json()
+
+
+class OpenAiEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, model_id: str = "text-embedding-3-small") -> None:
+        self.model_id = model_id
+
+    @property
+    def model_name(self) -> str:
+        return f"openai/{self.model_id}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        # TODO: Track costs from this in llm cost tracker
+        api_key = os.getenv("OPENAI_API_KEY")
+        assert api_key is not None, "OPENAI_API_KEY is not set"
+        client = OpenAI(api_key=api_key)
+        response = client.embeddings.create(model=self.model_id, input=texts)
+        return [embedding.embedding for embedding in response.data]
+
+
+class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
+    """
+    Runs a sentence-transformers model on the local CPU. Needs the optional
+    `sentence-transformers` package. The default model is the same one the
+    HuggingFace API serves, so the same similarity thresholds apply.
+
+    Models are loaded once per process (see _load_sentence_transformer), so
+    providers sent to process pool workers do not reload the model per call.
+    """
+
+    RUNS_LOCALLY = True
+
+    def __init__(
+        self, model_id: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ) -> None:
+        self.model_id = model_id
+
+    @staticmethod
+    def is_installed() -> bool:
+        return importlib.util.find_spec("sentence_transformers") is not None
+
+    @property
+    def model_name(self) -> str:
+        return f"local/{self.model_id}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        model = _load_sentence_transformer(self.model_id)
+        embeddings = model.encode(texts, convert_to_numpy=True)
+        return embeddings.tolist()
+
+
+@functools.cache
+def _load_sentence_transformer(model_id: str) -> Any:
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(
+            "sentence-transformers is not installed. Install it with `pip install sentence-transformers`"
+        ) from e
+    logger.info(f"Loading sentence transformer {model_id}")
+    return SentenceTransformer(model_id, device="cpu")
+
+
+class HashedNgramEmbeddingProvider(EmbeddingProvider):
+    """
+    Offline, dependency free embeddings from hashed word unigrams, word
+    bigrams and character trigrams with sublinear term frequency (the TF part
+    of hashed TF-IDF). There is no corpus-wide IDF since the vectors need to
+    be the same no matter which batch a text is embedded in (so they can be
+    cached), so common stop words are dropped instead.
+
+    This catches reworded and reordered duplicates but not paraphrases with
+    different words, and similarities run lower than for neural embeddings,
+    so use a lower threshold (around 0.6-0.7) than for sentence transformers.
+    """
+
+    RUNS_LOCALLY = True
+    STOP_WORDS: frozenset[str] = frozenset(
+        "a an and are as at be by for from has in is it of on or that the "
+        "this to was were will with".split()
+    )
+
+    def __init__(self, dimensions: int = 2048) -> None:
+        if dimensions < 1:
+            raise ValueError("dimensions must be at least 1")
+        self.dimensions = dimensions
+
+    @property
+    def model_name(self) -> str:
+        return f"hashed-ngrams/{self.dimensions}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self.__embed_text(text).tolist() for text in texts]
+
+    def __embed_text(self, text: str) -> np.ndarray:
+        counts: dict[int, int] = {}
+        for feature in self.__get_features(text):
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest, "little") % self.dimensions
+            counts[bucket] = counts.get(bucket, 0) + 1
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for bucket, count in counts.items():
+            vector[bucket] = 1 + math.log(count)
+        return vector
+
+    def __get_features(self, text: str) -> list[str]:
+        words = [
+            word
+            for word in re.findall(r"\w+", text.lower())
+            if word not in self.STOP_WORDS
+        ]
+        features = [f"w:{word}" for word in words]
+        features += [
+            f"b:{first} {second}" for first, second in zip(words, words[1:])
+        ]
+        for word in words:
+            padded_word = f" {word} "
+            features += [
+                f"c:{padded_word[i:i + 3]}"
+                for i in range(len(padded_word) - 2)
+            ]
+        return features
+
+
+def get_default_embedding_providers() -> list[EmbeddingProvider]:
+    """
+    A local sentence transformer if installed, then the HuggingFace and
+    OpenAI APIs, then hashed n-grams so deduplication still works offline
+    """
+    providers: list[EmbeddingProvider] = []
+    if SentenceTransformerEmbeddingProvider.is_installed():
+        providers.append(SentenceTransformerEmbeddingProvider())
+    providers += [
+        HuggingFaceEmbeddingProvider(),
+        OpenAiEmbeddingProvider(),
+        HashedNgramEmbeddingProvider(),
+    ]
+    return providers
@@ -1,4 +1,5 @@
 import base64
+import functools
 import logging
 import math
 import re
@@ -40,7 +41,12 @@ class OpenAiUtils:
         return token_num
 
     @staticmethod
+    @functools.cache
     def __get_encoding_for_model(model: str) -> Encoding:
+        """
+        Memoized since tiktoken resolves the model name on every call
+        (and this logs a warning each time for unknown models)
+        """
         try:
             encoding = tiktoken.encoding_for_model(model)
         except KeyError:
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from litellm import model_cost
+from litellm.types.utils import Usage
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class CacheablePrompt(BaseModel):
+    """
+    A prompt split into a prefix that many calls share (e.g. the question and
+    research given to every prediction made from a research report) and a
+    suffix specific to the call. Providers only cache identical prefixes, so
+    anything that changes between calls (dates, instructions that vary, etc.)
+    belongs in the suffix.
+
+    OpenAI caches long shared prefixes automatically. Anthropic only caches
+    content marked with `cache_control`, which `to_message_content` adds.
+    """
+
+    prefix: str
+    suffix: str
+
+    @property
+    def full_prompt(self) -> str:
+        return f"{self.prefix}\n\n{self.suffix}"
+
+    def to_message_content(
+        self, mark_prefix_for_caching: bool
+    ) -> str | list[dict[str, Any]]:
+        if not mark_prefix_for_caching:
+            return self.full_prompt
+        return [
+            {
+                "type": "text",
+                "text": self.prefix,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": self.suffix},
+        ]
+
+    @staticmethod
+    def model_supports_cache_control(litellm_model: str) -> bool:
+        return "claude" in litellm_model or litellm_model.startswith(
+            "anthropic/"
+        )
+
+
+class PromptCacheAccounting:
+
+    @staticmethod
+    def get_cached_prompt_tokens(usage: Usage) -> int:
+        """
+        litellm reports tokens read from both OpenAI's and Anthropic's prompt
+        caches in prompt_tokens_details.cached_tokens
+        """
+        prompt_tokens_details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(prompt_tokens_details, "cached_tokens", None)
+        return cached_tokens or 0
+
+    @staticmethod
+    def calculate_cost_saved(litellm_model: str, cached_tokens: int) -> float:
+        """
+        What reading the cached tokens saved compared to sending them uncached.
+        The extra cost of writing to the cache is already in the call's cost.
+        """
+        if cached_tokens <= 0:
+            return 0
+        model_cost_data = model_cost.get(litellm_model)
+        if model_cost_data is None:
+            logger.debug(
+                f"Model {litellm_model} is not in model_cost, so prompt cache savings are not tracked"
+            )
+            return 0
+        input_cost_per_token = model_cost_data.get("input_cost_per_token") or 0
+        cache_read_cost_per_token = model_cost_data.get(
+            "cache_read_input_token_cost"
+        )
+        if cache_read_cost_per_token is None:
+            return 0
+        return max(
+            0,
+            (input_cost_per_token - cache_read_cost_per_token) * cached_tokens,
+        )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.util import file_manipulation
+
+logger = logging.getLogger(__name__)
+
+
+class LlmResponseCache:
+    """
+    A persistent, content addressed cache for text model responses.
+
+    Responses are stored in a SQLite file keyed on a hash of the call parameters
+    and the messages sent to the model. This lets benchmark reruns and restarted
+    forecasting runs reuse responses that were already paid for.
+
+    By default only deterministic calls (temperature == 0) are cached,
+    since caching sampled calls would make repeated predictions identical.
+    Entries can expire after `time_to_live_in_seconds` and the least recently
+    used entries are evicted once `max_entries` is exceeded.
+    """
+
+    DEFAULT_FILE_PATH = "logs/cache/llm_response_cache.sqlite"
+
+    def __init__(
+        self,
+        file_path: str = DEFAULT_FILE_PATH,
+        time_to_live_in_seconds: float | None = None,
+        max_entries: int | None = None,
+        only_cache_deterministic_calls: bool = True,
+    ) -> None:
+        if (
+            time_to_live_in_seconds is not None
+            and time_to_live_in_seconds <= 0
+        ):
+            raise ValueError("time_to_live_in_seconds must be greater than 0")
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.file_path = file_manipulation.get_absolute_path(file_path)
+        self.time_to_live_in_seconds = time_to_live_in_seconds
+        self.max_entries = max_entries
+        self.only_cache_deterministic_calls = only_cache_deterministic_calls
+        self.hits: int = 0
+        self.misses: int = 0
+        self.cost_saved: float = 0
+        self.__lock = threading.Lock()
+        self.__connection = self.__create_connection()
+
+    @property
+    def hit_rate(self) -> float:
+        total_lookups = self.hits + self.misses
+        if total_lookups == 0:
+            return 0
+        return self.hits / total_lookups
+
+    @staticmethod
+    def make_key(
+        litellm_kwargs: dict[str, Any], messages: list[dict[str, Any]]
+    ) -> str:
+        key_data = json.dumps(
+            {"litellm_kwargs": litellm_kwargs, "messages": messages},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def call_is_cacheable(self, litellm_kwargs: dict[str, Any]) -> bool:
+        if not self.only_cache_deterministic_calls:
+            return True
+        return litellm_kwargs.get("temperature") == 0
+
+    def get(self, key: str) -> TextTokenCostResponse | None:
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT response_json, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self.__entry_is_expired(row[1], now):
+                self.__connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                )
+                self.__connection.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.__connection.execute(
+                "UPDATE responses SET last_accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self.__connection.commit()
+            self.hits += 1
+
+        response = TextTokenCostResponse.model_validate_json(row[0])
+        self.cost_saved += response.cost
+        logger.debug(f"Cache hit for model response with key {key}")
+        return response
+
+    def set(self, key: str, response: TextTokenCostResponse) -> None:
+        now = time.time()
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response_json, created_at, last_accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response.model_dump_json(), now, now),
+            )
+            self.__evict_least_recently_used_entries()
+            self.__connection.commit()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses")
+            self.__connection.commit()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return row[0]
+
+    def __create_connection(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "response_json TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_accessed_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_accessed_at "
+            "ON responses (last_accessed_at)"
+        )
+        connection.commit()
+        return connection
+
+    def __entry_is_expired(self, created_at: float, now: float) -> bool:
+        if self.time_to_live_in_seconds is None:
+            return False
+        return now - created_at > self.time_to_live_in_seconds
+
+    def __evict_least_recently_used_entries(self) -> None:
+        if self.max_entries is None:
+            return
+        self.__connection.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_accessed_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
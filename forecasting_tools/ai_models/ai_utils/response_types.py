@@ -13,6 +13,7 @@ class TextTokenResponse(ModelResponse):
     completion_tokens_used: int
     total_tokens_used: int
     model: str
+    cached_prompt_tokens_used: int = 0
 
 
 class TextTokenCostResponse(TextTokenResponse):
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+
+
+class SampledResponseSplitter:
+    """
+    Splits one provider call that returned several choices (e.g. OpenAI's `n`)
+    into one response per choice, so each sample can be tracked as if it had
+    been its own call. Every choice is charged an equal share of the prompt,
+    and the completion cost is split by how many tokens each choice generated.
+    Choices without content (e.g. stopped by a content filter) are returned as
+    a ValueError in their place, and the cost is split between the other
+    choices, so the split costs always add up to the cost of the call.
+    """
+
+    @classmethod
+    def split_into_choice_responses(
+        cls,
+        answers: list[str | None],
+        completion_tokens_per_answer: list[int],
+        prompt_tokens: int,
+        cached_prompt_tokens: int,
+        prompt_cost: float,
+        completion_cost: float,
+        model: str,
+    ) -> list[TextTokenCostResponse | ValueError]:
+        if len(answers) == 0:
+            raise ValueError("A call must return at least one choice")
+        if len(answers) != len(completion_tokens_per_answer):
+            raise ValueError("Each answer must have a completion token count")
+        answered_indices = [
+            i for i, answer in enumerate(answers) if answer is not None
+        ]
+        number_of_answers = len(answered_indices)
+        if number_of_answers == 0:
+            raise ValueError("None of the choices returned any content")
+        prompt_tokens_per_answer = cls.__split_evenly(
+            prompt_tokens, number_of_answers
+        )
+        cached_prompt_tokens_per_answer = cls.__split_evenly(
+            cached_prompt_tokens, number_of_answers
+        )
+        total_completion_tokens = sum(
+            completion_tokens_per_answer[i] for i in answered_indices
+        )
+
+        responses: list[TextTokenCostResponse | ValueError] = []
+        answer_number = 0
+        for i, answer in enumerate(answers):
+            if answer is None:
+                responses.append(
+                    ValueError(f"Choice {i} of the call returned no content")
+                )
+                continue
+            completion_tokens = completion_tokens_per_answer[i]
+            share_of_completion = (
+                completion_tokens / total_completion_tokens
+                if total_completion_tokens > 0
+                else 1 / number_of_answers
+            )
+            cost = (
+                prompt_cost / number_of_answers
+                + completion_cost * share_of_completion
+            )
+            responses.append(
+                TextTokenCostResponse(
+                    data=answer,
+                    prompt_tokens_used=prompt_tokens_per_answer[answer_number],
+                    completion_tokens_used=completion_tokens,
+                    total_tokens_used=prompt_tokens_per_answer[answer_number]
+                    + completion_tokens,
+                    model=model,
+                    cost=cost,
+                    cached_prompt_tokens_used=cached_prompt_tokens_per_answer[
+                        answer_number
+                    ],
+                )
+            )
+            answer_number += 1
+        return responses
+
+    @staticmethod
+    def __split_evenly(total: int, number_of_parts: int) -> list[int]:
+        base_amount, remainder = divmod(total, number_of_parts)
+        return [
+            base_amount + (1 if i < remainder else 0)
+            for i in range(number_of_parts)
+        ]
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from forecasting_tools.util import file_manipulation
+
+if TYPE_CHECKING:
+    from forecasting_tools.ai_models.exa_searcher import SearchInput
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCache:
+    """
+    A persistent cache of Exa search results keyed on the canonicalized
+    SearchInput and the searcher's result and content settings. Forecasters,
+    research reports and deduplication checks for the same question often run
+    the same searches, and each uncached search is crawled and billed again.
+
+    Results go stale as news comes out, so entries are only used while they
+    are younger than `freshness_window_in_seconds` (a call can ask for a
+    shorter window). Searches bounded by a publish date bypass the cache
+    unless `cache_date_bounded_searches` is set, since articles from the
+    bounded period keep being indexed after the search is first run.
+    """
+
+    DEFAULT_FILE_PATH = "logs/cache/search_result_cache.sqlite"
+    DEFAULT_FRESHNESS_WINDOW_IN_SECONDS = 6 * 60 * 60
+
+    def __init__(
+        self,
+        file_path: str = DEFAULT_FILE_PATH,
+        freshness_window_in_seconds: float = DEFAULT_FRESHNESS_WINDOW_IN_SECONDS,
+        max_entries: int | None = None,
+        cache_date_bounded_searches: bool = False,
+    ) -> None:
+        if freshness_window_in_seconds <= 0:
+            raise ValueError(
+                "freshness_window_in_seconds must be greater than 0"
+            )
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.file_path = file_manipulation.get_absolute_path(file_path)
+        self.freshness_window_in_seconds = freshness_window_in_seconds
+        self.max_entries = max_entries
+        self.cache_date_bounded_searches = cache_date_bounded_searches
+        self.hits: int = 0
+        self.misses: int = 0
+        self.cost_saved: float = 0
+        self.__lock = threading.Lock()
+        self.__connection = self.__create_connection()
+
+    @property
+    def hit_rate(self) -> float:
+        total_lookups = self.hits + self.misses
+        if total_lookups == 0:
+            return 0
+        return self.hits / total_lookups
+
+    @classmethod
+    def make_key(
+        cls, search: SearchInput, search_settings: dict[str, Any]
+    ) -> str:
+        """
+        Queries are compared ignoring case and extra whitespace, domains
+        ignoring case and order, and a missing highlight query is the same as
+        highlighting with the search query (which is what Exa is sent)
+        """
+        web_search_query = cls.__canonicalize_text(search.web_search_query)
+        highlight_query = (
+            cls.__canonicalize_text(search.highlight_query)
+            if search.highlight_query
+            else web_search_query
+        )
+        key_data = json.dumps(
+            {
+                "web_search_query": web_search_query,
+                "highlight_query": highlight_query,
+                "include_domains": cls.__canonicalize_domains(
+                    search.include_domains
+                ),
+                "exclude_domains": cls.__canonicalize_domains(
+                    search.exclude_domains
+                ),
+                "include_text": (
+                    search.include_text.strip()
+                    if search.include_text
+                    else None
+                ),
+                "start_published_date": search.start_published_date,
+                "end_published_date": search.end_published_date,
+                "search_settings": search_settings,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def search_is_cacheable(self, search: SearchInput) -> bool:
+        if self.cache_date_bounded_searches:
+            return True
+        return (
+            search.start_published_date is None
+            and search.end_published_date is None
+        )
+
+    def get(
+        self,
+        key: str,
+        max_age_in_seconds: float | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Returns the sources as dumped by ExaSource.model_dump(mode="json").
+        max_age_in_seconds can narrow (but not widen) the freshness window
+        """
+        freshness_window = self.freshness_window_in_seconds
+        if max_age_in_seconds is not None:
+            freshness_window = min(freshness_window, max_age_in_seconds)
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT sources_json, created_at FROM search_results WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[1] > freshness_window:
+                self.misses += 1
+                return None
+            self.__connection.execute(
+                "UPDATE search_results SET last_accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self.__connection.commit()
+            self.hits += 1
+
+        logger.debug(f"Cache hit for search results with key {key}")
+        return json.loads(row[0])
+
+    def set(self, key: str, sources: list[dict[str, Any]]) -> None:
+        now = time.time()
+        sources_json = json.dumps(sources)
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO search_results "
+                "(key, sources_json, created_at, last_accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sources_json, now, now),
+            )
+            self.__delete_stale_and_least_recently_used_entries(now)
+            self.__connection.commit()
+
+    def record_cost_saved(self, cost: float) -> None:
+        with self.__lock:
+            self.cost_saved += cost
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__connection.execute("DELETE FROM search_results")
+            self.__connection.commit()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT COUNT(*) FROM search_results"
+            ).fetchone()
+        return row[0]
+
+    def __create_connection(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS search_results ("
+            "key TEXT PRIMARY KEY, "
+            "sources_json TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "last_accessed_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_results_last_accessed_at "
+            "ON search_results (last_accessed_at)"
+        )
+        connection.commit()
+        return connection
+
+    def __delete_stale_and_least_recently_used_entries(
+        self, now: float
+    ) -> None:
+        self.__connection.execute(
+            "DELETE FROM search_results WHERE created_at < ?",
+            (now - self.freshness_window_in_seconds,),
+        )
+        if self.max_entries is None:
+            return
+        self.__connection.execute(
+            "DELETE FROM search_results WHERE key IN ("
+            "SELECT key FROM search_results ORDER BY last_accessed_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    @staticmethod
+    def __canonicalize_text(text: str) -> str:
+        return " ".join(text.split()).casefold()
+
+    @staticmethod
+    def __canonicalize_domains(domains: list[str]) -> list[str]:
+        return sorted({domain.strip().lower() for domain in domains})
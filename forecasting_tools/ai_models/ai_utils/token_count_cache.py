@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCountCache:
+    """
+    LRU cache of token counts keyed by model and a hash of the prompt, so the
+    same research prompt (which is often sent to several models or several
+    times for multiple predictions) is only tokenized once per model.
+    Prompts are hashed rather than stored so the cache stays small.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__counts: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get_or_count(
+        self, model: str, prompt: Any, count_tokens: Callable[[], int]
+    ) -> int:
+        key = (model, self.hash_prompt(prompt))
+        with self.__lock:
+            token_count = self.__counts.get(key)
+            if token_count is not None:
+                self.__counts.move_to_end(key)
+                self.hits += 1
+                return token_count
+            self.misses += 1
+        token_count = count_tokens()
+        with self.__lock:
+            self.__counts[key] = token_count
+            self.__counts.move_to_end(key)
+            while len(self.__counts) > self.max_entries:
+                self.__counts.popitem(last=False)
+        return token_count
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__counts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__counts)
+
+    @staticmethod
+    def hash_prompt(prompt: Any) -> str:
+        text = prompt if isinstance(prompt, str) else repr(prompt)
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).hexdigest()
+
+    @staticmethod
+    def estimate_tokens_from_characters(
+        number_of_characters: int, characters_per_token: float
+    ) -> int:
+        """
+        O(1) token estimate for prompts too large to be worth tokenizing
+        exactly. English text averages about 4 characters per token for
+        current OpenAI and Anthropic tokenizers, so a smaller
+        characters_per_token over-estimates (which is the safe direction
+        for rate limiting)
+        """
+        if characters_per_token <= 0:
+            raise ValueError("characters_per_token must be greater than 0")
+        return int(number_of_characters / characters_per_token) + 1
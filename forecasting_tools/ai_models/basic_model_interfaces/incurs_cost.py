@@ -26,13 +26,27 @@ class IncursCost(ABC):
     ) -> Callable[..., Coroutine[Any, Any, T]]:
         @functools.wraps(func)
         async def wrapper(self: IncursCost, *args, **kwargs) -> T:
-            MonetaryCostManager.raise_error_if_limit_would_be_reached()
-
-            direct_call_response = await func(self, *args, **kwargs)
-
-            await self._track_cost_in_manager_using_model_response(
-                direct_call_response
+            estimated_cost = (
+                self._estimate_cost_to_reserve(*args, **kwargs)
+                if MonetaryCostManager.has_active_hard_limit()
+                else 0
             )
+            with await MonetaryCostManager.reserve_when_available(
+                estimated_cost
+            ):
+                direct_call_response = await func(self, *args, **kwargs)
+
+                await self._track_cost_in_manager_using_model_response(
+                    direct_call_response
+                )
             return direct_call_response
 
         return wrapper
+
+    def _estimate_cost_to_reserve(self, *args, **kwargs) -> float:
+        """
+        Estimated cost of a call with these arguments, reserved in the
+        MonetaryCostManager while the call runs. Only called when a hard limit
+        is active. Models that cannot estimate their cost reserve nothing.
+        """
+        return 0
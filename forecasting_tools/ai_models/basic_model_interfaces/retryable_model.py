@@ -5,11 +5,19 @@ from abc import ABC
 from typing import Any, Callable, Coroutine, TypeVar
 
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
+from forecasting_tools.ai_models.resource_managers.adaptive_retry_controller import (
+    AdaptiveRetryController,
+)
 
 logger = logging.getLogger(__name__)
 import functools
 
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+)
 
 T = TypeVar("T")
 
@@ -40,6 +48,24 @@ class RetryableModel(AiModel, ABC):
             )
         self.__allowed_tries = value
 
+    @property
+    def retry_controller_name(self) -> str:
+        """
+        Models with the same name share one AdaptiveRetryController (and so one
+        concurrency window and one set of retry metrics). Defaults to the
+        model's rate limiter name (provider, model and API key) if it has one
+        """
+        rate_limiter_name = getattr(self, "rate_limiter_name", None)
+        if isinstance(rate_limiter_name, str):
+            return rate_limiter_name
+        return type(self).__name__
+
+    @property
+    def retry_controller(self) -> AdaptiveRetryController:
+        return AdaptiveRetryController.get_or_create(
+            self.retry_controller_name
+        )
+
     @staticmethod
     def _retry_according_to_model_allowed_tries(
         func: Callable[..., Coroutine[Any, Any, T]]
@@ -48,17 +74,27 @@ class RetryableModel(AiModel, ABC):
         async def wrapper_with_access_to_self_variable(
             self: RetryableModel, *args, **kwargs
         ) -> T:
+            controller = self.retry_controller
+
+            def wait_according_to_error(retry_state: RetryCallState) -> float:
+                assert retry_state.outcome is not None
+                exception = retry_state.outcome.exception()
+                assert exception is not None
+                return controller.get_seconds_to_wait_before_retry(
+                    exception, retry_state.attempt_number
+                )
+
             @retry(
-                wait=wait_random_exponential(
-                    exp_base=2, multiplier=10, min=5, max=60
-                ),  # Waits random number between 0 and exp_base^current_attempt * multiplier (with min and max override as needed)
+                wait=wait_according_to_error,
+                retry=retry_if_exception(controller.should_retry),
                 reraise=True,
                 stop=stop_after_attempt(self.allowed_tries),
             )
             async def wrapper_with_action(
                 self: RetryableModel, *args, **kwargs
             ) -> T:
-                result = await func(self, *args, **kwargs)
+                async with controller.attempt():
+                    result = await func(self, *args, **kwargs)
                 return result
 
             return await wrapper_with_action(self, *args, **kwargs)
@@ -9,6 +9,9 @@ logger = logging.getLogger(__name__)
 import functools
 from typing import Any, Callable, Coroutine, TypeVar
 
+from forecasting_tools.ai_models.ai_utils.token_count_cache import (
+    TokenCountCache,
+)
 from forecasting_tools.ai_models.basic_model_interfaces.tokens_are_calculatable import (
     TokensAreCalculatable,
 )
@@ -23,6 +26,9 @@ class TokenLimitedModel(AiModel, TokensAreCalculatable, ABC):
     TOKENS_PER_PERIOD_LIMIT: int = NotImplemented
     TOKEN_PERIOD_IN_SECONDS: int = NotImplemented
     _token_limiter: RefreshingBucketRateLimiter = NotImplemented
+    _token_count_cache: TokenCountCache = TokenCountCache()
+    APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT: int | None = 200_000
+    APPROXIMATE_CHARACTERS_PER_TOKEN: float = 3
 
     def __init_subclass__(cls: type[TokenLimitedModel], **kwargs) -> None:
         super().__init_subclass__(**kwargs)
@@ -52,7 +58,9 @@ class TokenLimitedModel(AiModel, TokensAreCalculatable, ABC):
     ) -> Callable[..., Coroutine[Any, Any, T]]:
         @functools.wraps(func)
         async def wrapper(self: TokenLimitedModel, *args, **kwargs) -> T:
-            tokens_of_prompt = self.input_to_tokens(*args, **kwargs)
+            tokens_of_prompt = self._count_tokens_for_token_limit(
+                *args, **kwargs
+            )
             await self._token_limiter.wait_till_able_to_acquire_resources(
                 tokens_of_prompt
             )
@@ -61,6 +69,38 @@ class TokenLimitedModel(AiModel, TokensAreCalculatable, ABC):
 
         return wrapper
 
+    def _count_tokens_for_token_limit(self, *args, **kwargs) -> int:
+        """
+        Token counts are cached by prompt hash. Text prompts longer than
+        APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT are estimated from their
+        length instead of tokenized, since exact counts of very large research
+        prompts are slow and the limiter only needs a conservative amount
+        """
+        character_count = self.__get_character_count_of_text_input(
+            *args, **kwargs
+        )
+        if (
+            self.APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT is not None
+            and character_count is not None
+            and character_count > self.APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT
+        ):
+            return TokenCountCache.estimate_tokens_from_characters(
+                character_count, self.APPROXIMATE_CHARACTERS_PER_TOKEN
+            )
+        model_name = getattr(self, "MODEL_NAME", None)
+        cache_key = f"{type(self).__qualname__}/{model_name}"
+        prompt = args[0] if len(args) == 1 and not kwargs else (args, kwargs)
+        return self._token_count_cache.get_or_count(
+            cache_key, prompt, lambda: self.input_to_tokens(*args, **kwargs)
+        )
+
+    @staticmethod
+    def __get_character_count_of_text_input(*args, **kwargs) -> int | None:
+        inputs = [*args, *kwargs.values()]
+        if not inputs or not all(isinstance(input, str) for input in inputs):
+            return None
+        return sum(len(input) for input in inputs)
+
     @classmethod
     def _make_token_limiter_have_large_rate(cls) -> None:
         """
@@ -1,3 +1,4 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -14,8 +15,11 @@ from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import
     MonetaryCostManager,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TokensIncurCost(TokensAreCalculatable, IncursCost, ABC):
+    COMPLETION_TOKENS_TO_RESERVE: int = 2000
 
     @abstractmethod
     def calculate_cost_from_tokens(
@@ -27,6 +31,22 @@ class TokensIncurCost(TokensAreCalculatable, IncursCost, ABC):
     def input_to_tokens(self, *args, **kwargs) -> int:
         pass
 
+    def _estimate_cost_to_reserve(self, *args, **kwargs) -> float:
+        try:
+            prompt_tokens = self.input_to_tokens(*args, **kwargs)
+            return self.calculate_cost_from_tokens(
+                prompt_tkns=prompt_tokens,
+                completion_tkns=self._get_completion_tokens_to_reserve(),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not estimate cost to reserve, so reserving nothing: {e}"
+            )
+            return 0
+
+    def _get_completion_tokens_to_reserve(self) -> int:
+        return self.COMPLETION_TOKENS_TO_RESERVE
+
     async def _track_cost_in_manager_using_model_response(
         self, response_from_direct_call: Any
     ) -> None:
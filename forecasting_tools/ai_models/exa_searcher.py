@@ -4,9 +4,11 @@ import logging
 import os
 from datetime import datetime
 
-import aiohttp
 from pydantic import BaseModel, Field
 
+from forecasting_tools.ai_models.ai_utils.search_result_cache import (
+    SearchResultCache,
+)
 from forecasting_tools.ai_models.basic_model_interfaces.incurs_cost import (
     IncursCost,
 )
@@ -19,9 +21,18 @@ from forecasting_tools.ai_models.basic_model_interfaces.retryable_model import (
 from forecasting_tools.ai_models.basic_model_interfaces.time_limited_model import (
     TimeLimitedModel,
 )
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
+from forecasting_tools.ai_models.resource_managers.rate_limiter_registry import (
+    RateLimiterRegistry,
+)
+from forecasting_tools.ai_models.resource_managers.request_coalescer import (
+    RequestCoalescer,
+)
 from forecasting_tools.util.jsonable import Jsonable
 
 logger = logging.getLogger(__name__)
@@ -96,9 +107,29 @@ class ExaSearcher(
         include_text: bool = False,
         include_highlights: bool = True,
         num_results: int = 5,
+        session_pool: HttpSessionPool | None = None,
+        search_cache: SearchResultCache | None = None,
+        max_cached_result_age_in_seconds: float | None = None,
+        coalesce_identical_searches: bool = True,
         **kwargs,
     ) -> None:
+        """
+        A `search_cache` can be given to reuse the results of identical
+        searches. Cache hits are not crawled or billed, and what they would
+        have cost is added to the MonetaryCostManager's `cost_saved`.
+        `max_cached_result_age_in_seconds` narrows the cache's freshness
+        window for this searcher.
+        With `coalesce_identical_searches`, concurrent identical searches
+        share one request (see RequestCoalescer). Searches that join another's
+        request add what it cost to their MonetaryCostManager's `cost_saved`.
+        """
         super().__init__(*args, **kwargs)
+        self.search_cache = search_cache
+        self.max_cached_result_age_in_seconds = (
+            max_cached_result_age_in_seconds
+        )
+        self.coalesce_identical_searches = coalesce_identical_searches
+        self.session_pool = session_pool or HttpSessionPool.get_shared_pool()
         self.include_text = include_text
         self.include_highlights = include_highlights
         self.num_highlights_per_url = 10
@@ -136,9 +167,82 @@ class ExaSearcher(
             )
         else:
             search_strategy = search_query_or_strategy
-        return await self.__retryable_timed_cost_request_limited_invoke(
-            search_strategy
+
+        if not self.coalesce_identical_searches:
+            return await self.__search_using_cache(search_strategy)
+        sources = await RequestCoalescer.run(
+            "exa/" + self._make_search_key(search_strategy),
+            lambda: self.__search_using_cache(search_strategy),
+            lambda shared_sources: MonetaryCostManager.increase_cost_saved_in_parent_managers(
+                self._calculate_cost_for_request(shared_sources)
+            ),
         )
+        return [
+            source.model_copy(
+                update={"original_query": search_strategy.web_search_query}
+            )
+            for source in sources
+        ]
+
+    async def __search_using_cache(
+        self, search: SearchInput
+    ) -> list[ExaSource]:
+        cache_key = self._get_search_cache_key(search)
+        if cache_key is not None:
+            assert self.search_cache is not None
+            cached_sources = self.search_cache.get(
+                cache_key, self.max_cached_result_age_in_seconds
+            )
+            if cached_sources is not None:
+                return self.__use_cached_sources(cached_sources, search)
+
+        sources = await self.__retryable_timed_cost_request_limited_invoke(
+            search
+        )
+        if cache_key is not None:
+            assert self.search_cache is not None
+            self.search_cache.set(
+                cache_key,
+                [source.model_dump(mode="json") for source in sources],
+            )
+        return sources
+
+    def _make_search_key(self, search: SearchInput) -> str:
+        return SearchResultCache.make_key(
+            search,
+            {
+                "num_results": self.num_results,
+                "include_text": self.include_text,
+                "include_highlights": self.include_highlights,
+                "num_highlights_per_url": self.num_highlights_per_url,
+                "num_sentences_per_highlight": self.num_sentences_per_highlight,
+            },
+        )
+
+    def _get_search_cache_key(self, search: SearchInput) -> str | None:
+        if self.search_cache is None:
+            return None
+        if not self.search_cache.search_is_cacheable(search):
+            return None
+        return self._make_search_key(search)
+
+    def __use_cached_sources(
+        self, cached_sources: list[dict], search: SearchInput
+    ) -> list[ExaSource]:
+        sources = [
+            ExaSource.model_validate(
+                {**source, "original_query": search.web_search_query}
+            )
+            for source in cached_sources
+        ]
+        cost_saved = self._calculate_cost_for_request(sources)
+        assert self.search_cache is not None
+        self.search_cache.record_cost_saved(cost_saved)
+        MonetaryCostManager.increase_cost_saved_in_parent_managers(cost_saved)
+        logger.debug(
+            f"Using {len(sources)} cached sources for search: {search.web_search_query}"
+        )
+        return sources
 
     @RetryableModel._retry_according_to_model_allowed_tries
     @RequestLimitedModel._wait_till_request_capacity_available
@@ -157,7 +261,8 @@ class ExaSearcher(
     ) -> list[ExaSource]:
         self._everything_special_to_call_before_direct_call()
         url, headers, payload = self._prepare_request_data(search_query)
-        response_data = await self._make_api_request(url, headers, payload)
+        async with RateLimiterRegistry.limit(self.rate_limiter_name):
+            response_data = await self._make_api_request(url, headers, payload)
         exa_sources = self._process_response(response_data, search_query)
         self._log_results(exa_sources)
         return exa_sources
@@ -224,6 +329,12 @@ class ExaSearcher(
             end_published_date=None,
         )
 
+    @property
+    def rate_limiter_name(self) -> str:
+        return RateLimiterRegistry.make_name(
+            "exa", api_key=os.getenv("EXA_API_KEY")
+        )
+
     def _get_api_key(self) -> str:
         api_key = os.getenv("EXA_API_KEY")
         assert (
@@ -234,13 +345,13 @@ class ExaSearcher(
     async def _make_api_request(
         self, url: str, headers: dict, payload: dict
     ) -> dict:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, headers=headers
-            ) as response:
-                response.raise_for_status()
-                result: dict = await response.json()
-                return result
+        session = await self.session_pool.get_session()
+        async with session.post(
+            url, json=payload, headers=headers
+        ) as response:
+            response.raise_for_status()
+            result: dict = await response.json()
+            return result
 
     def _process_response(
         self, response_data: dict, search_query: SearchInput
@@ -291,6 +402,18 @@ class ExaSearcher(
         )
         return cost
 
+    def _estimate_cost_to_reserve(self, search: SearchInput) -> float:
+        cost = self.COST_PER_REQUEST
+        cost += (
+            self.COST_PER_TEXT * self.num_results if self.include_text else 0
+        )
+        cost += (
+            self.COST_PER_HIGHLIGHT * self.num_results
+            if self.include_highlights
+            else 0
+        )
+        return cost
+
     async def _track_cost_in_manager_using_model_response(
         self,
         response_from_direct_call: list[ExaSource],
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 import os
@@ -16,9 +17,19 @@ from forecasting_tools.ai_models.ai_utils.openai_utils import (
     OpenAiUtils,
     VisionMessageData,
 )
+from forecasting_tools.ai_models.ai_utils.prompt_caching import (
+    CacheablePrompt,
+    PromptCacheAccounting,
+)
+from forecasting_tools.ai_models.ai_utils.response_cache import (
+    LlmResponseCache,
+)
 from forecasting_tools.ai_models.ai_utils.response_types import (
     TextTokenCostResponse,
 )
+from forecasting_tools.ai_models.ai_utils.sampled_responses import (
+    SampledResponseSplitter,
+)
 from forecasting_tools.ai_models.model_interfaces.outputs_text import (
     OutputsText,
 )
@@ -31,9 +42,17 @@ from forecasting_tools.ai_models.model_interfaces.tokens_incur_cost import (
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
+from forecasting_tools.ai_models.resource_managers.rate_limiter_registry import (
+    RateLimiterRegistry,
+)
+from forecasting_tools.ai_models.resource_managers.request_coalescer import (
+    RequestCoalescer,
+)
 
 logger = logging.getLogger(__name__)
-ModelInputType = str | VisionMessageData | list[dict[str, str]]
+ModelInputType = (
+    str | VisionMessageData | list[dict[str, str]] | CacheablePrompt
+)
 
 
 class ModelTracker:
@@ -62,11 +81,33 @@ class GeneralLlm(
         allowed_tries: int = RetryableModel._DEFAULT_ALLOWED_TRIES,
         temperature: float | int | None = 0,
         timeout: float | int | None = 60,
+        response_cache: LlmResponseCache | None = None,
+        coalesce_identical_calls: bool = True,
+        coalesce_sampled_calls: bool = False,
+        use_prompt_caching: bool = True,
         **kwargs,
     ) -> None:
         """
         Pass in litellm kwargs as needed. Below are the available kwargs as of Feb 13 2025.
 
+        A `response_cache` can be given to reuse responses from previous identical calls.
+        Cache hits skip the call to the provider and add no cost to the MonetaryCostManager (their original cost is added to its `cost_saved`).
+
+        Calls wait on the limiter named `self.rate_limiter_name` in the RateLimiterRegistry (if one is configured),
+        which is shared with every other GeneralLlm using the same model and API key.
+
+        With `coalesce_identical_calls`, concurrent calls with the same parameters and prompt share one provider call (see RequestCoalescer). Calls that join another's provider call add what it cost to their MonetaryCostManager's `cost_saved`.
+        Calls with a temperature above 0 are only coalesced if `coalesce_sampled_calls` is set, since they are usually made to get different samples.
+
+        Pass a `CacheablePrompt` to let the provider cache a prefix shared by many calls. With `use_prompt_caching`,
+        the prefix is marked with Anthropic's `cache_control` (OpenAI caches shared prefixes automatically).
+        Prompt tokens read from the provider's cache are added to the MonetaryCostManager's `cached_prompt_tokens`,
+        and what they saved to its `cost_saved`.
+
+        `invoke_many` gets several samples for one prompt. For models that support `n` it makes one call that returns
+        every sample (so the prompt is only paid for and rate limited once), and otherwise makes one call per sample.
+        Samples that fail are returned as their exception so the other samples are kept.
+
         # Optional OpenAI params: see https://platform.openai.com/docs/api-reference/chat/create
         functions: list | None = None,
         function_call: str | None = None,
@@ -106,6 +147,10 @@ class GeneralLlm(
         """
         super().__init__(allowed_tries=allowed_tries)
         self.model = model
+        self.response_cache = response_cache
+        self.coalesce_identical_calls = coalesce_identical_calls
+        self.coalesce_sampled_calls = coalesce_sampled_calls
+        self.use_prompt_caching = use_prompt_caching
 
         metaculus_prefix = "metaculus/"
         self._use_metaculus_proxy = model.startswith(metaculus_prefix)
@@ -151,6 +196,9 @@ class GeneralLlm(
                 f"The following parameters are not valid for litellm's acompletion: {invalid_params}"
             )
 
+        self.rate_limiter_name = RateLimiterRegistry.make_name(
+            "llm", self.model, api_key=self.litellm_kwargs.get("api_key")
+        )
         self._give_cost_tracking_warning_if_needed()
 
     def _give_cost_tracking_warning_if_needed(self) -> None:
@@ -174,32 +222,171 @@ class GeneralLlm(
         model_tracker.gave_cost_tracking_warning = True
 
     async def invoke(self, prompt: ModelInputType) -> str:
-        response: TextTokenCostResponse = (
-            await self._invoke_with_request_cost_time_and_token_limits_and_retry(
-                prompt
+        coalescing_key = self._get_coalescing_key(prompt)
+        if coalescing_key is None:
+            response: TextTokenCostResponse = (
+                await self._invoke_with_request_cost_time_and_token_limits_and_retry(
+                    prompt
+                )
+            )
+        else:
+            response = await RequestCoalescer.run(
+                coalescing_key,
+                lambda: self._invoke_with_request_cost_time_and_token_limits_and_retry(
+                    prompt
+                ),
+                lambda shared_response: MonetaryCostManager.increase_cost_saved_in_parent_managers(
+                    shared_response.cost
+                ),
             )
-        )
         return response.data
 
+    async def invoke_many(
+        self, prompt: ModelInputType, number_of_responses: int
+    ) -> list[TextTokenCostResponse | BaseException]:
+        """
+        Returns `number_of_responses` samples for the prompt, with the
+        exception in place of each sample that failed. The cost of a shared
+        call is split between the samples (see SampledResponseSplitter), and
+        if the shared call fails every sample gets its exception.
+        """
+        if number_of_responses < 1:
+            raise ValueError("Must request at least one response")
+        if number_of_responses == 1 or not self.supports_multiple_responses:
+            return list(
+                await asyncio.gather(
+                    *[
+                        self._invoke_with_request_cost_time_and_token_limits_and_retry(
+                            prompt
+                        )
+                        for _ in range(number_of_responses)
+                    ],
+                    return_exceptions=True,
+                )
+            )
+        try:
+            return await self._invoke_many_with_request_cost_time_and_token_limits_and_retry(
+                prompt, number_of_responses
+            )
+        except Exception as e:
+            logger.warning(
+                f"Call for {number_of_responses} samples failed: {e}"
+            )
+            return [e] * number_of_responses
+
+    @property
+    def supports_multiple_responses(self) -> bool:
+        supported_params = litellm.get_supported_openai_params(
+            model=self._litellm_model
+        )
+        return supported_params is not None and "n" in supported_params
+
+    def _get_coalescing_key(self, prompt: ModelInputType) -> str | None:
+        if not self.coalesce_identical_calls:
+            return None
+        is_sampled_call = self.litellm_kwargs.get("temperature") != 0
+        if is_sampled_call and not self.coalesce_sampled_calls:
+            return None
+        return "llm/" + LlmResponseCache.make_key(
+            self.litellm_kwargs, self.model_input_to_message(prompt)
+        )
+
     @RetryableModel._retry_according_to_model_allowed_tries
     async def _invoke_with_request_cost_time_and_token_limits_and_retry(
-        self, *args, **kwargs
+        self, prompt: ModelInputType
     ) -> Any:
-        logger.debug(f"Invoking model with args: {args} and kwargs: {kwargs}")
-        MonetaryCostManager.raise_error_if_limit_would_be_reached()
-        direct_call_response = await self._mockable_direct_call_to_model(
-            *args, **kwargs
-        )
-        response_to_log = (
-            direct_call_response[:1000]
-            if isinstance(direct_call_response, str)
-            else direct_call_response
+        logger.debug(f"Invoking model with prompt: {prompt}")
+        cache_key = self._get_response_cache_key(prompt)
+        if cache_key is not None:
+            assert self.response_cache is not None
+            cached_response = self.response_cache.get(cache_key)
+            if cached_response is not None:
+                MonetaryCostManager.increase_cost_saved_in_parent_managers(
+                    cached_response.cost
+                )
+                return cached_response.model_copy(update={"cost": 0})
+
+        estimated_cost = (
+            self._estimate_cost_to_reserve(prompt)
+            if MonetaryCostManager.has_active_hard_limit()
+            else 0
         )
-        logger.debug(f"Model responded with: {response_to_log}...")
-        cost = direct_call_response.cost
-        MonetaryCostManager.increase_current_usage_in_parent_managers(cost)
+        with await MonetaryCostManager.reserve_when_available(
+            estimated_cost
+        ) as cost_reservation:
+            async with RateLimiterRegistry.limit(self.rate_limiter_name):
+                direct_call_response = (
+                    await self._mockable_direct_call_to_model(prompt)
+                )
+            response_to_log = (
+                direct_call_response[:1000]
+                if isinstance(direct_call_response, str)
+                else direct_call_response
+            )
+            logger.debug(f"Model responded with: {response_to_log}...")
+            cost_reservation.settle(direct_call_response.cost)
+        self._track_prompt_cache_use(direct_call_response)
+        if cache_key is not None:
+            assert self.response_cache is not None
+            self.response_cache.set(cache_key, direct_call_response)
         return direct_call_response
 
+    @RetryableModel._retry_according_to_model_allowed_tries
+    async def _invoke_many_with_request_cost_time_and_token_limits_and_retry(
+        self, prompt: ModelInputType, number_of_responses: int
+    ) -> list[TextTokenCostResponse | ValueError]:
+        logger.debug(
+            f"Invoking model for {number_of_responses} responses with prompt: {prompt}"
+        )
+        estimated_cost = (
+            self._estimate_cost_to_reserve(prompt) * number_of_responses
+            if MonetaryCostManager.has_active_hard_limit()
+            else 0
+        )
+        with await MonetaryCostManager.reserve_when_available(
+            estimated_cost
+        ) as cost_reservation:
+            async with RateLimiterRegistry.limit(self.rate_limiter_name):
+                responses = await self._mockable_direct_call_to_model_for_many(
+                    prompt, number_of_responses
+                )
+            answered_responses = [
+                response
+                for response in responses
+                if isinstance(response, TextTokenCostResponse)
+            ]
+            cost_reservation.settle(
+                sum(response.cost for response in answered_responses)
+            )
+        for response in answered_responses:
+            self._track_prompt_cache_use(response)
+        return responses
+
+    def _track_prompt_cache_use(self, response: TextTokenCostResponse) -> None:
+        cached_tokens = response.cached_prompt_tokens_used
+        if cached_tokens == 0:
+            return
+        MonetaryCostManager.increase_cached_prompt_tokens_in_parent_managers(
+            cached_tokens
+        )
+        MonetaryCostManager.increase_cost_saved_in_parent_managers(
+            PromptCacheAccounting.calculate_cost_saved(
+                self._litellm_model, cached_tokens
+            )
+        )
+        logger.debug(
+            f"Read {cached_tokens} of {response.prompt_tokens_used} prompt tokens from the provider's prompt cache"
+        )
+
+    def _get_response_cache_key(self, prompt: ModelInputType) -> str | None:
+        if self.response_cache is None:
+            return None
+        if not self.response_cache.call_is_cacheable(self.litellm_kwargs):
+            return None
+        return self.response_cache.make_key(
+            self.litellm_kwargs, self.model_input_to_message(prompt)
+        )
+
     async def _mockable_direct_call_to_model(
         self, prompt: ModelInputType
     ) -> TextTokenCostResponse:
@@ -237,12 +424,74 @@ class GeneralLlm(
             total_tokens_used=total_tokens,
             model=self.model,
             cost=cost,
+            cached_prompt_tokens_used=PromptCacheAccounting.get_cached_prompt_tokens(
+                usage
+            ),
+        )
+
+    async def _mockable_direct_call_to_model_for_many(
+        self, prompt: ModelInputType, number_of_responses: int
+    ) -> list[TextTokenCostResponse | ValueError]:
+        self._everything_special_to_call_before_direct_call()
+        assert self._litellm_model is not None
+        litellm.drop_params = True
+
+        response = await acompletion(
+            messages=self.model_input_to_message(prompt),
+            **{**self.litellm_kwargs, "n": number_of_responses},
         )
+        assert isinstance(response, ModelResponse)
+        choices = typeguard.check_type(response.choices, list[Choices])
+        answers = [choice.message.content for choice in choices]
+        answers = typeguard.check_type(answers, list[str | None])
+        usage = response.usage  # type: ignore
+        assert isinstance(usage, Usage)
+
+        cost = response._hidden_params.get("response_cost") or 0
+        prompt_cost, completion_cost = (
+            self._split_cost_into_prompt_and_completion(
+                cost, usage.prompt_tokens, usage.completion_tokens
+            )
+        )
+        return SampledResponseSplitter.split_into_choice_responses(
+            answers=answers,
+            completion_tokens_per_answer=[
+                self.text_to_tokens_direct(answer) if answer is not None else 0
+                for answer in answers
+            ],
+            prompt_tokens=usage.prompt_tokens,
+            cached_prompt_tokens=PromptCacheAccounting.get_cached_prompt_tokens(
+                usage
+            ),
+            prompt_cost=prompt_cost
+            + self.calculate_per_request_cost(self.model),
+            completion_cost=completion_cost,
+            model=self.model,
+        )
+
+    def _split_cost_into_prompt_and_completion(
+        self, cost: float, prompt_tokens: int, completion_tokens: int
+    ) -> tuple[float, float]:
+        try:
+            listed_prompt_cost = self.calculate_cost_from_tokens(
+                prompt_tokens, 0, calculate_full_cost=False
+            )
+            listed_completion_cost = self.calculate_cost_from_tokens(
+                0, completion_tokens, calculate_full_cost=False
+            )
+        except ValueError:
+            listed_prompt_cost = prompt_tokens
+            listed_completion_cost = completion_tokens
+        listed_total_cost = listed_prompt_cost + listed_completion_cost
+        if listed_total_cost == 0:
+            return 0, cost
+        prompt_cost = cost * listed_prompt_cost / listed_total_cost
+        return prompt_cost, cost - prompt_cost
 
     def model_input_to_message(
         self, user_input: ModelInputType, system_prompt: str | None = None
-    ) -> list[dict[str, str]]:
-        messages: list[dict[str, str]] = []
+    ) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = []
 
         if isinstance(user_input, list):
             assert (
@@ -262,6 +511,25 @@ class GeneralLlm(
                 ]
             else:
                 messages = [user_message]
+        elif isinstance(user_input, CacheablePrompt):
+            mark_prefix_for_caching = (
+                self.use_prompt_caching
+                and CacheablePrompt.model_supports_cache_control(
+                    self._litellm_model
+                )
+            )
+            messages = [
+                {
+                    "role": "user",
+                    "content": user_input.to_message_content(
+                        mark_prefix_for_caching
+                    ),
+                }
+            ]
+            if system_prompt is not None:
+                messages.insert(
+                    0, {"role": "system", "content": system_prompt}
+                )
         elif isinstance(user_input, VisionMessageData):
             if system_prompt is not None:
                 messages = (
@@ -276,7 +544,7 @@ class GeneralLlm(
         else:
             raise TypeError("Unexpected model input type")
 
-        messages = typeguard.check_type(messages, list[dict[str, str]])
+        messages = typeguard.check_type(messages, list[dict[str, Any]])
         return messages
 
     ################################## Methods For Mocking/Testing ##################################
@@ -322,6 +590,19 @@ class GeneralLlm(
     def text_to_tokens_direct(self, text: str) -> int:
         return token_counter(model=self._litellm_model, text=text)
 
+    def _estimate_cost_to_reserve(self, prompt: ModelInputType) -> float:
+        return super()._estimate_cost_to_reserve(
+            prompt
+        ) + self.calculate_per_request_cost(self.model)
+
+    def _get_completion_tokens_to_reserve(self) -> int:
+        max_tokens = self.litellm_kwargs.get(
+            "max_completion_tokens"
+        ) or self.litellm_kwargs.get("max_tokens")
+        if isinstance(max_tokens, int):
+            return max_tokens
+        return self.COMPLETION_TOKENS_TO_RESERVE
+
     def calculate_cost_from_tokens(
         self,
         prompt_tkns: int,
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Mapping
+
+import aiohttp
+
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorCategory(Enum):
+    RATE_LIMITED = "rate_limited"
+    SERVER_ERROR = "server_error"
+    TIMEOUT = "timeout"
+    FATAL = "fatal"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class RetryMetrics:
+    attempts: int = 0
+    successes: int = 0
+    retries: int = 0
+    errors_by_category: dict[ErrorCategory, int] = field(default_factory=dict)
+    retry_after_headers_honored: int = 0
+    window_decreases: int = 0
+    times_throttled: int = 0
+    seconds_waiting_to_retry: float = 0
+    seconds_throttled: float = 0
+    concurrency_window: float | None = None
+
+
+class AdaptiveRetryController:
+    """
+    Decides whether and how long to wait before retrying a failed request, and
+    limits how many requests to one provider run at once.
+
+    Errors are classified from their status code (and type for timeouts).
+    Fatal errors (bad params, auth, hard cost limits) are not retried.
+    Rate limits wait for the provider's Retry-After header if there is one, and
+    otherwise back off quickly. Errors without a status code keep the
+    original slow exponential backoff.
+
+    The concurrency window follows AIMD (like TCP congestion control): there is
+    no limit until the first 429, then the window is cut to a fraction of the
+    requests in flight and grows by about one request per window of successes
+    until it reaches max_window and the limit is removed again.
+
+    One controller is shared per name (see RetryableModel.retry_controller_name).
+    """
+
+    _controllers: dict[str, AdaptiveRetryController] = {}
+
+    FATAL_STATUS_CODES: frozenset[int] = frozenset(
+        {400, 401, 402, 403, 404, 405, 413, 422}
+    )
+    MAX_RETRY_AFTER_SECONDS: float = 120
+
+    def __init__(
+        self,
+        name: str,
+        min_window: float = 1,
+        max_window: float = 256,
+        multiplicative_decrease: float = 0.5,
+        additive_increase: float = 1,
+    ) -> None:
+        if min_window < 1 or max_window < min_window:
+            raise ValueError(
+                "min_window must be at least 1 and no greater than max_window"
+            )
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+        if additive_increase <= 0:
+            raise ValueError("additive_increase must be greater than 0")
+        self.name = name
+        self.min_window = min_window
+        self.max_window = max_window
+        self.multiplicative_decrease = multiplicative_decrease
+        self.additive_increase = additive_increase
+        self.metrics = RetryMetrics()
+        self.__window: float | None = None
+        self.__requests_in_flight: int = 0
+        self.__last_decrease_time: float = 0
+        self.__throttled_until: float = 0
+        self.__waiters: deque[asyncio.Future[None]] = deque()
+
+    @classmethod
+    def get_or_create(cls, name: str) -> AdaptiveRetryController:
+        controller = cls._controllers.get(name)
+        if controller is None:
+            controller = cls(name)
+            cls._controllers[name] = controller
+        return controller
+
+    @classmethod
+    def get_all_metrics(cls) -> dict[str, RetryMetrics]:
+        return {
+            name: controller.metrics
+            for name, controller in cls._controllers.items()
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._controllers.clear()
+
+    @property
+    def concurrency_window(self) -> float | None:
+        return self.__window
+
+    @property
+    def requests_in_flight(self) -> int:
+        return self.__requests_in_flight
+
+    @asynccontextmanager
+    async def attempt(self) -> AsyncIterator[None]:
+        """
+        Waits for room in the concurrency window (and for any Retry-After pause)
+        then records whether the request inside succeeded
+        """
+        await self.__wait_for_room_in_window()
+        start_time = time.monotonic()
+        self.metrics.attempts += 1
+        try:
+            await self.__wait_for_throttle_to_end()
+            yield
+        except Exception as e:
+            self.__record_failure(e, start_time)
+            raise
+        else:
+            self.__record_success()
+        finally:
+            self.__release()
+
+    def should_retry(self, exception: BaseException) -> bool:
+        return self.classify_error(exception) != ErrorCategory.FATAL
+
+    def get_seconds_to_wait_before_retry(
+        self, exception: BaseException, attempt_number: int
+    ) -> float:
+        category = self.classify_error(exception)
+        retry_after = self.get_retry_after_seconds(exception)
+        if retry_after is not None and category in (
+            ErrorCategory.RATE_LIMITED,
+            ErrorCategory.SERVER_ERROR,
+        ):
+            wait_time = retry_after
+            self.metrics.retry_after_headers_honored += 1
+        elif category == ErrorCategory.UNKNOWN:
+            wait_time = self.__random_exponential(
+                attempt_number, multiplier=10, min_wait=5, max_wait=60
+            )
+        else:
+            wait_time = self.__random_exponential(
+                attempt_number, multiplier=1, min_wait=0.5, max_wait=30
+            )
+        self.metrics.retries += 1
+        self.metrics.seconds_waiting_to_retry += wait_time
+        logger.info(
+            f"Retrying {self.name} in {wait_time:.1f}s after {category.value} "
+            f"error (attempt {attempt_number}): {exception}"
+        )
+        return wait_time
+
+    @classmethod
+    def classify_error(cls, exception: BaseException) -> ErrorCategory:
+        """
+        Classifies the first exception in the chain of causes that can be
+        classified, since wrappers (e.g. the timeout wrapper) re-raise errors
+        as RuntimeErrors
+        """
+        for chained_exception in cls.__get_exception_chain(exception):
+            category = cls.__classify_single_error(chained_exception)
+            if category != ErrorCategory.UNKNOWN:
+                return category
+        return ErrorCategory.UNKNOWN
+
+    @classmethod
+    def get_retry_after_seconds(cls, exception: BaseException) -> float | None:
+        """
+        Reads Retry-After (seconds or an HTTP date) or retry-after-ms from the
+        headers on litellm/httpx exceptions (exception.response.headers) or
+        aiohttp exceptions (exception.headers)
+        """
+        for headers in cls.__get_header_mappings(exception):
+            retry_after_ms = cls.__get_header(headers, "retry-after-ms")
+            if retry_after_ms is not None:
+                try:
+                    return cls.__clamp_retry_after(
+                        float(retry_after_ms) / 1000
+                    )
+                except ValueError:
+                    pass
+            retry_after = cls.__get_header(headers, "retry-after")
+            if retry_after is None:
+                continue
+            try:
+                return cls.__clamp_retry_after(float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                continue
+            if retry_date.tzinfo is None:
+                retry_date = retry_date.replace(tzinfo=timezone.utc)
+            seconds = (retry_date - datetime.now(timezone.utc)).total_seconds()
+            return cls.__clamp_retry_after(seconds)
+        return None
+
+    async def __wait_for_room_in_window(self) -> None:
+        if not self.__waiters and self.__has_room_in_window():
+            self.__requests_in_flight += 1
+            return
+        self.metrics.times_throttled += 1
+        start_time = time.monotonic()
+        future: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.__waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.__release()
+            elif future in self.__waiters:
+                self.__waiters.remove(future)
+            raise
+        finally:
+            self.metrics.seconds_throttled += time.monotonic() - start_time
+
+    async def __wait_for_throttle_to_end(self) -> None:
+        seconds_to_wait = self.__throttled_until - time.monotonic()
+        if seconds_to_wait > 0:
+            self.metrics.seconds_throttled += seconds_to_wait
+            await asyncio.sleep(seconds_to_wait)
+
+    def __has_room_in_window(self) -> bool:
+        return self.__window is None or self.__requests_in_flight < int(
+            self.__window
+        )
+
+    def __release(self) -> None:
+        self.__requests_in_flight -= 1
+        while self.__waiters and self.__has_room_in_window():
+            future = self.__waiters.popleft()
+            if future.done() or future.get_loop().is_closed():
+                continue
+            self.__requests_in_flight += 1
+            future.set_result(None)
+
+    def __record_success(self) -> None:
+        self.metrics.successes += 1
+        if self.__window is None:
+            return
+        self.__window += self.additive_increase / self.__window
+        if self.__window >= self.max_window:
+            self.__window = None
+            logger.info(f"Removed concurrency limit for {self.name}")
+        self.metrics.concurrency_window = self.__window
+
+    def __record_failure(
+        self, exception: Exception, attempt_start_time: float
+    ) -> None:
+        category = self.classify_error(exception)
+        self.metrics.errors_by_category[category] = (
+            self.metrics.errors_by_category.get(category, 0) + 1
+        )
+        if category != ErrorCategory.RATE_LIMITED:
+            return
+        retry_after = self.get_retry_after_seconds(exception)
+        if retry_after is not None:
+            self.__throttled_until = max(
+                self.__throttled_until, time.monotonic() + retry_after
+            )
+        # Requests that started before the last decrease were sent with the
+        # old window, so their 429s should not shrink the window again
+        if attempt_start_time < self.__last_decrease_time:
+            return
+        current_window = (
+            self.__window
+            if self.__window is not None
+            else self.__requests_in_flight
+        )
+        self.__window = max(
+            self.min_window, current_window * self.multiplicative_decrease
+        )
+        self.__last_decrease_time = time.monotonic()
+        self.metrics.window_decreases += 1
+        self.metrics.concurrency_window = self.__window
+        logger.warning(
+            f"Rate limited by {self.name}. Concurrency window is now {self.__window:.1f}"
+        )
+
+    @staticmethod
+    def __random_exponential(
+        attempt_number: int,
+        multiplier: float,
+        min_wait: float,
+        max_wait: float,
+    ) -> float:
+        high = min(max_wait, multiplier * 2**attempt_number)
+        return max(min_wait, random.uniform(0, high))
+
+    @classmethod
+    def __clamp_retry_after(cls, seconds: float) -> float:
+        return min(max(seconds, 0), cls.MAX_RETRY_AFTER_SECONDS)
+
+    @classmethod
+    def __classify_single_error(
+        cls, exception: BaseException
+    ) -> ErrorCategory:
+        if isinstance(exception, HardLimitExceededError):
+            return ErrorCategory.FATAL
+        status_code = cls.__get_status_code(exception)
+        if status_code == 429:
+            return ErrorCategory.RATE_LIMITED
+        if status_code == 408 or isinstance(
+            exception, (asyncio.TimeoutError, TimeoutError)
+        ):
+            return ErrorCategory.TIMEOUT
+        if status_code is not None and status_code >= 500:
+            return ErrorCategory.SERVER_ERROR
+        if status_code in cls.FATAL_STATUS_CODES:
+            return ErrorCategory.FATAL
+        if isinstance(
+            exception, (aiohttp.ClientConnectionError, ConnectionError)
+        ):
+            return ErrorCategory.SERVER_ERROR
+        return ErrorCategory.UNKNOWN
+
+    @staticmethod
+    def __get_exception_chain(
+        exception: BaseException,
+    ) -> list[BaseException]:
+        chain: list[BaseException] = []
+        current: BaseException | None = exception
+        while current is not None and current not in chain:
+            chain.append(current)
+            current = current.__cause__ or current.__context__
+        return chain
+
+    @staticmethod
+    def __get_status_code(exception: BaseException) -> int | None:
+        for value in (
+            getattr(exception, "status_code", None),
+            getattr(exception, "status", None),
+            getattr(getattr(exception, "response", None), "status_code", None),
+            getattr(getattr(exception, "response", None), "status", None),
+        ):
+            if isinstance(value, int) and 100 <= value < 600:
+                return value
+        return None
+
+    @classmethod
+    def __get_header_mappings(
+        cls, exception: BaseException
+    ) -> list[Mapping[str, Any]]:
+        candidates = []
+        for chained_exception in cls.__get_exception_chain(exception):
+            response = getattr(chained_exception, "response", None)
+            candidates += [
+                getattr(chained_exception, "headers", None),
+                getattr(chained_exception, "litellm_response_headers", None),
+                getattr(response, "headers", None),
+            ]
+        return [
+            headers for headers in candidates if isinstance(headers, Mapping)
+        ]
+
+    @staticmethod
+    def __get_header(headers: Mapping[str, Any], name: str) -> str | None:
+        for key, value in headers.items():
+            if isinstance(key, str) and key.lower() == name:
+                return str(value)
+        return None
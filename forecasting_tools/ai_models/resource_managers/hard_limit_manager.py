@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Final
 
@@ -11,11 +12,51 @@ class HardLimitExceededError(Exception):
     """Raised when the hardlimit is exceeded"""
 
 
+class CostReservation:
+    """
+    An amount held against every HardLimitManager that was active when it was
+    made (see HardLimitManager.reserve). Settle it with the actual amount once
+    known, or release it if the call failed. Using it as a context manager
+    releases it on exit if it was not settled.
+    """
+
+    def __init__(
+        self, amount: float, limit_managers: list[HardLimitManager]
+    ) -> None:
+        self.amount = amount
+        self.limit_managers = limit_managers
+        self.is_finished = False
+
+    def settle(self, actual_amount: float) -> None:
+        if actual_amount < 0:
+            raise ValueError("Cost should be a positive number or zero")
+        if self.is_finished:
+            raise RuntimeError("Reservation has already been settled")
+        for limit_manager in self.limit_managers:
+            limit_manager._add_usage(actual_amount)
+        self.release()
+
+    def release(self) -> None:
+        if self.is_finished:
+            return
+        self.is_finished = True
+        for limit_manager in self.limit_managers:
+            limit_manager._reserved_usage -= self.amount
+        HardLimitManager._notify_reservation_waiters()
+
+    def __enter__(self) -> CostReservation:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:  # NOSONAR
+        self.release()
+
+
 class HardLimitManager:
     _active_limit_managers: ContextVar[list[HardLimitManager]] = ContextVar(
         "_active_limit_managers", default=[]
     )
     _id_counter: int = 0
+    _reservation_waiters: list[asyncio.Future[None]] = []
 
     def __init__(
         self, hard_limit: float = 0, log_usage_when_called: bool = False
@@ -23,6 +64,7 @@ class HardLimitManager:
         assert hard_limit >= 0
         self.hard_limit: Final[float] = hard_limit
         self._current_usage: float = 0
+        self._reserved_usage: float = 0
         self.__log_usage_when_called: bool = log_usage_when_called
         HardLimitManager._id_counter += 1
         self.id = HardLimitManager._id_counter
@@ -31,9 +73,13 @@ class HardLimitManager:
     def current_usage(self) -> float:
         return self._current_usage
 
+    @property
+    def reserved_usage(self) -> float:
+        return self._reserved_usage
+
     @property
     def amount_left(self) -> float:
-        return self.hard_limit - self._current_usage
+        return self.hard_limit - self._current_usage - self._reserved_usage
 
     @classmethod
     def get_active_cost_managers(cls) -> list[HardLimitManager]:
@@ -66,27 +112,87 @@ class HardLimitManager:
                 and cost_manager.hard_limit != 0
             ):
                 raise HardLimitExceededError(
-                    f"Usage amount {amount_to_check_room_for} would push current usage to {cost_manager.current_usage + amount_to_check_room_for} exceeding the hard limit of {cost_manager.hard_limit}"
+                    f"Current usage {cost_manager.current_usage} + reserved usage {cost_manager.reserved_usage} + amount {amount_to_check_room_for} exceeds the hard limit of {cost_manager.hard_limit}"
                 )
 
+    @classmethod
+    def has_active_hard_limit(cls) -> bool:
+        return any(
+            cost_manager.hard_limit != 0
+            for cost_manager in cls._active_limit_managers.get()
+        )
+
+    @classmethod
+    def reserve(cls, amount: float) -> CostReservation:
+        """
+        Holds the amount against every active manager so concurrent callers
+        see it before the actual usage lands. Raises HardLimitExceededError
+        if there is not enough room left (counting other reservations).
+        Reserving 0 is the same as checking if the limit has been reached.
+        """
+        cls.raise_error_if_limit_would_be_reached(amount)
+        limit_managers = cls._active_limit_managers.get().copy()
+        for limit_manager in limit_managers:
+            limit_manager._reserved_usage += amount
+        return CostReservation(amount, limit_managers)
+
+    @classmethod
+    async def reserve_when_available(cls, amount: float) -> CostReservation:
+        """
+        Like reserve, but if the amount only fails to fit because of other
+        reservations, waits for them to settle (they usually settle for less
+        than they reserved) instead of raising
+        """
+        while True:
+            try:
+                return cls.reserve(amount)
+            except HardLimitExceededError:
+                if not cls.__amount_fits_without_reservations(amount):
+                    raise
+            waiter: asyncio.Future[None] = (
+                asyncio.get_running_loop().create_future()
+            )
+            HardLimitManager._reservation_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in HardLimitManager._reservation_waiters:
+                    HardLimitManager._reservation_waiters.remove(waiter)
+
+    @classmethod
+    def __amount_fits_without_reservations(cls, amount: float) -> bool:
+        return all(
+            cost_manager.hard_limit == 0
+            or cost_manager.hard_limit - cost_manager.current_usage >= amount
+            for cost_manager in cls._active_limit_managers.get()
+        )
+
+    @staticmethod
+    def _notify_reservation_waiters() -> None:
+        waiters = HardLimitManager._reservation_waiters
+        HardLimitManager._reservation_waiters = []
+        for waiter in waiters:
+            if not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(None)
+
     @classmethod
     def increase_current_usage_in_parent_managers(cls, amount: float) -> None:
         if amount < 0:
             raise ValueError("Cost should be a positive number or zero")
+        for cost_manager in cls._active_limit_managers.get():
+            cost_manager._add_usage(amount)
+
+    def _add_usage(self, amount: float) -> None:
         if amount == 0:
             logger.debug(
                 "The cost inputted is zero which may or may not be a problem"
             )
-        for cost_manager in cls._active_limit_managers.get():
-            cost_manager._current_usage += amount
-            if (
-                cost_manager._current_usage > cost_manager.hard_limit
-                and cost_manager.hard_limit != 0
-            ):
-                logger.warning(
-                    f"Usage increase exceeded the hard limit of {cost_manager.hard_limit}"
-                )
-            if cost_manager.__log_usage_when_called:
-                logger.info(
-                    f"{cost_manager.__class__}.ID{cost_manager.id}. Current usage now {cost_manager._current_usage}. Cost of {amount} added"
-                )
+        self._current_usage += amount
+        if self._current_usage > self.hard_limit and self.hard_limit != 0:
+            logger.warning(
+                f"Usage increase exceeded the hard limit of {self.hard_limit}"
+            )
+        if self.__log_usage_when_called:
+            logger.info(
+                f"{self.__class__}.ID{self.id}. Current usage now {self._current_usage}. Cost of {amount} added"
+            )
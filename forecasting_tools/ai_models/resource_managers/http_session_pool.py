@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HttpSessionPool:
+    """
+    Reuses aiohttp sessions (and so their keep-alive connections and DNS cache)
+    between requests instead of opening a new session for each request.
+
+    aiohttp sessions are tied to the event loop they were created in, so one
+    session is kept per event loop. Sessions of loops that have since closed
+    (e.g. one per `asyncio.run`) are dropped the next time a session is
+    requested, since they can no longer be used or closed. A shared pool for the whole process is
+    available through `get_shared_pool`. Use the pool as an async context manager
+    to make sure its sessions are closed when you are done with them:
+    ```
+    async with HttpSessionPool.get_shared_pool():
+        await bot.forecast_on_tournament(tournament_id)
+    ```
+    """
+
+    _shared_pool: HttpSessionPool | None = None
+
+    def __init__(
+        self,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 20,
+        dns_cache_ttl_in_seconds: int = 300,
+        keepalive_timeout_in_seconds: float = 30,
+    ) -> None:
+        if connection_limit < 0 or connection_limit_per_host < 0:
+            raise ValueError("Connection limits must not be negative")
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl_in_seconds = dns_cache_ttl_in_seconds
+        self.keepalive_timeout_in_seconds = keepalive_timeout_in_seconds
+        # Keyed by id since a session holds a reference to its loop
+        self.__sessions: dict[
+            int, tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]
+        ] = {}
+
+    @classmethod
+    def get_shared_pool(cls) -> HttpSessionPool:
+        if cls._shared_pool is None:
+            cls._shared_pool = HttpSessionPool()
+        return cls._shared_pool
+
+    @classmethod
+    def set_shared_pool(cls, pool: HttpSessionPool) -> None:
+        cls._shared_pool = pool
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        self.__drop_sessions_of_closed_loops()
+        loop_and_session = self.__sessions.get(id(loop))
+        if loop_and_session is None or loop_and_session[1].closed:
+            session = aiohttp.ClientSession(
+                connector=self.__create_connector()
+            )
+            self.__sessions[id(loop)] = (loop, session)
+            logger.debug("Created new pooled aiohttp session")
+            return session
+        return loop_and_session[1]
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        loop_and_session = self.__sessions.pop(id(loop), None)
+        if loop_and_session is not None and not loop_and_session[1].closed:
+            await loop_and_session[1].close()
+
+    async def __aenter__(self) -> HttpSessionPool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def get_number_of_sessions(self) -> int:
+        return len(self.__sessions)
+
+    def __drop_sessions_of_closed_loops(self) -> None:
+        for loop_id, (loop, _) in list(self.__sessions.items()):
+            if loop.is_closed():
+                del self.__sessions[loop_id]
+                logger.debug("Dropped pooled aiohttp session of closed loop")
+
+    def __create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl_in_seconds,
+            keepalive_timeout=self.keepalive_timeout_in_seconds,
+        )
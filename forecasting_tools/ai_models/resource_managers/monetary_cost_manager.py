@@ -10,12 +10,53 @@ class MonetaryCostManager(HardLimitManager):
     This class is a subclass of HardLimitManager that is specifically for monetary costs.
     Assume every cost is in USD
 
-    As of Aug 27 2024, the manager does not track predicted costs.
-    For instance if you run 50 coroutines that cost 10c, and your limit is $1,
-    all 50 will be let through (not 10).
-    The cost will not register until the coroutines finish.
+    Models reserve an estimate of each call's cost before calling the provider
+    (see HardLimitManager.reserve_when_available) and settle it to the actual
+    cost afterwards. So if you run 50 coroutines that are estimated to cost 10c,
+    and your limit is $1, 10 will be let through at once and the rest will wait
+    for those to settle (and then run if there is room left).
+    Models that cannot estimate their cost reserve 0, and their cost will not
+    register until their coroutines finish.
+
+    Calls answered from a cache cost nothing, but record what they would have
+    cost in `cost_saved` (see increase_cost_saved_in_parent_managers), as do
+    prompt tokens read from a provider's prompt cache (which are also counted
+    in `cached_prompt_tokens`).
     """
 
+    def __init__(
+        self, hard_limit: float = 0, log_usage_when_called: bool = False
+    ) -> None:
+        super().__init__(hard_limit, log_usage_when_called)
+        self._cost_saved: float = 0
+        self._cached_prompt_tokens: int = 0
+
+    @property
+    def cost_saved(self) -> float:
+        return self._cost_saved
+
+    @property
+    def cached_prompt_tokens(self) -> int:
+        return self._cached_prompt_tokens
+
+    @classmethod
+    def increase_cost_saved_in_parent_managers(cls, amount: float) -> None:
+        if amount < 0:
+            raise ValueError("Cost should be a positive number or zero")
+        for cost_manager in cls.get_active_cost_managers():
+            if isinstance(cost_manager, MonetaryCostManager):
+                cost_manager._cost_saved += amount
+
+    @classmethod
+    def increase_cached_prompt_tokens_in_parent_managers(
+        cls, tokens: int
+    ) -> None:
+        if tokens < 0:
+            raise ValueError("Tokens should be a positive number or zero")
+        for cost_manager in cls.get_active_cost_managers():
+            if isinstance(cost_manager, MonetaryCostManager):
+                cost_manager._cached_prompt_tokens += tokens
+
     def __enter__(self) -> MonetaryCostManager:
         super().__enter__()
         return self
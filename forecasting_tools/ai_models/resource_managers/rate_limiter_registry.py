@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
+    RefreshingBucketRateLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRateLimiter:
+    """
+    A rate limit (token bucket) and/or a limit on concurrent requests that is
+    shared by everything that uses the same name in the RateLimiterRegistry.
+
+    Concurrency slots are taken before a request token, so requests waiting on
+    a slot do not use up the request budget.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_period: float | None = None,
+        period_in_seconds: float = 60,
+        max_concurrent_requests: int | None = None,
+    ) -> None:
+        if requests_per_period is not None and requests_per_period <= 0:
+            raise ValueError("requests_per_period must be greater than 0")
+        if period_in_seconds <= 0:
+            raise ValueError("period_in_seconds must be greater than 0")
+        if (
+            max_concurrent_requests is not None
+            and max_concurrent_requests <= 0
+        ):
+            raise ValueError("max_concurrent_requests must be greater than 0")
+        self.name = name
+        self.requests_per_period = requests_per_period
+        self.period_in_seconds = period_in_seconds
+        self.max_concurrent_requests = max_concurrent_requests
+        self.request_bucket: RefreshingBucketRateLimiter | None = (
+            RefreshingBucketRateLimiter(
+                capacity=requests_per_period,
+                refresh_rate=requests_per_period / period_in_seconds,
+            )
+            if requests_per_period is not None
+            else None
+        )
+        # asyncio semaphores are tied to one event loop, so one is kept per loop.
+        # Keyed by id since a semaphore that was waited on references its loop
+        self.__concurrency_slots: dict[
+            int, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+
+    @asynccontextmanager
+    async def acquire(
+        self, requests_being_made: int = 1
+    ) -> AsyncIterator[None]:
+        concurrency_slots = self.__get_concurrency_slots()
+        if concurrency_slots is None:
+            await self.__wait_for_request_tokens(requests_being_made)
+            yield
+            return
+        async with concurrency_slots:
+            await self.__wait_for_request_tokens(requests_being_made)
+            yield
+
+    async def __wait_for_request_tokens(
+        self, requests_being_made: int
+    ) -> None:
+        if self.request_bucket is not None:
+            await self.request_bucket.wait_till_able_to_acquire_resources(
+                requests_being_made
+            )
+
+    def __get_concurrency_slots(self) -> asyncio.Semaphore | None:
+        if self.max_concurrent_requests is None:
+            return None
+        loop = asyncio.get_running_loop()
+        self.__drop_concurrency_slots_of_closed_loops()
+        loop_and_slots = self.__concurrency_slots.get(id(loop))
+        if loop_and_slots is None:
+            concurrency_slots = asyncio.Semaphore(self.max_concurrent_requests)
+            self.__concurrency_slots[id(loop)] = (loop, concurrency_slots)
+            return concurrency_slots
+        return loop_and_slots[1]
+
+    def get_number_of_event_loops_tracked(self) -> int:
+        return len(self.__concurrency_slots)
+
+    def __drop_concurrency_slots_of_closed_loops(self) -> None:
+        for loop_id, (loop, _) in list(self.__concurrency_slots.items()):
+            if loop.is_closed():
+                del self.__concurrency_slots[loop_id]
+
+    def __str__(self) -> str:
+        return (
+            f"SharedRateLimiter(name={self.name}, "
+            f"requests_per_period={self.requests_per_period}, "
+            f"period_in_seconds={self.period_in_seconds}, "
+            f"max_concurrent_requests={self.max_concurrent_requests})"
+        )
+
+
+class RateLimiterRegistry:
+    """
+    Process wide registry of named SharedRateLimiters so that separate callers
+    (e.g. two researchers hitting the same provider) draw from one budget
+    instead of each getting the full limit.
+
+    ExaSearcher, GeneralLlm and AskNewsSearcher look up a limiter by their
+    `rate_limiter_name` (made from the provider, model and a hash of the API key)
+    before each request, and do not limit requests if none is configured.
+    To set a limit:
+    ```
+    RateLimiterRegistry.configure(
+        GeneralLlm("gpt-4o").rate_limiter_name,
+        requests_per_period=500,
+        period_in_seconds=60,
+        max_concurrent_requests=50,
+    )
+    ```
+    """
+
+    _limiters: dict[str, SharedRateLimiter] = {}
+
+    @classmethod
+    def configure(
+        cls,
+        name: str,
+        requests_per_period: float | None = None,
+        period_in_seconds: float = 60,
+        max_concurrent_requests: int | None = None,
+    ) -> SharedRateLimiter:
+        """
+        Creates (or replaces) the limiter for the name
+        """
+        limiter = SharedRateLimiter(
+            name,
+            requests_per_period,
+            period_in_seconds,
+            max_concurrent_requests,
+        )
+        cls._limiters[name] = limiter
+        logger.debug(f"Configured rate limiter {limiter}")
+        return limiter
+
+    @classmethod
+    def get_or_create(
+        cls,
+        name: str,
+        requests_per_period: float | None = None,
+        period_in_seconds: float = 60,
+        max_concurrent_requests: int | None = None,
+    ) -> SharedRateLimiter:
+        """
+        Returns the limiter already registered for the name if there is one
+        (ignoring the given limits), otherwise creates it with the given limits
+        """
+        limiter = cls._limiters.get(name)
+        if limiter is None:
+            limiter = cls.configure(
+                name,
+                requests_per_period,
+                period_in_seconds,
+                max_concurrent_requests,
+            )
+        return limiter
+
+    @classmethod
+    def get(cls, name: str) -> SharedRateLimiter | None:
+        return cls._limiters.get(name)
+
+    @classmethod
+    def remove(cls, name: str) -> None:
+        cls._limiters.pop(name, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._limiters.clear()
+
+    @classmethod
+    @asynccontextmanager
+    async def limit(
+        cls, name: str, requests_being_made: int = 1
+    ) -> AsyncIterator[None]:
+        """
+        Waits on the limiter registered for the name, or does nothing if there is none
+        """
+        limiter = cls._limiters.get(name)
+        if limiter is None:
+            yield
+            return
+        async with limiter.acquire(requests_being_made):
+            yield
+
+    @staticmethod
+    def make_name(*parts: str, api_key: str | None = None) -> str:
+        """
+        Joins the parts with '/' and adds a short hash of the API key (if given)
+        so separate keys get separate limits without putting the key in the name
+        """
+        name = "/".join(parts)
+        if api_key:
+            key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:8]
+            name += f"/key-{key_hash}"
+        return name
@@ -1,11 +1,13 @@
-import logging
-from datetime import datetime, timedelta
-
-logger = logging.getLogger(__name__)
 import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
 from enum import Enum
 from typing import Final
 
+logger = logging.getLogger(__name__)
+
 
 class LimitReachedResponse(Enum):
     RAISE_EXCEPTION = 1
@@ -17,9 +19,17 @@ class ResourceUnavailableError(RuntimeError):
 
 
 class ResourceUseEntry:
-    def __init__(self, resources_used: int, time: datetime) -> None:
+    def __init__(self, resources_used: int, time: float) -> None:
         self.resources_used: int = resources_used
-        self.time: datetime = time
+        self.time: float = time  # Wall clock timestamp (seconds since epoch)
+
+
+class _Waiter:
+    def __init__(
+        self, resources_being_consumed: int, future: asyncio.Future[None]
+    ) -> None:
+        self.resources_being_consumed = resources_being_consumed
+        self.future = future
 
 
 class RefreshingBucketRateLimiter:
@@ -37,6 +47,13 @@ class RefreshingBucketRateLimiter:
     If you reach the bottom of the bucket, the bucket will fill all the way up before you can use resources again.
     This is to make sure something like a "requests per minute" limit is not exceeded even after a burst
     (since averaging out the burst over the full recharge period would successfully hold to the limit).
+
+    Callers that cannot acquire right away wait in a FIFO queue. Only one timer
+    is scheduled at a time (for the moment the caller at the front of the queue can go)
+    so waiting callers do not poll. Refills are based on `time.monotonic()`.
+    All state is only touched from within the event loop without awaiting
+    in between, so no locks are needed.
+    The most recent `max_history_entries` acquisitions are kept for reporting.
     """
 
     def __init__(
@@ -44,6 +61,7 @@ class RefreshingBucketRateLimiter:
         capacity: float,
         refresh_rate: float,
         limit_reached_response: LimitReachedResponse = LimitReachedResponse.WAIT,
+        max_history_entries: int = 10000,
     ) -> None:
         if capacity <= 0:
             raise ValueError("capacity must be greater than 0")
@@ -55,23 +73,29 @@ class RefreshingBucketRateLimiter:
             logger.info("refresh_rate is 0, resources will not refresh")
         self.refresh_rate: Final[float] = refresh_rate
 
+        if max_history_entries <= 0:
+            raise ValueError("max_history_entries must be greater than 0")
+
         self.__limit_reached_response: LimitReachedResponse = (
             limit_reached_response
         )
         self.__available_resources: float = capacity
-        self.__resource_history: list[ResourceUseEntry] = []
-        self.__last_replenish_time: datetime = datetime.now()
-        self.__available_resource_lock = asyncio.Lock()
-        self.__resource_history_lock = asyncio.Lock()
+        self.__resource_history: deque[ResourceUseEntry] = deque(
+            maxlen=max_history_entries
+        )
+        self.__last_replenish_time: float = time.monotonic()
         self.__fill_the_bucket_mode = False
+        self.__waiters: deque[_Waiter] = deque()
+        self.__wakeup_handle: asyncio.TimerHandle | None = None
 
     def refresh_and_then_get_available_resources(self) -> float:
-        asyncio.run(self._refresh_resource_count())
+        self._refresh_resource_count()
         return self._available_resources
 
     def zero_out_resources(self) -> None:
+        self._refresh_resource_count()
         self._available_resources = 0
-        asyncio.run(self.__update_fill_the_bucket_mode(resources_ran_out=True))
+        self.__fill_the_bucket_mode = True
 
     @property
     def _available_resources(self) -> float:
@@ -85,14 +109,21 @@ class RefreshingBucketRateLimiter:
             raise ValueError("value must be greater than or equal to 0")
         self.__available_resources = value
 
+    @property
+    def number_of_waiters(self) -> int:
+        return len(self.__waiters)
+
     def calculate_resources_passed_into_acquire_in_time_range(
         self, start_time: datetime, end_time: datetime
     ) -> int:
+        start_timestamp = start_time.timestamp()
+        end_timestamp = end_time.timestamp()
         resources_used = 0
-        for entry in self.__resource_history:
-            if start_time < entry.time < end_time:
+        for entry in reversed(self.__resource_history):
+            if entry.time <= start_timestamp:
+                break
+            if entry.time < end_timestamp:
                 resources_used += entry.resources_used
-
         return resources_used
 
     async def wait_till_able_to_acquire_resources(
@@ -103,101 +134,112 @@ class RefreshingBucketRateLimiter:
                 f"resources_being_consumed must be less than or equal to capacity. Capacity: {self.capacity}, resources_being_consumed: {resources_being_consumed}"
             )
 
-        resources_are_available: bool = (
-            await self._determine_if_resources_available(
-                resources_being_consumed
-            )
-        )
-        await self.__update_fill_the_bucket_mode(
-            resources_ran_out=(not resources_are_available)
-        )
+        loop = asyncio.get_running_loop()
+        self.__drop_waiters_from_other_event_loops(loop)
+        while self.__waiters and self.__waiters[0].future.done():
+            self.__waiters.popleft()
+        self._refresh_resource_count()
+        if not self.__waiters and self.__try_to_consume(
+            resources_being_consumed
+        ):
+            return
 
         if (
-            not resources_are_available
-            and self.__limit_reached_response
+            self.__limit_reached_response
             == LimitReachedResponse.RAISE_EXCEPTION
         ):
             raise ResourceUnavailableError(
                 "Resources not available. Limit Reached Response is RAISE_EXCEPTION"
             )
 
-        if not resources_are_available and self.refresh_rate == 0:
+        if self.refresh_rate == 0:
             raise RuntimeError(
                 "Resources not available. Would have waited indefinitely. refresh_rate is 0"
             )
 
-        while not resources_are_available or self.__fill_the_bucket_mode:
-            seconds_to_sleep = await self.__calculate_seconds_to_sleep(
-                resources_being_consumed
-            )
-            await asyncio.sleep(seconds_to_sleep)
-            resources_are_available = (
-                await self._determine_if_resources_available(
-                    resources_being_consumed
-                )
-            )
-            await self.__update_fill_the_bucket_mode(
-                resources_ran_out=(not resources_are_available)
-            )
-
-        async with self.__available_resource_lock:
-            self._available_resources -= resources_being_consumed
-
-        await self.__add_resource_use_entry(resources_being_consumed)
-
-    async def _determine_if_resources_available(
-        self, resources_being_consumed: int
-    ) -> bool:
-        await self._refresh_resource_count()
-        async with self.__available_resource_lock:
-            resources_are_available = (
-                resources_being_consumed <= self._available_resources
-            )
-            return resources_are_available
-
-    async def __update_fill_the_bucket_mode(
-        self, resources_ran_out: bool
-    ) -> None:
-        await self._refresh_resource_count()
+        waiter = _Waiter(resources_being_consumed, loop.create_future())
+        self.__waiters.append(waiter)
+        self.__schedule_wakeup(loop)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.__return_unused_resources(resources_being_consumed)
+            raise
+
+    def _refresh_resource_count(self) -> None:
+        now = time.monotonic()
+        seconds_since_last_replenish = now - self.__last_replenish_time
+        replenish_amount = seconds_since_last_replenish * self.refresh_rate
+        new_total = self._available_resources + replenish_amount
+        self._available_resources = min(new_total, self.capacity)
+        self.__last_replenish_time = now
         if self._available_resources >= self.capacity:
-            if resources_ran_out == True:
-                raise ValueError(
-                    "resources_ran_out should not be True when resources are available"
-                )
             self.__fill_the_bucket_mode = False
-        if resources_ran_out:
+
+    def __try_to_consume(self, resources_being_consumed: int) -> bool:
+        if self.__fill_the_bucket_mode:
+            return False
+        if resources_being_consumed > self._available_resources:
             self.__fill_the_bucket_mode = True
+            return False
+        self._available_resources -= resources_being_consumed
+        self.__resource_history.append(
+            ResourceUseEntry(resources_being_consumed, time.time())
+        )
+        return True
 
-    async def _refresh_resource_count(self) -> None:
-        async with self.__available_resource_lock:
-            time_since_last_replenish: timedelta = (
-                datetime.now() - self.__last_replenish_time
-            )
-            seconds_since_last_replenish: float = (
-                time_since_last_replenish.total_seconds()
-            )
-            replenish_amount = seconds_since_last_replenish * self.refresh_rate
-            new_total = self._available_resources + replenish_amount
-            self._available_resources = min(new_total, self.capacity)
-            self.__last_replenish_time = datetime.now()
+    def __return_unused_resources(self, resources: int) -> None:
+        self._refresh_resource_count()
+        self._available_resources = min(
+            self._available_resources + resources, self.capacity
+        )
 
-    async def __calculate_seconds_to_sleep(
-        self, resources_being_consumed: int
-    ) -> float:
-        if self.__fill_the_bucket_mode:
-            seconds_till_bucket_is_full = (
-                self.capacity - self._available_resources
-            ) / self.refresh_rate
-            return seconds_till_bucket_is_full
-        elif resources_being_consumed > self._available_resources:
-            seconds_till_resources_available = (
-                resources_being_consumed - self._available_resources
-            ) / self.refresh_rate
-            return seconds_till_resources_available
+    def __process_waiters(self) -> None:
+        self.__wakeup_handle = None
+        self._refresh_resource_count()
+        while self.__waiters:
+            waiter = self.__waiters[0]
+            if waiter.future.done():
+                self.__waiters.popleft()
+                continue
+            if not self.__try_to_consume(waiter.resources_being_consumed):
+                break
+            self.__waiters.popleft()
+            waiter.future.set_result(None)
+        if self.__waiters:
+            self.__schedule_wakeup(asyncio.get_running_loop())
+
+    def __schedule_wakeup(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.__wakeup_handle is not None:
+            return
+        self.__wakeup_handle = loop.call_later(
+            self.__calculate_seconds_to_sleep(), self.__process_waiters
+        )
+
+    def __calculate_seconds_to_sleep(self) -> float:
+        if self.__fill_the_bucket_mode or not self.__waiters:
+            resources_needed = self.capacity
         else:
-            return 0
+            resources_needed = self.__waiters[0].resources_being_consumed
+        missing_resources = max(
+            resources_needed - self._available_resources, 0
+        )
+        return missing_resources / self.refresh_rate
 
-    async def __add_resource_use_entry(self, resource_amount: int) -> None:
-        async with self.__resource_history_lock:
-            new_entry = ResourceUseEntry(resource_amount, datetime.now())
-            self.__resource_history.append(new_entry)
+    def __drop_waiters_from_other_event_loops(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """
+        Limiters are often shared at the class level, so they can outlive the event
+        loop (e.g. from `asyncio.run`) that queued waiters or scheduled a wakeup.
+        """
+        if self.__waiters and self.__waiters[0].future.get_loop() is not loop:
+            self.__waiters = deque(
+                waiter
+                for waiter in self.__waiters
+                if waiter.future.get_loop() is loop
+            )
+            if self.__wakeup_handle is not None:
+                self.__wakeup_handle.cancel()
+                self.__wakeup_handle = None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """
+    Makes concurrent identical requests share one call ("single flight").
+    The first request with a key starts the call, and every request with the
+    same key that comes in before the call finishes awaits the same result
+    (or exception) instead of calling the provider again. Nothing is kept
+    once the call finishes (see the response caches for that).
+
+    The call runs as its own task so one awaiter being cancelled does not
+    cancel it for the others. It runs in the context of the first request, so
+    its cost is tracked in the MonetaryCostManagers of that request. Requests
+    that join the call are given its result through `on_shared_result` (in
+    their own context) so they can record what they saved in their own
+    managers.
+    """
+
+    _in_flight_calls: dict[
+        tuple[asyncio.AbstractEventLoop, str], asyncio.Task[Any]
+    ] = {}
+    requests_coalesced: int = 0
+
+    @classmethod
+    async def run(
+        cls,
+        key: str,
+        make_call: Callable[[], Awaitable[T]],
+        on_shared_result: Callable[[T], None] | None = None,
+    ) -> T:
+        in_flight_key = (asyncio.get_running_loop(), key)
+        call = cls._in_flight_calls.get(in_flight_key)
+        joined_call = call is not None
+        if call is None:
+            call = asyncio.ensure_future(make_call())
+            cls._in_flight_calls[in_flight_key] = call
+            call.add_done_callback(
+                lambda finished_call: cls.__finish_call(
+                    in_flight_key, finished_call
+                )
+            )
+        else:
+            cls.requests_coalesced += 1
+            logger.debug(f"Coalescing request with in flight call {key}")
+        result = await asyncio.shield(call)
+        if joined_call and on_shared_result is not None:
+            on_shared_result(result)
+        return result
+
+    @classmethod
+    def get_number_of_calls_in_flight(cls) -> int:
+        return len(cls._in_flight_calls)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._in_flight_calls.clear()
+        cls.requests_coalesced = 0
+
+    @classmethod
+    def __finish_call(
+        cls,
+        in_flight_key: tuple[asyncio.AbstractEventLoop, str],
+        call: asyncio.Task[Any],
+    ) -> None:
+        if cls._in_flight_calls.get(in_flight_key) is call:
+            del cls._in_flight_calls[in_flight_key]
+        if not call.cancelled():
+            call.exception()  # Marks the exception as retrieved if every awaiter was cancelled
@@ -0,0 +1,74 @@
+import logging
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveSamplingPolicy(BaseModel):
+    """
+    Decides when a ForecastBot can stop making predictions for a question.
+    Predictions are made in waves (by default one prediction per research
+    report per wave), and sampling stops once there are at least
+    `min_predictions` whose spread (see `ForecastReport.calculate_prediction_spread`)
+    is at most `spread_tolerance`, or once the question has cost
+    `max_cost` dollars or taken `max_minutes`. The bot's
+    `research_reports_per_question * predictions_per_research_report`
+    is still the most predictions that will be made.
+    """
+
+    spread_tolerance: float = Field(default=0.05, ge=0)
+    min_predictions: int = Field(default=3, ge=1)
+    predictions_per_wave: int | None = Field(default=None, ge=1)
+    max_cost: float | None = Field(default=None, gt=0)
+    max_minutes: float | None = Field(default=None, gt=0)
+
+    def get_stopping_reason(
+        self,
+        predictions: list[Any],
+        report_type: type[ForecastReport],
+        cost_so_far: float,
+        minutes_so_far: float,
+    ) -> str | None:
+        if self.max_cost is not None and cost_so_far >= self.max_cost:
+            return f"Cost of ${cost_so_far:.4f} reached the budget of ${self.max_cost}"
+        if self.max_minutes is not None and minutes_so_far >= self.max_minutes:
+            return f"Time of {minutes_so_far:.2f} minutes reached the budget of {self.max_minutes} minutes"
+        if len(predictions) < self.min_predictions:
+            return None
+        spread = report_type.calculate_prediction_spread(predictions)
+        if spread <= self.spread_tolerance:
+            return f"Spread of {spread:.4f} between {len(predictions)} predictions is within {self.spread_tolerance}"
+        logger.debug(
+            f"Spread of {spread:.4f} between {len(predictions)} predictions is above {self.spread_tolerance}"
+        )
+        return None
+
+    def plan_wave(
+        self, predictions_attempted: list[int], max_predictions_per_report: int
+    ) -> list[int]:
+        """
+        Returns how many predictions to make from each research report in
+        the next wave, starting with the reports that have been sampled least
+        """
+        wave_size = self.predictions_per_wave or len(predictions_attempted)
+        planned = [0] * len(predictions_attempted)
+        for _ in range(wave_size):
+            open_reports = [
+                i
+                for i, attempted in enumerate(predictions_attempted)
+                if attempted + planned[i] < max_predictions_per_report
+            ]
+            if not open_reports:
+                break
+            least_sampled_report = min(
+                open_reports,
+                key=lambda i: predictions_attempted[i] + planned[i],
+            )
+            planned[least_sampled_report] += 1
+        return planned
@@ -12,5 +12,7 @@ from forecasting_tools.forecasting.questions_and_reports.questions import (
 class Q3TemplateWithAskNews(Q3TemplateBot):
 
     async def run_research(self, question: MetaculusQuestion) -> str:
-        response = AskNewsSearcher().get_formatted_news(question.question_text)
+        response = await AskNewsSearcher().get_formatted_news_async(
+            question.question_text
+        )
         return response
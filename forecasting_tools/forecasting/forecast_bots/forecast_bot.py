@@ -3,8 +3,18 @@ import inspect
 import logging
 import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Coroutine, Sequence, TypeVar, cast, overload
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from pydantic import BaseModel
 
@@ -12,7 +22,21 @@ from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
-from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.forecast_bots.adaptive_sampling import (
+    AdaptiveSamplingPolicy,
+)
+from forecasting_tools.forecasting.forecast_bots.forecast_pipeline import (
+    AsyncPipeline,
+    ForecastPipelineSettings,
+    PipelineStage,
+)
+from forecasting_tools.forecasting.forecast_bots.forecast_scheduler import (
+    ForecastScheduler,
+    TaskType,
+)
+from forecasting_tools.forecasting.helpers.async_metaculus_api import (
+    AsyncMetaculusApi,
+)
 from forecasting_tools.forecasting.questions_and_reports.data_organizer import (
     DataOrganizer,
 )
@@ -34,12 +58,24 @@ from forecasting_tools.forecasting.questions_and_reports.questions import (
     MultipleChoiceQuestion,
     NumericQuestion,
 )
+from forecasting_tools.forecasting.questions_and_reports.report_sink import (
+    JsonlReportSink,
+)
 
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ResearchedQuestion:
+    question: MetaculusQuestion
+    research_results: list[tuple[str, str]]
+    research_errors: list[str]
+    cost_manager: MonetaryCostManager
+    start_time: float
+
+
 class ScratchPad(BaseModel):
     """
     Context object that is available while forecasting on a question
@@ -53,6 +89,31 @@ class ScratchPad(BaseModel):
 class ForecastBot(ABC):
     """
     Base class for all forecasting bots.
+
+    How many questions, research reports, and predictions run at once is
+    controlled by the `scheduler`. Without one nothing is bounded, so pass e.g.
+    `ForecastScheduler(max_concurrent_research=5)` to stay under your rate limits.
+    Override `_get_question_priority` and pass a scheduler using
+    `SchedulingOrder.PRIORITY` to choose which questions go first.
+
+    If a `report_sink` is given, each report is appended to it as soon as its
+    question finishes. With `resume_from_report_sink` questions that already
+    have a report in the sink are not forecasted again, and the saved report is returned instead.
+
+    With `make_predictions_in_one_request`, the predictions for a research report are made
+    by one call to `_run_forecasts_on_binary` (or the other question types' equivalent)
+    instead of `predictions_per_research_report` calls to `_run_forecast_on_binary`.
+    Override those to get every prediction from one LLM request (e.g. with `GeneralLlm.invoke_many`).
+
+    With an `adaptive_sampling` policy, predictions are made in waves after all research is done,
+    and no more are made once they agree closely enough or a cost/time budget is used up
+    (see AdaptiveSamplingPolicy). Each report records how many predictions it used in `predictions_used`.
+
+    With `pipeline` settings, questions go through a staged pipeline instead of each running as one task:
+    questions are loaded into a bounded queue, a pool of research workers runs every research report for a question,
+    and a separate pool of forecast workers makes and aggregates the predictions. Each stage works on different questions
+    at once, and the bounded queues keep a 1000 question run from holding every question's work in memory.
+    The scheduler's research and prediction limits still apply, but the worker pools take the place of its question limit.
     """
 
     def __init__(
@@ -64,6 +125,12 @@ class ForecastBot(ABC):
         publish_reports_to_metaculus: bool = False,
         folder_to_save_reports_to: str | None = None,
         skip_previously_forecasted_questions: bool = False,
+        scheduler: ForecastScheduler | None = None,
+        report_sink: JsonlReportSink | None = None,
+        resume_from_report_sink: bool = False,
+        make_predictions_in_one_request: bool = False,
+        adaptive_sampling: AdaptiveSamplingPolicy | None = None,
+        pipeline: ForecastPipelineSettings | None = None,
     ) -> None:
         assert (
             research_reports_per_question > 0
@@ -71,6 +138,9 @@ class ForecastBot(ABC):
         assert (
             predictions_per_research_report > 0
         ), "Must run at least one prediction"
+        assert (
+            not resume_from_report_sink or report_sink is not None
+        ), "Must set a report sink to resume from"
         self.research_reports_per_question = research_reports_per_question
         self.predictions_per_research_report = predictions_per_research_report
         self.use_research_summary_to_forecast = (
@@ -81,6 +151,16 @@ class ForecastBot(ABC):
         self.skip_previously_forecasted_questions = (
             skip_previously_forecasted_questions
         )
+        self.scheduler = scheduler or ForecastScheduler(
+            max_concurrent_questions=None,
+            max_concurrent_research=None,
+            max_concurrent_predictions=None,
+        )
+        self.report_sink = report_sink
+        self.resume_from_report_sink = resume_from_report_sink
+        self.make_predictions_in_one_request = make_predictions_in_one_request
+        self.adaptive_sampling = adaptive_sampling
+        self.pipeline = pipeline
         self._scratch_pads: list[ScratchPad] = []
         self._scratch_pad_lock = asyncio.Lock()
 
@@ -111,10 +191,14 @@ class ForecastBot(ABC):
         tournament_id: int | str,
         return_exceptions: bool = False,
     ) -> list[ForecastReport] | list[ForecastReport | BaseException]:
-        questions = MetaculusApi.get_all_open_questions_from_tournament(
-            tournament_id
+        question_pages = (
+            AsyncMetaculusApi().iterate_open_questions_from_tournament(
+                tournament_id
+            )
+        )
+        return await self._forecast_question_pages(
+            question_pages, return_exceptions
         )
-        return await self.forecast_questions(questions, return_exceptions)
 
     @overload
     async def forecast_question(
@@ -161,38 +245,230 @@ class ForecastBot(ABC):
         questions: Sequence[MetaculusQuestion],
         return_exceptions: bool = False,
     ) -> list[ForecastReport] | list[ForecastReport | BaseException]:
-        if self.skip_previously_forecasted_questions:
-            unforecasted_questions = [
-                question
-                for question in questions
-                if not question.already_forecasted
-            ]
-            if len(questions) != len(unforecasted_questions):
-                logger.info(
-                    f"Skipping {len(questions) - len(unforecasted_questions)} previously forecasted questions"
-                )
-            questions = unforecasted_questions
-        reports: list[ForecastReport | BaseException] = []
-        reports = await asyncio.gather(
-            *[
-                self._run_individual_question(question)
-                for question in questions
-            ],
-            return_exceptions=return_exceptions,
+        async def single_page() -> AsyncIterator[list[MetaculusQuestion]]:
+            yield list(questions)
+
+        return await self._forecast_question_pages(
+            single_page(), return_exceptions
+        )
+
+    async def _forecast_question_pages(
+        self,
+        question_pages: AsyncIterator[list[MetaculusQuestion]],
+        return_exceptions: bool,
+    ) -> list[ForecastReport] | list[ForecastReport | BaseException]:
+        """
+        Starts forecasting on each page of questions as soon as it arrives
+        so that loading later pages overlaps with forecasting earlier ones.
+        """
+        if self.pipeline is not None:
+            return await self._forecast_question_pages_in_pipeline(
+                question_pages, return_exceptions, self.pipeline
+            )
+        finished_reports = self._load_finished_reports_if_resuming()
+        questions: list[MetaculusQuestion] = []
+        pending_reports: list[
+            ForecastReport | asyncio.Task[ForecastReport]
+        ] = []
+        try:
+            async for page in question_pages:
+                for question in self._remove_previously_forecasted(page):
+                    questions.append(question)
+                    if question.id_of_post in finished_reports:
+                        pending_reports.append(
+                            finished_reports[question.id_of_post]
+                        )
+                    else:
+                        pending_reports.append(
+                            asyncio.create_task(
+                                self._run_and_record_individual_question(
+                                    question
+                                )
+                            )
+                        )
+        except BaseException:
+            for pending_report in pending_reports:
+                if isinstance(pending_report, asyncio.Task):
+                    pending_report.cancel()
+            raise
+
+        tasks = [
+            pending_report
+            for pending_report in pending_reports
+            if isinstance(pending_report, asyncio.Task)
+        ]
+        if len(questions) != len(tasks):
+            logger.info(
+                f"Resuming from report sink. Skipping {len(questions) - len(tasks)} already finished questions"
+            )
+        new_reports: list[ForecastReport | BaseException] = []
+        new_reports = await asyncio.gather(
+            *tasks, return_exceptions=return_exceptions
         )
-        if self.folder_to_save_reports_to:
-            non_exception_reports = [
+        new_reports_iterator = iter(new_reports)
+        reports = [
+            (
+                next(new_reports_iterator)
+                if isinstance(pending_report, asyncio.Task)
+                else pending_report
+            )
+            for pending_report in pending_reports
+        ]
+        self._save_reports_to_folder_if_set(questions, reports)
+        return reports
+
+    async def _forecast_question_pages_in_pipeline(
+        self,
+        question_pages: AsyncIterator[list[MetaculusQuestion]],
+        return_exceptions: bool,
+        settings: ForecastPipelineSettings,
+    ) -> list[ForecastReport] | list[ForecastReport | BaseException]:
+        """
+        Loads questions into a pipeline where research workers research them
+        and forecast workers make and aggregate predictions from that
+        research. Reports are saved to the report sink as they finish.
+        """
+        finished_reports = self._load_finished_reports_if_resuming()
+        questions: list[MetaculusQuestion] = []
+        positions_of_pipeline_questions: list[int] = []
+        reports_by_position: dict[int, ForecastReport | BaseException] = {}
+
+        async def iterate_questions_to_forecast() -> (
+            AsyncIterator[MetaculusQuestion]
+        ):
+            async for page in question_pages:
+                for question in self._remove_previously_forecasted(page):
+                    questions.append(question)
+                    if question.id_of_post in finished_reports:
+                        reports_by_position[len(questions) - 1] = (
+                            finished_reports[question.id_of_post]
+                        )
+                    else:
+                        positions_of_pipeline_questions.append(
+                            len(questions) - 1
+                        )
+                        yield question
+
+        async def record_report(
+            index: int, report: ForecastReport | BaseException
+        ) -> None:
+            if isinstance(report, BaseException):
+                if not return_exceptions:
+                    raise report
+            elif self.report_sink is not None:
+                self.report_sink.add_report(report)
+            reports_by_position[positions_of_pipeline_questions[index]] = (
                 report
-                for report in reports
-                if not isinstance(report, BaseException)
-            ]
-            questions_as_list = list(questions)
-            file_path = self._create_file_path_to_save_to(questions_as_list)
-            ForecastReport.save_object_list_to_file_path(
-                non_exception_reports, file_path
             )
+
+        pipeline = AsyncPipeline(
+            [
+                PipelineStage(
+                    "research",
+                    settings.research_workers,
+                    self._research_question_in_pipeline,
+                ),
+                PipelineStage(
+                    "forecast",
+                    settings.forecast_workers,
+                    self._forecast_researched_question,
+                ),
+            ],
+            queue_size=settings.queue_size,
+        )
+        await pipeline.run(iterate_questions_to_forecast(), record_report)
+        if len(questions) != len(positions_of_pipeline_questions):
+            logger.info(
+                f"Resumed from report sink. Skipped {len(questions) - len(positions_of_pipeline_questions)} already finished questions"
+            )
+        reports = [reports_by_position[i] for i in range(len(questions))]
+        self._save_reports_to_folder_if_set(questions, reports)
         return reports
 
+    async def _research_question_in_pipeline(
+        self, question: MetaculusQuestion
+    ) -> _ResearchedQuestion:
+        await self._add_scratchpad(question)
+        cost_manager = MonetaryCostManager()
+        start_time = time.time()
+        with cost_manager:
+            research_results, research_errors = (
+                await self._run_research_reports(question)
+            )
+        return _ResearchedQuestion(
+            question=question,
+            research_results=research_results,
+            research_errors=research_errors,
+            cost_manager=cost_manager,
+            start_time=start_time,
+        )
+
+    async def _forecast_researched_question(
+        self, researched_question: _ResearchedQuestion
+    ) -> ForecastReport:
+        question = researched_question.question
+        with researched_question.cost_manager as cost_manager:
+            if self.adaptive_sampling is None:
+                valid_prediction_set, prediction_set_errors = (
+                    await self._make_predictions_from_research_reports(
+                        question, researched_question.research_results
+                    )
+                )
+            else:
+                valid_prediction_set, prediction_set_errors = (
+                    await self._make_predictions_adaptively(
+                        question,
+                        researched_question.research_results,
+                        self.adaptive_sampling,
+                        cost_manager,
+                        researched_question.start_time,
+                    )
+                )
+            report = await self._create_report(
+                question,
+                valid_prediction_set,
+                researched_question.research_errors + prediction_set_errors,
+                cost_manager,
+                researched_question.start_time,
+            )
+        if self.publish_reports_to_metaculus:
+            await report.publish_report_to_metaculus()
+        await self._remove_scratchpad(question)
+        return report
+
+    def _save_reports_to_folder_if_set(
+        self,
+        questions: list[MetaculusQuestion],
+        reports: Sequence[ForecastReport | BaseException],
+    ) -> None:
+        if not self.folder_to_save_reports_to:
+            return
+        non_exception_reports = [
+            report
+            for report in reports
+            if not isinstance(report, BaseException)
+        ]
+        file_path = self._create_file_path_to_save_to(questions)
+        ForecastReport.save_object_list_to_file_path(
+            non_exception_reports, file_path
+        )
+
+    def _remove_previously_forecasted(
+        self, questions: list[MetaculusQuestion]
+    ) -> list[MetaculusQuestion]:
+        if not self.skip_previously_forecasted_questions:
+            return questions
+        unforecasted_questions = [
+            question
+            for question in questions
+            if not question.already_forecasted
+        ]
+        if len(questions) != len(unforecasted_questions):
+            logger.info(
+                f"Skipping {len(questions) - len(unforecasted_questions)} previously forecasted questions"
+            )
+        return unforecasted_questions
+
     @abstractmethod
     async def run_research(self, question: MetaculusQuestion) -> str:
         """
@@ -200,58 +476,119 @@ class ForecastBot(ABC):
         """
         raise NotImplementedError("Subclass must implement this method")
 
+    def _get_question_priority(self, question: MetaculusQuestion) -> float:
+        """
+        Higher priority questions are started first when the scheduler
+        uses priority ordering (e.g. return a higher value for questions closing soon)
+        """
+        return 0
+
     async def summarize_research(
         self, question: MetaculusQuestion, research: str
     ) -> str:
         return f"{research[:2500]}..."
 
+    def _load_finished_reports_if_resuming(self) -> dict[int, ForecastReport]:
+        if not self.resume_from_report_sink:
+            return {}
+        assert self.report_sink is not None, "Report sink is not set"
+        return {
+            report.question.id_of_post: report
+            for report in self.report_sink.load_reports()
+        }
+
+    async def _run_and_record_individual_question(
+        self, question: MetaculusQuestion
+    ) -> ForecastReport:
+        report = await self.scheduler.run(
+            TaskType.QUESTION,
+            self._run_individual_question(question),
+            self._get_question_priority(question),
+        )
+        if self.report_sink is not None:
+            self.report_sink.add_report(report)
+        return report
+
     async def _run_individual_question(
         self, question: MetaculusQuestion
     ) -> ForecastReport:
-        scratchpad = await self._initialize_scratchpad(question)
-        async with self._scratch_pad_lock:
-            self._scratch_pads.append(scratchpad)
+        await self._add_scratchpad(question)
         with MonetaryCostManager() as cost_manager:
             start_time = time.time()
-            prediction_tasks = [
-                self._research_and_make_predictions(question)
-                for _ in range(self.research_reports_per_question)
-            ]
-            valid_prediction_set, research_errors = (
-                await self._gather_results_and_exceptions(prediction_tasks)
-            )
-            if research_errors:
-                logger.warning(
-                    f"Encountered errors while researching: {research_errors}"
+            if self.adaptive_sampling is None:
+                prediction_tasks = [
+                    self._research_and_make_predictions(question)
+                    for _ in range(self.research_reports_per_question)
+                ]
+                valid_prediction_set, research_errors = (
+                    await self._gather_results_and_exceptions(prediction_tasks)
                 )
-            prediction_errors = [
-                error
-                for prediction_set in valid_prediction_set
-                for error in prediction_set.errors
-            ]
-            all_errors = research_errors + prediction_errors
-
-            if len(valid_prediction_set) == 0:
-                raise RuntimeError(
-                    f"All {self.research_reports_per_question} research reports/predictions failed. "
-                    f"Research errors: {research_errors if research_errors else 'None'}, "
-                    f"Prediction errors: {prediction_errors if prediction_errors else 'None'}"
+            else:
+                research_results, research_errors = (
+                    await self._run_research_reports(question)
                 )
-            report_type = DataOrganizer.get_report_type_for_question_type(
-                type(question)
-            )
-            all_predictions = [
-                reasoned_prediction.prediction_value
-                for research_prediction_collection in valid_prediction_set
-                for reasoned_prediction in research_prediction_collection.predictions
-            ]
-            aggregated_prediction = await report_type.aggregate_predictions(
-                all_predictions,
+                valid_prediction_set, prediction_set_errors = (
+                    await self._make_predictions_adaptively(
+                        question,
+                        research_results,
+                        self.adaptive_sampling,
+                        cost_manager,
+                        start_time,
+                    )
+                )
+                research_errors += prediction_set_errors
+            report = await self._create_report(
                 question,
+                valid_prediction_set,
+                research_errors,
+                cost_manager,
+                start_time,
+            )
+        if self.publish_reports_to_metaculus:
+            await report.publish_report_to_metaculus()
+        await self._remove_scratchpad(question)
+        return report
+
+    async def _create_report(
+        self,
+        question: MetaculusQuestion,
+        valid_prediction_set: list[ResearchWithPredictions],
+        research_errors: list[str],
+        cost_manager: MonetaryCostManager,
+        start_time: float,
+    ) -> ForecastReport:
+        if research_errors:
+            logger.warning(
+                f"Encountered errors while researching: {research_errors}"
+            )
+        prediction_errors = [
+            error
+            for prediction_set in valid_prediction_set
+            for error in prediction_set.errors
+        ]
+        all_errors = research_errors + prediction_errors
+
+        if len(valid_prediction_set) == 0:
+            raise RuntimeError(
+                f"All {self.research_reports_per_question} research reports/predictions failed. "
+                f"Research errors: {research_errors if research_errors else 'None'}, "
+                f"Prediction errors: {prediction_errors if prediction_errors else 'None'}"
             )
-            end_time = time.time()
-            time_spent_in_minutes = (end_time - start_time) / 60
-            final_cost = cost_manager.current_usage
+        report_type = DataOrganizer.get_report_type_for_question_type(
+            type(question)
+        )
+        all_predictions = [
+            reasoned_prediction.prediction_value
+            for research_prediction_collection in valid_prediction_set
+            for reasoned_prediction in research_prediction_collection.predictions
+        ]
+        aggregated_prediction = await report_type.aggregate_predictions(
+            all_predictions,
+            question,
+        )
+        end_time = time.time()
+        time_spent_in_minutes = (end_time - start_time) / 60
+        final_cost = cost_manager.current_usage
 
         unified_explanation = self._create_unified_explanation(
             question,
@@ -260,68 +597,294 @@ class ForecastBot(ABC):
             final_cost,
             time_spent_in_minutes,
         )
-        report = report_type(
+        return report_type(
             question=question,
             prediction=aggregated_prediction,
             explanation=unified_explanation,
             price_estimate=final_cost,
             minutes_taken=time_spent_in_minutes,
             errors=all_errors,
+            predictions_used=len(all_predictions),
         )
-        if self.publish_reports_to_metaculus:
-            await report.publish_report_to_metaculus()
-        await self._remove_scratchpad(question)
-        return report
 
     async def _research_and_make_predictions(
         self, question: MetaculusQuestion
     ) -> ResearchWithPredictions:
-        research = await self.run_research(question)
+        research, summary_report = await self._research_and_summarize(question)
+        return await self._predict_from_research(
+            question, research, summary_report
+        )
+
+    async def _predict_from_research(
+        self, question: MetaculusQuestion, research: str, summary_report: str
+    ) -> ResearchWithPredictions:
+        valid_predictions, errors = await self._make_predictions(
+            question,
+            self._choose_research_to_forecast_with(research, summary_report),
+            self.predictions_per_research_report,
+        )
+        if errors:
+            logger.warning(f"Encountered errors while predicting: {errors}")
+        if len(valid_predictions) == 0:
+            raise RuntimeError(
+                f"All {self.predictions_per_research_report} predictions failed. Errors: {errors}"
+            )
+        return ResearchWithPredictions(
+            research_report=research,
+            summary_report=summary_report,
+            errors=errors,
+            predictions=valid_predictions,
+        )
+
+    async def _run_research_reports(
+        self, question: MetaculusQuestion
+    ) -> tuple[list[tuple[str, str]], list[str]]:
+        return await self._gather_results_and_exceptions(
+            [
+                self._research_and_summarize(question)
+                for _ in range(self.research_reports_per_question)
+            ]
+        )
+
+    async def _make_predictions_from_research_reports(
+        self,
+        question: MetaculusQuestion,
+        research_results: list[tuple[str, str]],
+    ) -> tuple[list[ResearchWithPredictions], list[str]]:
+        return await self._gather_results_and_exceptions(
+            [
+                self._predict_from_research(question, research, summary_report)
+                for research, summary_report in research_results
+            ]
+        )
+
+    async def _make_predictions_adaptively(
+        self,
+        question: MetaculusQuestion,
+        research_results: list[tuple[str, str]],
+        policy: AdaptiveSamplingPolicy,
+        cost_manager: MonetaryCostManager,
+        start_time: float,
+    ) -> tuple[list[ResearchWithPredictions], list[str]]:
+        """
+        Makes predictions from the research reports in waves until the policy
+        says to stop or each report has `predictions_per_research_report`
+        predictions. Returns the reports that got predictions, and an error
+        for each report whose predictions all failed.
+        """
+        collections = [
+            ResearchWithPredictions(
+                research_report=research,
+                summary_report=summary_report,
+                predictions=[],
+            )
+            for research, summary_report in research_results
+        ]
+        report_type = DataOrganizer.get_report_type_for_question_type(
+            type(question)
+        )
+        predictions_attempted = [0] * len(collections)
+        while True:
+            wave = policy.plan_wave(
+                predictions_attempted, self.predictions_per_research_report
+            )
+            if sum(wave) == 0:
+                break
+            reports_in_wave = [
+                i
+                for i, number_of_predictions in enumerate(wave)
+                if number_of_predictions > 0
+            ]
+            wave_results = await asyncio.gather(
+                *[
+                    self._make_predictions(
+                        question,
+                        self._choose_research_to_forecast_with(
+                            collections[i].research_report,
+                            collections[i].summary_report,
+                        ),
+                        wave[i],
+                    )
+                    for i in reports_in_wave
+                ]
+            )
+            for i, (valid_predictions, errors) in zip(
+                reports_in_wave, wave_results
+            ):
+                predictions_attempted[i] += wave[i]
+                collections[i].predictions.extend(valid_predictions)
+                collections[i].errors.extend(errors)
+            stopping_reason = policy.get_stopping_reason(
+                [
+                    prediction.prediction_value
+                    for collection in collections
+                    for prediction in collection.predictions
+                ],
+                report_type,
+                cost_manager.current_usage,
+                (time.time() - start_time) / 60,
+            )
+            if stopping_reason is not None:
+                logger.info(
+                    f"Stopped sampling predictions for {question.page_url} after {sum(predictions_attempted)} attempts. {stopping_reason}"
+                )
+                break
+
+        collections_with_predictions = []
+        failed_collection_errors = []
+        for collection, attempted in zip(collections, predictions_attempted):
+            if collection.predictions:
+                collections_with_predictions.append(collection)
+            elif attempted > 0:
+                failed_collection_errors.append(
+                    f"RuntimeError: All {attempted} predictions failed. Errors: {collection.errors}"
+                )
+        return collections_with_predictions, failed_collection_errors
+
+    async def _research_and_summarize(
+        self, question: MetaculusQuestion
+    ) -> tuple[str, str]:
+        priority = self._get_question_priority(question)
+        research = await self.scheduler.run(
+            TaskType.RESEARCH, self.run_research(question), priority
+        )
         summary_report = await self.summarize_research(question, research)
-        research_to_use = (
+        return research, summary_report
+
+    def _choose_research_to_forecast_with(
+        self, research: str, summary_report: str
+    ) -> str:
+        return (
             summary_report
             if self.use_research_summary_to_forecast
             else research
         )
 
+    async def _make_predictions(
+        self,
+        question: MetaculusQuestion,
+        research_to_use: str,
+        number_of_predictions: int,
+    ) -> tuple[list[ReasonedPrediction[Any]], list[str]]:
+        priority = self._get_question_priority(question)
         if isinstance(question, BinaryQuestion):
             forecast_function = lambda q, r: self._run_forecast_on_binary(q, r)
+            forecasts_function = lambda q, r, n: self._run_forecasts_on_binary(
+                q, r, n
+            )
         elif isinstance(question, MultipleChoiceQuestion):
             forecast_function = (
                 lambda q, r: self._run_forecast_on_multiple_choice(q, r)
             )
+            forecasts_function = (
+                lambda q, r, n: self._run_forecasts_on_multiple_choice(q, r, n)
+            )
         elif isinstance(question, NumericQuestion):
             forecast_function = lambda q, r: self._run_forecast_on_numeric(
                 q, r
             )
+            forecasts_function = (
+                lambda q, r, n: self._run_forecasts_on_numeric(q, r, n)
+            )
         elif isinstance(question, DateQuestion):
             raise NotImplementedError("Date questions not supported yet")
         else:
             raise ValueError(f"Unknown question type: {type(question)}")
 
-        tasks = cast(
-            list[Coroutine[Any, Any, ReasonedPrediction[Any]]],
-            [
-                forecast_function(question, research_to_use)
-                for _ in range(self.predictions_per_research_report)
+        if self.make_predictions_in_one_request:
+            prediction_results = await self.scheduler.run(
+                TaskType.PREDICTION,
+                forecasts_function(
+                    question,
+                    research_to_use,
+                    number_of_predictions,
+                ),
+                priority,
+            )
+            valid_predictions, errors = self._separate_results_and_exceptions(
+                prediction_results
+            )
+        else:
+            tasks = cast(
+                list[Coroutine[Any, Any, ReasonedPrediction[Any]]],
+                [
+                    self.scheduler.run(
+                        TaskType.PREDICTION,
+                        forecast_function(question, research_to_use),
+                        priority,
+                    )
+                    for _ in range(number_of_predictions)
+                ],
+            )
+            valid_predictions, errors = (
+                await self._gather_results_and_exceptions(tasks)
+            )
+        return valid_predictions, errors
+
+    async def _run_forecasts_on_binary(
+        self, question: BinaryQuestion, research: str, number_of_forecasts: int
+    ) -> Sequence[ReasonedPrediction[float] | BaseException]:
+        """
+        Makes several forecasts on a question at once. Each forecast that
+        fails is returned as its exception. Runs `_run_forecast_on_binary`
+        once per forecast unless overridden.
+        """
+        return await asyncio.gather(
+            *[
+                self._run_forecast_on_binary(question, research)
+                for _ in range(number_of_forecasts)
             ],
+            return_exceptions=True,
         )
-        valid_predictions, errors = await self._gather_results_and_exceptions(
-            tasks
+
+    async def _run_forecasts_on_multiple_choice(
+        self,
+        question: MultipleChoiceQuestion,
+        research: str,
+        number_of_forecasts: int,
+    ) -> Sequence[ReasonedPrediction[PredictedOptionList] | BaseException]:
+        return await asyncio.gather(
+            *[
+                self._run_forecast_on_multiple_choice(question, research)
+                for _ in range(number_of_forecasts)
+            ],
+            return_exceptions=True,
         )
-        if errors:
-            logger.warning(f"Encountered errors while predicting: {errors}")
-        if len(valid_predictions) == 0:
-            raise RuntimeError(
-                f"All {self.predictions_per_research_report} predictions failed. Errors: {errors}"
-            )
-        return ResearchWithPredictions(
-            research_report=research,
-            summary_report=summary_report,
-            errors=errors,
-            predictions=valid_predictions,
+
+    async def _run_forecasts_on_numeric(
+        self,
+        question: NumericQuestion,
+        research: str,
+        number_of_forecasts: int,
+    ) -> Sequence[ReasonedPrediction[NumericDistribution] | BaseException]:
+        return await asyncio.gather(
+            *[
+                self._run_forecast_on_numeric(question, research)
+                for _ in range(number_of_forecasts)
+            ],
+            return_exceptions=True,
         )
 
+    @staticmethod
+    def _parse_each_reasoning(
+        reasonings: Sequence[str | BaseException],
+        parse: Callable[[str], ReasonedPrediction[T]],
+    ) -> list[ReasonedPrediction[T] | BaseException]:
+        """
+        Turns each sampled reasoning into a prediction, returning the
+        exception for reasonings that failed or could not be parsed
+        """
+        predictions: list[ReasonedPrediction[T] | BaseException] = []
+        for reasoning in reasonings:
+            if isinstance(reasoning, BaseException):
+                predictions.append(reasoning)
+                continue
+            try:
+                predictions.append(parse(reasoning))
+            except Exception as e:
+                predictions.append(e)
+        return predictions
+
     @abstractmethod
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
@@ -473,6 +1036,12 @@ class ForecastBot(ABC):
         self, coroutines: list[Coroutine[Any, Any, T]]
     ) -> tuple[list[T], list[str]]:
         results = await asyncio.gather(*coroutines, return_exceptions=True)
+        return self._separate_results_and_exceptions(results)
+
+    @staticmethod
+    def _separate_results_and_exceptions(
+        results: Sequence[T | BaseException],
+    ) -> tuple[list[T], list[str]]:
         valid_results = [
             result
             for result in results
@@ -497,6 +1066,11 @@ class ForecastBot(ABC):
         new_scratchpad = ScratchPad(question=question)
         return new_scratchpad
 
+    async def _add_scratchpad(self, question: MetaculusQuestion) -> None:
+        scratchpad = await self._initialize_scratchpad(question)
+        async with self._scratch_pad_lock:
+            self._scratch_pads.append(scratchpad)
+
     async def _remove_scratchpad(self, question: MetaculusQuestion) -> None:
         async with self._scratch_pad_lock:
             self._scratch_pads = [
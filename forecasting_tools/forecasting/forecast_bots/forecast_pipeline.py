@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastPipelineSettings(BaseModel):
+    """
+    Sizes of the stages of ForecastBot's pipeline mode. Research and
+    forecasting each get their own pool of workers, and `queue_size` bounds
+    how many questions can wait before each stage (so a slow stage holds
+    back the ones before it instead of letting work pile up in memory).
+    """
+
+    research_workers: int = Field(default=4, ge=1)
+    forecast_workers: int = Field(default=4, ge=1)
+    queue_size: int = Field(default=8, ge=1)
+
+
+@dataclass
+class PipelineStage:
+    name: str
+    worker_count: int
+    process: Callable[[Any], Awaitable[Any]]
+
+
+@dataclass
+class _PipelineItem:
+    index: int
+    value: Any
+
+
+class _EndOfInput:
+    pass
+
+
+class AsyncPipeline:
+    """
+    Runs items through stages connected by bounded queues. Each stage has its
+    own pool of workers, so every stage works on different items at the same
+    time, and an item only waits for the stage it is in. An item that raises
+    an exception in a stage skips the stages after it.
+
+    Each item's result (or exception) is given to `handle_result` along with
+    the item's position in `items`, in the order items finish. Results are
+    handled one at a time, so `handle_result` can write to shared state
+    without a lock. If loading items or handling a result raises, every
+    worker is cancelled and the exception is raised.
+    """
+
+    def __init__(self, stages: list[PipelineStage], queue_size: int) -> None:
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        if queue_size < 1:
+            raise ValueError("Queue size must be at least 1")
+        if any(stage.worker_count < 1 for stage in stages):
+            raise ValueError("Each stage needs at least one worker")
+        self.stages = stages
+        self.queue_size = queue_size
+
+    async def run(
+        self,
+        items: AsyncIterator[Any],
+        handle_result: Callable[[int, Any], Awaitable[None]],
+    ) -> int:
+        """
+        Returns how many items went through the pipeline
+        """
+        queues: list[asyncio.Queue[_PipelineItem | _EndOfInput]] = [
+            asyncio.Queue(maxsize=self.queue_size)
+            for _ in range(len(self.stages) + 1)
+        ]
+        feeder = asyncio.create_task(
+            self.__feed(items, queues[0], self.stages[0].worker_count)
+        )
+        stage_runners = [
+            asyncio.create_task(
+                self.__run_stage(
+                    stage,
+                    queues[i],
+                    queues[i + 1],
+                    (
+                        self.stages[i + 1].worker_count
+                        if i + 1 < len(self.stages)
+                        else 1
+                    ),
+                )
+            )
+            for i, stage in enumerate(self.stages)
+        ]
+        collector = asyncio.create_task(
+            self.__collect_results(queues[-1], handle_result)
+        )
+        tasks = [feeder, *stage_runners, collector]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return feeder.result()
+
+    @staticmethod
+    async def __feed(
+        items: AsyncIterator[Any],
+        queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+        worker_count: int,
+    ) -> int:
+        number_of_items = 0
+        async for item in items:
+            await queue.put(_PipelineItem(number_of_items, item))
+            number_of_items += 1
+        for _ in range(worker_count):
+            await queue.put(_EndOfInput())
+        return number_of_items
+
+    @classmethod
+    async def __run_stage(
+        cls,
+        stage: PipelineStage,
+        input_queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+        output_queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+        number_of_next_workers: int,
+    ) -> None:
+        await asyncio.gather(
+            *[
+                cls.__run_worker(stage, input_queue, output_queue)
+                for _ in range(stage.worker_count)
+            ]
+        )
+        for _ in range(number_of_next_workers):
+            await output_queue.put(_EndOfInput())
+
+    @staticmethod
+    async def __run_worker(
+        stage: PipelineStage,
+        input_queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+        output_queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+    ) -> None:
+        while True:
+            item = await input_queue.get()
+            if isinstance(item, _EndOfInput):
+                return
+            if not isinstance(item.value, BaseException):
+                try:
+                    item.value = await stage.process(item.value)
+                except Exception as e:
+                    logger.debug(
+                        f"Item {item.index} failed in the {stage.name} stage: {e}"
+                    )
+                    item.value = e
+            await output_queue.put(item)
+
+    @staticmethod
+    async def __collect_results(
+        queue: asyncio.Queue[_PipelineItem | _EndOfInput],
+        handle_result: Callable[[int, Any], Awaitable[None]],
+    ) -> None:
+        while True:
+            item = await queue.get()
+            if isinstance(item, _EndOfInput):
+                return
+            await handle_result(item.index, item.value)
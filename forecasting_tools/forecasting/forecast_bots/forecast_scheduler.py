@@ -0,0 +1,144 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from enum import Enum
+from typing import Any, Coroutine, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TaskType(Enum):
+    QUESTION = "question"
+    RESEARCH = "research"
+    PREDICTION = "prediction"
+
+
+class SchedulingOrder(Enum):
+    FIFO = "fifo"
+    PRIORITY = "priority"
+
+
+class _BoundedLane:
+    """
+    A semaphore-like slot pool whose waiters are released in a defined order.
+    When a slot frees up it is handed directly to the next waiter so
+    late arrivals cannot jump ahead of tasks that are already queued.
+    """
+
+    def __init__(self, limit: int | None, order: SchedulingOrder) -> None:
+        self.limit = limit
+        self.order = order
+        self.active: int = 0
+        self.__waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self.__counter = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self.__waiters if not future.done())
+
+    async def acquire(self, priority: float) -> None:
+        if self.limit is None or (
+            self.active < self.limit and not self.__waiters
+        ):
+            self.active += 1
+            return
+
+        sort_key = -priority if self.order == SchedulingOrder.PRIORITY else 0
+        future: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(
+            self.__waiters, (sort_key, next(self.__counter), future)
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self.__waiters:
+            _, _, future = heapq.heappop(self.__waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+        assert self.active >= 0, "Released more slots than were acquired"
+
+
+class ForecastScheduler:
+    """
+    Bounds how much work a ForecastBot runs at once.
+
+    Questions, research calls, and prediction calls each get their own limit
+    so that a large tournament does not launch every LLM call at the same time.
+    Work waiting for a slot is started either in the order it was submitted
+    (FIFO) or highest priority first (PRIORITY, ties broken by submission order).
+    A limit of None means that type of work is not bounded.
+
+    The limits are separate pools, and work only ever waits on a pool
+    "below" the one it holds (question -> research -> prediction)
+    so nested work cannot deadlock.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_questions: int | None = 20,
+        max_concurrent_research: int | None = 10,
+        max_concurrent_predictions: int | None = 20,
+        order: SchedulingOrder = SchedulingOrder.FIFO,
+    ) -> None:
+        limits = {
+            TaskType.QUESTION: max_concurrent_questions,
+            TaskType.RESEARCH: max_concurrent_research,
+            TaskType.PREDICTION: max_concurrent_predictions,
+        }
+        for task_type, limit in limits.items():
+            if limit is not None and limit <= 0:
+                raise ValueError(
+                    f"Concurrency limit for {task_type.value} tasks must be greater than 0"
+                )
+        self.max_concurrent_questions = max_concurrent_questions
+        self.max_concurrent_research = max_concurrent_research
+        self.max_concurrent_predictions = max_concurrent_predictions
+        self.order = order
+        self.__lanes = {
+            task_type: _BoundedLane(limit, order)
+            for task_type, limit in limits.items()
+        }
+
+    async def run(
+        self,
+        task_type: TaskType,
+        coroutine: Coroutine[Any, Any, T],
+        priority: float = 0,
+    ) -> T:
+        lane = self.__lanes[task_type]
+        try:
+            await lane.acquire(priority)
+        except BaseException:
+            coroutine.close()
+            raise
+        try:
+            return await coroutine
+        finally:
+            lane.release()
+
+    def get_active_count(self, task_type: TaskType) -> int:
+        return self.__lanes[task_type].active
+
+    def get_waiting_count(self, task_type: TaskType) -> int:
+        return self.__lanes[task_type].waiting
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"max_concurrent_questions={self.max_concurrent_questions}, "
+            f"max_concurrent_research={self.max_concurrent_research}, "
+            f"max_concurrent_predictions={self.max_concurrent_predictions}, "
+            f"order={self.order.value})"
+        )
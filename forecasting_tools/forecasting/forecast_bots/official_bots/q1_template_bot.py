@@ -1,9 +1,10 @@
-import asyncio
 import logging
 import os
 from datetime import datetime
+from typing import Any
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.ai_utils.prompt_caching import CacheablePrompt
 from forecasting_tools.ai_models.general_llm import GeneralLlm
 from forecasting_tools.data_models.forecast_report import ReasonedPrediction
 from forecasting_tools.data_models.multiple_choice_report import (
@@ -17,6 +18,9 @@ from forecasting_tools.data_models.questions import (
     NumericQuestion,
 )
 from forecasting_tools.forecast_bots.forecast_bot import ForecastBot
+from forecasting_tools.forecast_bots.forecast_scheduler import (
+    ForecastScheduler,
+)
 from forecasting_tools.forecast_helpers.asknews_searcher import AskNewsSearcher
 from forecasting_tools.forecast_helpers.prediction_extractor import (
     PredictionExtractor,
@@ -54,30 +58,41 @@ class Q1TemplateBot(ForecastBot):
     ```
     """
 
-    _max_concurrent_questions = 2  # Set this to whatever works for your search-provider/ai-model rate limits
-    _concurrency_limiter = asyncio.Semaphore(_max_concurrent_questions)
+    _max_concurrent_research = 2  # Set this to whatever works for your search-provider/ai-model rate limits
+
+    def __init__(
+        self, *, scheduler: ForecastScheduler | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(
+            scheduler=scheduler
+            or ForecastScheduler(
+                max_concurrent_questions=None,
+                max_concurrent_research=self._max_concurrent_research,
+                max_concurrent_predictions=None,
+            ),
+            **kwargs,
+        )
 
     async def run_research(self, question: MetaculusQuestion) -> str:
-        async with self._concurrency_limiter:
+        research = ""
+        if os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET"):
+            research = await AskNewsSearcher().get_formatted_news_async(
+                question.question_text
+            )
+        elif os.getenv("EXA_API_KEY"):
+            research = await self._call_exa_smart_searcher(
+                question.question_text
+            )
+        elif os.getenv("PERPLEXITY_API_KEY"):
+            research = await self._call_perplexity(question.question_text)
+        elif os.getenv("OPENROUTER_API_KEY"):
+            research = await self._call_perplexity(
+                question.question_text, use_open_router=True
+            )
+        else:
             research = ""
-            if os.getenv("ASKNEWS_CLIENT_ID") and os.getenv("ASKNEWS_SECRET"):
-                research = AskNewsSearcher().get_formatted_news(
-                    question.question_text
-                )
-            elif os.getenv("EXA_API_KEY"):
-                research = await self._call_exa_smart_searcher(
-                    question.question_text
-                )
-            elif os.getenv("PERPLEXITY_API_KEY"):
-                research = await self._call_perplexity(question.question_text)
-            elif os.getenv("OPENROUTER_API_KEY"):
-                research = await self._call_perplexity(
-                    question.question_text, use_open_router=True
-                )
-            else:
-                research = ""
-            logger.info(f"Found Research for {question.page_url}:\n{research}")
-            return research
+        logger.info(f"Found Research for {question.page_url}:\n{research}")
+        return research
 
     async def _call_perplexity(
         self, question: str, use_open_router: bool = False
@@ -142,11 +157,41 @@ class Q1TemplateBot(ForecastBot):
             raise ValueError("No API key for final_decision_llm found")
         return model
 
+    async def _invoke_many_for_reasonings(
+        self, prompt: CacheablePrompt, number_of_reasonings: int
+    ) -> list[str | BaseException]:
+        responses = await self._get_final_decision_llm().invoke_many(
+            prompt, number_of_reasonings
+        )
+        return [
+            response if isinstance(response, BaseException) else response.data
+            for response in responses
+        ]
+
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
     ) -> ReasonedPrediction[float]:
-        prompt = clean_indents(
-            f"""
+        prompt = self._create_binary_prompt(question, research)
+        reasoning = await self._get_final_decision_llm().invoke(prompt)
+        return self._parse_binary_forecast(question, reasoning)
+
+    async def _run_forecasts_on_binary(
+        self, question: BinaryQuestion, research: str, number_of_forecasts: int
+    ) -> list[ReasonedPrediction[float] | BaseException]:
+        reasonings = await self._invoke_many_for_reasonings(
+            self._create_binary_prompt(question, research), number_of_forecasts
+        )
+        return self._parse_each_reasoning(
+            reasonings,
+            lambda reasoning: self._parse_binary_forecast(question, reasoning),
+        )
+
+    def _create_binary_prompt(
+        self, question: BinaryQuestion, research: str
+    ) -> CacheablePrompt:
+        return CacheablePrompt(
+            prefix=clean_indents(
+                f"""
             You are a professional forecaster interviewing for a job.
 
             Your interview question is:
@@ -164,7 +209,10 @@ class Q1TemplateBot(ForecastBot):
 
             Your research assistant says:
             {research}
-
+            """
+            ),
+            suffix=clean_indents(
+                f"""
             Today is {datetime.now().strftime("%Y-%m-%d")}.
 
             Before answering you write:
@@ -177,8 +225,12 @@ class Q1TemplateBot(ForecastBot):
 
             The last thing you write is your final answer as: "Probability: ZZ%", 0-100
             """
+            ),
         )
-        reasoning = await self._get_final_decision_llm().invoke(prompt)
+
+    def _parse_binary_forecast(
+        self, question: BinaryQuestion, reasoning: str
+    ) -> ReasonedPrediction[float]:
         prediction: float = PredictionExtractor.extract_last_percentage_value(
             reasoning, max_prediction=1, min_prediction=0
         )
@@ -192,8 +244,33 @@ class Q1TemplateBot(ForecastBot):
     async def _run_forecast_on_multiple_choice(
         self, question: MultipleChoiceQuestion, research: str
     ) -> ReasonedPrediction[PredictedOptionList]:
-        prompt = clean_indents(
-            f"""
+        prompt = self._create_multiple_choice_prompt(question, research)
+        reasoning = await self._get_final_decision_llm().invoke(prompt)
+        return self._parse_multiple_choice_forecast(question, reasoning)
+
+    async def _run_forecasts_on_multiple_choice(
+        self,
+        question: MultipleChoiceQuestion,
+        research: str,
+        number_of_forecasts: int,
+    ) -> list[ReasonedPrediction[PredictedOptionList] | BaseException]:
+        reasonings = await self._invoke_many_for_reasonings(
+            self._create_multiple_choice_prompt(question, research),
+            number_of_forecasts,
+        )
+        return self._parse_each_reasoning(
+            reasonings,
+            lambda reasoning: self._parse_multiple_choice_forecast(
+                question, reasoning
+            ),
+        )
+
+    def _create_multiple_choice_prompt(
+        self, question: MultipleChoiceQuestion, research: str
+    ) -> CacheablePrompt:
+        return CacheablePrompt(
+            prefix=clean_indents(
+                f"""
             You are a professional forecaster interviewing for a job.
 
             Your interview question is:
@@ -212,7 +289,10 @@ class Q1TemplateBot(ForecastBot):
 
             Your research assistant says:
             {research}
-
+            """
+            ),
+            suffix=clean_indents(
+                f"""
             Today is {datetime.now().strftime("%Y-%m-%d")}.
 
             Before answering you write:
@@ -228,8 +308,12 @@ class Q1TemplateBot(ForecastBot):
             ...
             Option_N: Probability_N
             """
+            ),
         )
-        reasoning = await self._get_final_decision_llm().invoke(prompt)
+
+    def _parse_multiple_choice_forecast(
+        self, question: MultipleChoiceQuestion, reasoning: str
+    ) -> ReasonedPrediction[PredictedOptionList]:
         prediction: PredictedOptionList = (
             PredictionExtractor.extract_option_list_with_percentage_afterwards(
                 reasoning, question.options
@@ -245,11 +329,36 @@ class Q1TemplateBot(ForecastBot):
     async def _run_forecast_on_numeric(
         self, question: NumericQuestion, research: str
     ) -> ReasonedPrediction[NumericDistribution]:
+        prompt = self._create_numeric_prompt(question, research)
+        reasoning = await self._get_final_decision_llm().invoke(prompt)
+        return self._parse_numeric_forecast(question, reasoning)
+
+    async def _run_forecasts_on_numeric(
+        self,
+        question: NumericQuestion,
+        research: str,
+        number_of_forecasts: int,
+    ) -> list[ReasonedPrediction[NumericDistribution] | BaseException]:
+        reasonings = await self._invoke_many_for_reasonings(
+            self._create_numeric_prompt(question, research),
+            number_of_forecasts,
+        )
+        return self._parse_each_reasoning(
+            reasonings,
+            lambda reasoning: self._parse_numeric_forecast(
+                question, reasoning
+            ),
+        )
+
+    def _create_numeric_prompt(
+        self, question: NumericQuestion, research: str
+    ) -> CacheablePrompt:
         upper_bound_message, lower_bound_message = (
             self._create_upper_and_lower_bound_messages(question)
         )
-        prompt = clean_indents(
-            f"""
+        return CacheablePrompt(
+            prefix=clean_indents(
+                f"""
             You are a professional forecaster interviewing for a job.
 
             Your interview question is:
@@ -265,7 +374,10 @@ class Q1TemplateBot(ForecastBot):
 
             Your research assistant says:
             {research}
-
+            """
+            ),
+            suffix=clean_indents(
+                f"""
             Today is {datetime.now().strftime("%Y-%m-%d")}.
 
             {lower_bound_message}
@@ -296,8 +408,12 @@ class Q1TemplateBot(ForecastBot):
             Percentile 90: XX
             "
             """
+            ),
         )
-        reasoning = await self._get_final_decision_llm().invoke(prompt)
+
+    def _parse_numeric_forecast(
+        self, question: NumericQuestion, reasoning: str
+    ) -> ReasonedPrediction[NumericDistribution]:
         prediction: NumericDistribution = (
             PredictionExtractor.extract_numeric_distribution_from_list_of_percentile_number_and_probability(
                 reasoning, question
@@ -15,5 +15,7 @@ class Q4TemplateBot(Q3TemplateBot):
     """
 
     async def run_research(self, question: MetaculusQuestion) -> str:
-        news = AskNewsSearcher().get_formatted_news(question.question_text)
+        news = await AskNewsSearcher().get_formatted_news_async(
+            question.question_text
+        )
         return news
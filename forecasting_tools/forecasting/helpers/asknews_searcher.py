@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import json
+import logging
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional, Union
-from urllib.parse import quote, urlencode
+from urllib.parse import quote
 
-import httpx
-from httpx import Auth, Request
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+from forecasting_tools.ai_models.resource_managers.rate_limiter_registry import (
+    RateLimiterRegistry,
+)
+from forecasting_tools.ai_models.resource_managers.request_coalescer import (
+    RequestCoalescer,
+)
+
+logger = logging.getLogger(__name__)
 
 # NOTE: Until there is more need for asknews endpoints, this is a custom implementation
 # That does not use the SDK. As of Feb 1 2025 there were dependency conflicts
@@ -29,79 +41,65 @@ def encode_client_secret_basic(client_id: str, client_secret: str) -> str:
     return f"Basic {auth}"
 
 
-class OAuth2ClientCredentials(Auth):
+class AskNewsSearcher:
+    """
+    Requests go through a pooled aiohttp session (see HttpSessionPool).
+    OAuth tokens are cached for the whole process, so new searchers with the
+    same credentials reuse them, and search results are cached for
+    RESULT_CACHE_TIME_TO_LIVE_IN_SECONDS keyed on the search parameters
+    (query, strategy, time window, etc.).
+    """
+
+    TOKEN_EXPIRY_MARGIN_IN_SECONDS = 60
+    RESULT_CACHE_TIME_TO_LIVE_IN_SECONDS = 15 * 60
+    _token_cache: dict[tuple[str, str], tuple[str, float]] = {}
+    _result_cache: dict[str, tuple[float, SearchResponse]] = {}
+
     def __init__(
-        self, client_id: str, client_secret: str, token_url: str
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        session_pool: HttpSessionPool | None = None,
     ) -> None:
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.token_url = token_url
-        self.token: Optional[str] = None
-        self.token_expires: Optional[float] = None
-
-    def _build_token_request(self) -> Request:
-        return Request(
-            method="POST",
-            url=self.token_url,
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": encode_client_secret_basic(
-                    self.client_id, self.client_secret
-                ),
-            },
-            content=urlencode(
-                {
-                    "grant_type": "client_credentials",
-                    "scope": "news openid offline",
-                }
-            ),
-        )
-
-    async def async_auth_flow(self, request: Request) -> httpx.AsyncClient:
-        if not self.token or (
-            self.token_expires
-            and datetime.now().timestamp() > self.token_expires
-        ):
-            token_request = self._build_token_request()
-            async with httpx.AsyncClient() as client:
-                response = await client.send(token_request)
-                response.raise_for_status()
-                data = response.json()
-                self.token = data["access_token"]
-                self.token_expires = (
-                    datetime.now().timestamp() + data["expires_in"]
-                )
-
-        request.headers["Authorization"] = f"Bearer {self.token}"
-        yield request
+        self.client_id = client_id or os.getenv("ASKNEWS_CLIENT_ID")
+        self.client_secret = client_secret or os.getenv("ASKNEWS_SECRET")
+        self.base_url = "https://api.asknews.app/v1"
+        self.token_url = "https://auth.asknews.app/oauth2/token"
+        self.session_pool = session_pool or HttpSessionPool.get_shared_pool()
 
+        if not self.client_id or not self.client_secret:
+            raise ValueError("ASKNEWS_CLIENT_ID or ASKNEWS_SECRET is not set")
 
-class AskNewsSearcher:
+        self.rate_limiter_name = RateLimiterRegistry.make_name(
+            "asknews", api_key=self.client_id
+        )
 
     def get_formatted_news(self, query: str) -> str:
+        """
+        Blocks until done, so use get_formatted_news_async from async code
+        """
+        return asyncio.run(self.__get_formatted_news_and_close_session(query))
+
+    async def get_formatted_news_async(self, query: str) -> str:
         """
         Use the AskNews `news` endpoint to get news context for your query.
         The full API reference can be found here: https://docs.asknews.app/en/reference#get-/v1/news/search
         """
-
-        # get the latest news related to the query (within the past 48 hours)
-        hot_response = asyncio.run(
+        hot_response, historical_response = await asyncio.gather(
+            # get the latest news related to the query (within the past 48 hours)
             self.search_news(
                 query=query,  # your natural language query
                 n_articles=6,  # control the number of articles to include in the context, originally 5
                 return_type="both",
                 strategy="latest news",  # enforces looking at the latest news only
-            )
-        )
-
-        # get context from the "historical" database that contains a news archive going back to 2023
-        historical_response = asyncio.run(
+            ),
+            # get context from the "historical" database that contains a news archive going back to 2023
             self.search_news(
                 query=query,
                 n_articles=10,
                 return_type="both",
                 strategy="news knowledge",  # looks for relevant news within the past 60 days
-            )
+            ),
         )
 
         hot_articles = hot_response.as_dicts
@@ -109,34 +107,10 @@ class AskNewsSearcher:
         formatted_articles = "Here are the relevant news articles:\n\n"
 
         if hot_articles:
-            # Convert pub_date strings to datetime objects for sorting
-            for article in hot_articles:
-                article["pub_date"] = datetime.fromisoformat(
-                    article["pub_date"].replace("Z", "+00:00")
-                )
-
-            hot_articles = sorted(
-                hot_articles, key=lambda x: x["pub_date"], reverse=True
-            )
-
-            for article in hot_articles:
-                pub_date = article["pub_date"].strftime("%B %d, %Y %I:%M %p")
-                formatted_articles += f"**{article['eng_title']}**\n{article['summary']}\nOriginal language: {article['language']}\nPublish date: {pub_date}\nSource:[{article['source_id']}]({article['article_url']})\n\n"
+            formatted_articles += self.__format_articles(hot_articles)
 
         if historical_articles:
-            # Convert pub_date strings to datetime objects for sorting
-            for article in historical_articles:
-                article["pub_date"] = datetime.fromisoformat(
-                    article["pub_date"].replace("Z", "+00:00")
-                )
-
-            historical_articles = sorted(
-                historical_articles, key=lambda x: x["pub_date"], reverse=True
-            )
-
-            for article in historical_articles:
-                pub_date = article["pub_date"].strftime("%B %d, %Y %I:%M %p")
-                formatted_articles += f"**{article['eng_title']}**\n{article['summary']}\nOriginal language: {article['language']}\nPublish date: {pub_date}\nSource:[{article['source_id']}]({article['article_url']})\n\n"
+            formatted_articles += self.__format_articles(historical_articles)
 
         if not hot_articles and not historical_articles:
             formatted_articles += "No articles were found.\n\n"
@@ -144,25 +118,34 @@ class AskNewsSearcher:
 
         return formatted_articles
 
-    def __init__(
-        self,
-        client_id: Optional[str] = None,
-        client_secret: Optional[str] = None,
-    ) -> None:
-        self.client_id = client_id or os.getenv("ASKNEWS_CLIENT_ID")
-        self.client_secret = client_secret or os.getenv("ASKNEWS_SECRET")
-        self.base_url = "https://api.asknews.app/v1"
-        self.token_url = "https://auth.asknews.app/oauth2/token"
-
-        if not self.client_id or not self.client_secret:
-            raise ValueError("ASKNEWS_CLIENT_ID or ASKNEWS_SECRET is not set")
-
-        self.auth = OAuth2ClientCredentials(
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            token_url=self.token_url,
+    async def __get_formatted_news_and_close_session(self, query: str) -> str:
+        try:
+            return await self.get_formatted_news_async(query)
+        finally:
+            await self.session_pool.close()
+
+    @staticmethod
+    def __format_articles(articles: List[Dict[str, Any]]) -> str:
+        # Articles may be shared with the result cache, so they are not modified
+        articles_with_dates = [
+            (
+                datetime.fromisoformat(
+                    article["pub_date"].replace("Z", "+00:00")
+                ),
+                article,
+            )
+            for article in articles
+        ]
+        articles_with_dates = sorted(
+            articles_with_dates, key=lambda x: x[0], reverse=True
         )
 
+        formatted_articles = ""
+        for publish_date, article in articles_with_dates:
+            pub_date = publish_date.strftime("%B %d, %Y %I:%M %p")
+            formatted_articles += f"**{article['eng_title']}**\n{article['summary']}\nOriginal language: {article['language']}\nPublish date: {pub_date}\nSource:[{article['source_id']}]({article['article_url']})\n\n"
+        return formatted_articles
+
     async def search_news(
         self,  # NOSONAR
         query: str = "",
@@ -223,15 +206,122 @@ class AskNewsSearcher:
 
         params = {k: v for k, v in params.items() if v is not None}
 
-        async with httpx.AsyncClient(auth=self.auth) as client:
-            response = await client.get(
-                f"{self.base_url}/news/search",
-                params=params,
-                headers={"Accept": "application/json"},
-            )
+        cache_key = f"{self.rate_limiter_name}/search/{json.dumps(params, sort_keys=True, default=str)}"
+        cached_result = self._result_cache.get(cache_key)
+        if (
+            cached_result is not None
+            and time.monotonic() - cached_result[0]
+            < self.RESULT_CACHE_TIME_TO_LIVE_IN_SECONDS
+        ):
+            logger.debug(f"Using cached AskNews results for {cache_key}")
+            return cached_result[1]
+
+        data = await RequestCoalescer.run(
+            cache_key,
+            lambda: self.__get_search_results(params),
+        )
+        search_response = SearchResponse(
+            as_string=data.get("as_string"), as_dicts=data.get("as_dicts")
+        )
+        self.__add_to_result_cache(cache_key, search_response)
+        return search_response
+
+    async def __get_search_results(
+        self, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        session = await self.session_pool.get_session()
+        for is_last_try in (False, True):
+            token = await self._get_access_token()
+            async with RateLimiterRegistry.limit(self.rate_limiter_name):
+                async with session.get(
+                    f"{self.base_url}/news/search",
+                    params=self.__to_query_params(params),
+                    headers={
+                        "Accept": "application/json",
+                        "Authorization": f"Bearer {token}",
+                    },
+                ) as response:
+                    if response.status == 401 and not is_last_try:
+                        logger.info(
+                            "AskNews token was rejected, refreshing it"
+                        )
+                        self._token_cache.pop(self.__token_cache_key, None)
+                        continue
+                    response.raise_for_status()
+                    result: dict[str, Any] = await response.json()
+                    return result
+        raise RuntimeError("AskNews search loop exited without a response")
+
+    async def _get_access_token(self) -> str:
+        cached_token = self._token_cache.get(self.__token_cache_key)
+        if cached_token is not None and time.time() < cached_token[1]:
+            return cached_token[0]
+        return await RequestCoalescer.run(
+            f"{self.rate_limiter_name}/token", self.__request_access_token
+        )
+
+    async def __request_access_token(self) -> str:
+        assert self.client_id is not None and self.client_secret is not None
+        session = await self.session_pool.get_session()
+        async with session.post(
+            self.token_url,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Authorization": encode_client_secret_basic(
+                    self.client_id, self.client_secret
+                ),
+            },
+            data={
+                "grant_type": "client_credentials",
+                "scope": "news openid offline",
+            },
+        ) as response:
             response.raise_for_status()
-            data = response.json()
+            data = await response.json()
+        token: str = data["access_token"]
+        expires_at = (
+            time.time()
+            + data["expires_in"]
+            - self.TOKEN_EXPIRY_MARGIN_IN_SECONDS
+        )
+        self._token_cache[self.__token_cache_key] = (token, expires_at)
+        logger.debug("Fetched a new AskNews access token")
+        return token
 
-            return SearchResponse(
-                as_string=data.get("as_string"), as_dicts=data.get("as_dicts")
-            )
+    @property
+    def __token_cache_key(self) -> tuple[str, str]:
+        assert self.client_id is not None and self.client_secret is not None
+        return (self.client_id, self.client_secret)
+
+    @staticmethod
+    def __to_query_params(params: dict[str, Any]) -> list[tuple[str, str]]:
+        """
+        Lists become repeated keys and booleans become "true"/"false"
+        """
+        query_params: list[tuple[str, str]] = []
+        for key, value in params.items():
+            values = value if isinstance(value, list) else [value]
+            for single_value in values:
+                if isinstance(single_value, bool):
+                    single_value = "true" if single_value else "false"
+                query_params.append((key, str(single_value)))
+        return query_params
+
+    @classmethod
+    def __add_to_result_cache(
+        cls, cache_key: str, search_response: SearchResponse
+    ) -> None:
+        now = time.monotonic()
+        expired_keys = [
+            key
+            for key, (time_cached, _) in cls._result_cache.items()
+            if now - time_cached >= cls.RESULT_CACHE_TIME_TO_LIVE_IN_SECONDS
+        ]
+        for key in expired_keys:
+            del cls._result_cache[key]
+        cls._result_cache[cache_key] = (now, search_response)
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        cls._token_cache.clear()
+        cls._result_cache.clear()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+from urllib.parse import urlencode
+
+import aiohttp
+
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+from forecasting_tools.forecasting.helpers.metaculus_api import (
+    ApiFilter,
+    MetaculusApi,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    MetaculusQuestion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMetaculusApi:
+    """
+    Non-blocking version of the question reading parts of MetaculusApi.
+
+    Requests go through a pooled aiohttp session and pages of questions are
+    fetched concurrently (up to `max_concurrent_requests` at a time).
+    Responses are cached with their ETag so repeated requests are revalidated
+    with `If-None-Match` and unchanged pages are not downloaded again.
+    Question parsing and client-side filtering are shared with MetaculusApi.
+    """
+
+    MAX_ETAG_CACHE_ENTRIES = 1000
+    _etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def __init__(
+        self,
+        session_pool: HttpSessionPool | None = None,
+        max_concurrent_requests: int = 5,
+    ) -> None:
+        if max_concurrent_requests <= 0:
+            raise ValueError("max_concurrent_requests must be greater than 0")
+        self.session_pool = session_pool or HttpSessionPool.get_shared_pool()
+        self.max_concurrent_requests = max_concurrent_requests
+        self.__request_limiter = asyncio.Semaphore(max_concurrent_requests)
+
+    async def get_question_by_post_id(self, post_id: int) -> MetaculusQuestion:
+        logger.info(f"Retrieving question details for question {post_id}")
+        json_question = await self._get_json(
+            f"{MetaculusApi.API_BASE_URL}/posts/{post_id}/", {}
+        )
+        return MetaculusApi._metaculus_api_json_to_question(json_question)
+
+    async def get_questions_matching_filter(
+        self,
+        api_filter: ApiFilter,
+        num_questions: int | None = None,
+    ) -> list[MetaculusQuestion]:
+        """
+        If num questions is not set, it will only grab the first page of questions from API
+        (the same as MetaculusApi.get_questions_matching_filter)
+        """
+        if num_questions is not None:
+            assert num_questions > 0, "Must request at least one question"
+        max_pages = 1 if num_questions is None else None
+        questions: list[MetaculusQuestion] = []
+        async with aclosing(
+            self.iterate_question_pages_matching_filter(api_filter, max_pages)
+        ) as pages:
+            async for page in pages:
+                questions.extend(page)
+                if (
+                    num_questions is not None
+                    and len(questions) >= num_questions
+                ):
+                    break
+        return questions[:num_questions]
+
+    async def get_all_open_questions_from_tournament(
+        self, tournament_id: int | str
+    ) -> list[MetaculusQuestion]:
+        questions: list[MetaculusQuestion] = []
+        async for page in self.iterate_open_questions_from_tournament(
+            tournament_id
+        ):
+            questions.extend(page)
+        return questions
+
+    def iterate_open_questions_from_tournament(
+        self, tournament_id: int | str
+    ) -> AsyncIterator[list[MetaculusQuestion]]:
+        logger.info(f"Retrieving questions from tournament {tournament_id}")
+        api_filter = ApiFilter(
+            allowed_tournaments=[tournament_id],
+            allowed_statuses=["open"],
+        )
+        return self.iterate_question_pages_matching_filter(api_filter)
+
+    async def iterate_question_pages_matching_filter(
+        self, api_filter: ApiFilter, max_pages: int | None = None
+    ) -> AsyncIterator[list[MetaculusQuestion]]:
+        """
+        Yields each page of filtered questions (in API order) as soon as it is
+        available, so callers can start working on the first page while later
+        pages are still loading.
+        """
+        page_size = MetaculusApi.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
+        next_page_index = 0
+        in_flight_pages: list[
+            asyncio.Task[tuple[list[MetaculusQuestion], bool]]
+        ] = []
+        try:
+            while True:
+                while len(in_flight_pages) < self.max_concurrent_requests and (
+                    max_pages is None or next_page_index < max_pages
+                ):
+                    in_flight_pages.append(
+                        asyncio.create_task(
+                            self._get_filtered_page(
+                                api_filter, next_page_index * page_size
+                            )
+                        )
+                    )
+                    next_page_index += 1
+                if not in_flight_pages:
+                    return
+                questions, is_last_page = await in_flight_pages.pop(0)
+                yield questions
+                if is_last_page:
+                    return
+        finally:
+            for task in in_flight_pages:
+                task.cancel()
+
+    async def _get_filtered_page(
+        self, api_filter: ApiFilter, offset: int
+    ) -> tuple[list[MetaculusQuestion], bool]:
+        params = MetaculusApi._create_url_params_for_filter(api_filter, offset)
+        data = await self._get_json(
+            f"{MetaculusApi.API_BASE_URL}/posts/", params
+        )
+        results = data["results"]
+        is_last_page = len(results) < params["limit"] or (
+            "next" in data and data["next"] is None
+        )
+        questions = MetaculusApi._api_results_to_questions(results)
+        questions = MetaculusApi._apply_local_filters(questions, api_filter)
+        return questions, is_last_page
+
+    async def _get_json(self, url: str, params: dict[str, Any]) -> Any:
+        query_params = self.__to_query_params(params)
+        cache_key = f"{url}?{urlencode(sorted(query_params))}"
+        headers = dict(MetaculusApi._get_auth_headers()["headers"])
+        cached_entry = self._etag_cache.get(cache_key)
+        if cached_entry is not None:
+            headers["If-None-Match"] = cached_entry[0]
+
+        session = await self.session_pool.get_session()
+        async with self.__request_limiter:
+            async with session.get(
+                url, params=query_params, headers=headers
+            ) as response:
+                if response.status == 304 and cached_entry is not None:
+                    self._etag_cache.move_to_end(cache_key)
+                    logger.debug(f"Using cached response for {cache_key}")
+                    return cached_entry[1]
+                await self.__raise_for_status_with_additional_info(response)
+                data = await response.json()
+                etag = response.headers.get("ETag")
+
+        if etag is not None:
+            self.__add_to_etag_cache(cache_key, etag, data)
+        return data
+
+    @classmethod
+    def __add_to_etag_cache(cls, cache_key: str, etag: str, data: Any) -> None:
+        cls._etag_cache[cache_key] = (etag, data)
+        cls._etag_cache.move_to_end(cache_key)
+        while len(cls._etag_cache) > cls.MAX_ETAG_CACHE_ENTRIES:
+            cls._etag_cache.popitem(last=False)
+
+    @staticmethod
+    def __to_query_params(params: dict[str, Any]) -> list[tuple[str, str]]:
+        query_params: list[tuple[str, str]] = []
+        for key, value in params.items():
+            values = value if isinstance(value, list) else [value]
+            query_params.extend((key, str(item)) for item in values)
+        return query_params
+
+    @staticmethod
+    async def __raise_for_status_with_additional_info(
+        response: aiohttp.ClientResponse,
+    ) -> None:
+        if response.ok:
+            return
+        response_text = await response.text()
+        error_message = f"HTTPError. Url: {response.url}. Response reason: {response.reason}. Response text: {response_text}"
+        logger.error(error_message)
+        raise aiohttp.ClientResponseError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=error_message,
+            headers=response.headers,
+        )
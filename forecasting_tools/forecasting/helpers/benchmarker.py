@@ -28,6 +28,9 @@ from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
 from forecasting_tools.forecasting.questions_and_reports.questions import (
     MetaculusQuestion,
 )
+from forecasting_tools.forecasting.questions_and_reports.report_sink import (
+    JsonlReportSink,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,10 @@ class Benchmarker:
     Lower than 100 can differentiate between bots of large skill differences,
     but not between bots of small skill differences. But even with 100 there is
     ~30% of the 'worse bot' winning if there are not large skill differences.
+
+    If a folder to save reports to is given, reports are appended to a JSONL
+    file per bot as each batch finishes, and the full benchmark JSON is
+    written once when the benchmark is complete.
     """
 
     def __init__(
@@ -92,7 +99,12 @@ class Benchmarker:
             )
             benchmarks.append(benchmark)
 
-        for bot, benchmark in zip(self.forecast_bots, benchmarks):
+        for bot_index, (bot, benchmark) in enumerate(
+            zip(self.forecast_bots, benchmarks)
+        ):
+            report_sink = self._create_report_sink_if_configured(
+                bot_index, benchmark
+            )
             with MonetaryCostManager() as cost_manager:
                 start_time = time.time()
                 for batch in self._batch_questions(
@@ -122,7 +134,8 @@ class Benchmarker:
                         ],
                     )
                     benchmark.forecast_reports.extend(valid_reports)
-                    self._save_benchmarks_to_file_if_configured(benchmarks)
+                    if report_sink is not None:
+                        report_sink.add_reports(list(valid_reports))
                 end_time = time.time()
                 benchmark.time_taken_in_minutes = (end_time - start_time) / 60
                 benchmark.total_cost = cost_manager.current_usage
@@ -138,6 +151,20 @@ class Benchmarker:
             for i in range(0, len(questions), batch_size)
         ]
 
+    def _create_report_sink_if_configured(
+        self, bot_index: int, benchmark: BenchmarkForBot
+    ) -> JsonlReportSink | None:
+        if self.file_path_to_save_reports is None:
+            return None
+        file_path = (
+            f"{self.file_path_to_save_reports}"
+            f"benchmark_reports_"
+            f"{self.initialization_timestamp.strftime('%Y-%m-%d_%H-%M-%S')}"
+            f"_{bot_index}_{benchmark.name}"
+            f".jsonl"
+        )
+        return JsonlReportSink(file_path)
+
     def _save_benchmarks_to_file_if_configured(
         self, benchmarks: list[BenchmarkForBot]
     ) -> None:
@@ -7,6 +7,7 @@ import math
 import os
 import random
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Any, Literal, TypeVar
 
@@ -47,6 +48,8 @@ class MetaculusApi:
 
     API_BASE_URL = "https://www.metaculus.com/api"
     MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST = 100
+    PAGE_CACHE_TIME_TO_LIVE_IN_SECONDS = 600
+    _page_cache: dict[str, tuple[float, list[MetaculusQuestion]]] = {}
 
     @classmethod
     def post_question_comment(cls, post_id: int, comment_text: str) -> None:
@@ -185,7 +188,15 @@ class MetaculusApi:
             allowed_tournaments=[tournament_id],
             allowed_statuses=["open"],
         )
-        questions = asyncio.run(cls.get_questions_matching_filter(api_filter))
+        questions: list[MetaculusQuestion] = []
+        offset = 0
+        more_questions_available = True
+        while more_questions_available:
+            new_questions, more_questions_available = (
+                cls._grab_filtered_questions_with_offset(api_filter, offset)
+            )
+            questions.extend(new_questions)
+            offset += cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
         return questions
 
     @classmethod
@@ -234,23 +245,67 @@ class MetaculusApi:
             ],
             **cls._get_auth_headers(),  # type: ignore
         )
+        cls._page_cache.clear()
         logger.info(f"Posted prediction on question {question_id}")
         raise_for_status_with_additional_info(response)
 
     @classmethod
     def _get_questions_from_api(
-        cls, params: dict[str, Any]
+        cls, params: dict[str, Any], use_page_cache: bool = False
     ) -> list[MetaculusQuestion]:
+        """
+        With `use_page_cache`, pages fetched in the last
+        PAGE_CACHE_TIME_TO_LIVE_IN_SECONDS are reused, so they may be missing
+        recent forecasts. This is only used when sampling benchmark questions,
+        and the cache is cleared whenever a prediction is posted.
+        """
         num_requested = params.get("limit")
         assert (
             num_requested is None
             or num_requested <= cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
         ), "You cannot get more than 100 questions at a time"
+        if not use_page_cache:
+            data = cls._get_posts_json(params)
+            return cls._api_results_to_questions(data["results"])
+        cache_key = json.dumps(params, sort_keys=True, default=str)
+        cached_page = cls._page_cache.get(cache_key)
+        if (
+            cached_page is not None
+            and time.monotonic() - cached_page[0]
+            < cls.PAGE_CACHE_TIME_TO_LIVE_IN_SECONDS
+        ):
+            logger.debug(f"Using cached page of questions for {cache_key}")
+            return list(cached_page[1])
+        data = cls._get_posts_json(params)
+        questions = cls._api_results_to_questions(data["results"])
+        cls.__add_to_page_cache(cache_key, questions)
+        return list(questions)
+
+    @classmethod
+    def _get_posts_json(cls, params: dict[str, Any]) -> dict[str, Any]:
         url = f"{cls.API_BASE_URL}/posts/"
         response = requests.get(url, params=params, **cls._get_auth_headers())  # type: ignore
         raise_for_status_with_additional_info(response)
-        data = json.loads(response.content)
-        results = data["results"]
+        return json.loads(response.content)
+
+    @classmethod
+    def __add_to_page_cache(
+        cls, cache_key: str, questions: list[MetaculusQuestion]
+    ) -> None:
+        now = time.monotonic()
+        expired_keys = [
+            key
+            for key, (time_cached, _) in cls._page_cache.items()
+            if now - time_cached >= cls.PAGE_CACHE_TIME_TO_LIVE_IN_SECONDS
+        ]
+        for key in expired_keys:
+            del cls._page_cache[key]
+        cls._page_cache[cache_key] = (now, questions)
+
+    @classmethod
+    def _api_results_to_questions(
+        cls, results: list[dict]
+    ) -> list[MetaculusQuestion]:
         supported_posts = [
             q
             for q in results
@@ -330,7 +385,7 @@ class MetaculusApi:
 
             offset = page_index * questions_per_page
             page_questions, _ = cls._grab_filtered_questions_with_offset(
-                filter, offset
+                filter, offset, use_page_cache=True
             )
             questions.extend(page_questions)
 
@@ -379,47 +434,73 @@ class MetaculusApi:
         cls, filter: ApiFilter
     ) -> int:
         """
-        Search Metaculus API with binary search to find the number of questions
-        matching the filter.
+        Reads the number of questions matching the API side of the filter from
+        the `count` field of a one question request. If the API does not return
+        a count, it is found by probing offsets with one question requests.
+        Questions removed by the local filters are still counted.
         """
-        estimated_max_questions = 20000
-        left, right = 0, estimated_max_questions
-        last_successful_offset = 0
-
-        while left <= right:
-            mid = (left + right) // 2
-            offset = mid * cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
-
-            _, found_questions = cls._grab_filtered_questions_with_offset(
-                filter, offset
-            )
-
-            if found_questions:
-                left = mid + 1
-                last_successful_offset = offset
-            else:
-                right = mid - 1
-
-        final_page_questions, _ = cls._grab_filtered_questions_with_offset(
-            filter, last_successful_offset
-        )
-        total_questions = last_successful_offset + len(final_page_questions)
-
-        if total_questions >= estimated_max_questions:
-            raise ValueError(
-                f"Total questions ({total_questions}) exceeded estimated max ({estimated_max_questions})"
-            )
+        data = cls._get_posts_json(cls._create_probe_params(filter, 0))
+        total_questions = data.get("count")
+        if total_questions is None:
+            total_questions = cls._count_questions_by_probing_offsets(filter)
         logger.info(
-            f"Estimating that there are {total_questions} questions matching the filter -> {str(filter)[:200]}"
+            f"There are {total_questions} questions matching the filter -> {str(filter)[:200]}"
         )
         return total_questions
 
+    @classmethod
+    def _count_questions_by_probing_offsets(cls, filter: ApiFilter) -> int:
+        def question_exists_at(offset: int) -> bool:
+            probe_params = cls._create_probe_params(filter, offset)
+            return len(cls._get_posts_json(probe_params)["results"]) > 0
+
+        if not question_exists_at(0):
+            return 0
+
+        # Double the offset until it passes the last question, then binary
+        # search between the last offset with a question and the first without
+        last_offset_with_question = 0
+        first_offset_without_question = 1
+        while question_exists_at(first_offset_without_question):
+            last_offset_with_question = first_offset_without_question
+            first_offset_without_question *= 2
+
+        while first_offset_without_question - last_offset_with_question > 1:
+            middle_offset = (
+                last_offset_with_question + first_offset_without_question
+            ) // 2
+            if question_exists_at(middle_offset):
+                last_offset_with_question = middle_offset
+            else:
+                first_offset_without_question = middle_offset
+        return first_offset_without_question
+
+    @classmethod
+    def _create_probe_params(
+        cls, filter: ApiFilter, offset: int
+    ) -> dict[str, Any]:
+        probe_params = cls._create_url_params_for_filter(filter, offset)
+        probe_params["limit"] = 1
+        probe_params["with_cp"] = "false"
+        return probe_params
+
     @classmethod
     def _grab_filtered_questions_with_offset(
         cls,
         filter: ApiFilter,
         offset: int = 0,
+        use_page_cache: bool = False,
     ) -> tuple[list[MetaculusQuestion], bool]:
+        url_params = cls._create_url_params_for_filter(filter, offset)
+        questions = cls._get_questions_from_api(url_params, use_page_cache)
+        questions_were_found_before_local_filter = len(questions) > 0
+        questions = cls._apply_local_filters(questions, filter)
+        return questions, questions_were_found_before_local_filter
+
+    @classmethod
+    def _create_url_params_for_filter(
+        cls, filter: ApiFilter, offset: int = 0
+    ) -> dict[str, Any]:
         url_params: dict[str, Any] = {
             "limit": cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST,
             "offset": offset,
@@ -463,9 +544,15 @@ class MetaculusApi:
         if filter.allowed_tournaments:
             url_params["tournaments"] = filter.allowed_tournaments
 
-        questions = cls._get_questions_from_api(url_params)
-        questions_were_found_before_local_filter = len(questions) > 0
+        return url_params
 
+    @classmethod
+    def _apply_local_filters(
+        cls, questions: list[MetaculusQuestion], filter: ApiFilter
+    ) -> list[MetaculusQuestion]:
+        """
+        Applies the parts of the filter that the API does not support
+        """
         if filter.num_forecasters_gte is not None:
             questions = cls._filter_questions_by_forecasters(
                 questions, filter.num_forecasters_gte
@@ -498,7 +585,7 @@ class MetaculusApi:
                 questions, filter.cp_reveal_time_gt, filter.cp_reveal_time_lt
             )
 
-        return questions, questions_were_found_before_local_filter
+        return questions
 
     @classmethod
     def _filter_questions_by_forecasters(
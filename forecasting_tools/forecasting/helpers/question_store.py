@@ -0,0 +1,532 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from forecasting_tools.forecasting.helpers.metaculus_api import (
+    ApiFilter,
+    MetaculusApi,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    MetaculusQuestion,
+)
+from forecasting_tools.util import file_manipulation
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionStore:
+    """
+    A local SQLite mirror of Metaculus questions keyed by post id.
+
+    `sync` pulls posts from the API newest first (by `published_at` by default)
+    and stops once it reaches posts that are older than what the last sync with
+    the same filter already saw, so repeated syncs only download new pages.
+    That alone would leave stored questions stale (forecaster counts, status,
+    close times, etc. change after publishing), so by default `sync` also
+    downloads every unresolved question matching the filter again.
+    `get_questions_matching_filter` then answers ApiFilter queries from the
+    local copy, including the filters the API does not support
+    (e.g. `num_forecasters_gte` or `community_prediction_exists`), so that
+    benchmarks and tournament runs can select questions without paging through
+    the live API each run. Questions come back with `date_accessed` set to
+    when they were last synced.
+    """
+
+    DEFAULT_FILE_PATH = "logs/cache/question_store.sqlite"
+    UNRESOLVED_STATUSES: list[Literal["upcoming", "open", "closed"]] = [
+        "upcoming",
+        "open",
+        "closed",
+    ]
+
+    def __init__(self, file_path: str = DEFAULT_FILE_PATH) -> None:
+        self.file_path = file_manipulation.get_absolute_path(file_path)
+        self.__lock = threading.Lock()
+        self.__connection = self.__create_connection()
+
+    def sync(
+        self,
+        api_filter: ApiFilter | None = None,
+        order_by_field: str = "published_at",
+        max_pages: int | None = None,
+        refresh_unresolved_questions: bool = True,
+    ) -> int:
+        """
+        Downloads posts matching the API side of the filter (local filters are
+        applied at query time instead) and returns the number of questions
+        that were added or updated. `order_by_field` must be a field the
+        posts API can order by that is also included on each post.
+
+        With `refresh_unresolved_questions`, upcoming, open and closed
+        questions matching the filter are downloaded again, and stored ones
+        the API no longer lists with those statuses (e.g. because they
+        resolved) are fetched one by one. Without it, only new posts are
+        added and stored questions keep the data they were first synced with.
+        """
+        api_filter = api_filter or ApiFilter()
+        saved_post_ids = self.__sync_new_posts(
+            api_filter, order_by_field, max_pages
+        )
+        if refresh_unresolved_questions:
+            saved_post_ids |= self.__refresh_unresolved_questions(
+                api_filter, max_pages
+            )
+        return len(saved_post_ids)
+
+    def add_questions(self, questions: list[MetaculusQuestion]) -> None:
+        rows = [self.__question_to_row(question) for question in questions]
+        with self.__lock:
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO questions ("
+                "id_of_post, question_type, state, num_forecasters, "
+                "includes_bots_in_aggregates, published_time, open_time, "
+                "close_time, scheduled_resolution_time, cp_reveal_time, "
+                "api_json, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [question_row for question_row, _ in rows],
+            )
+            self.__connection.executemany(
+                "DELETE FROM question_tournaments WHERE id_of_post = ?",
+                [(question.id_of_post,) for question in questions],
+            )
+            self.__connection.executemany(
+                "INSERT OR IGNORE INTO question_tournaments "
+                "(id_of_post, tournament) VALUES (?, ?)",
+                [
+                    tournament_row
+                    for _, tournament_rows in rows
+                    for tournament_row in tournament_rows
+                ],
+            )
+            self.__connection.commit()
+
+    def get_question_by_post_id(
+        self, post_id: int
+    ) -> MetaculusQuestion | None:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT api_json, synced_at FROM questions "
+                "WHERE id_of_post = ?",
+                (post_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self.__row_to_question(row)
+
+    def get_questions_matching_filter(
+        self,
+        api_filter: ApiFilter,
+        num_questions: int | None = None,
+        randomly_sample: bool = False,
+    ) -> list[MetaculusQuestion]:
+        """
+        Questions are returned newest published first (the same order as the
+        API) unless they are randomly sampled. If num_questions is set and
+        not enough questions match, an error is raised.
+        """
+        if num_questions is not None:
+            assert num_questions > 0, "Must request at least one question"
+        where_clause, values = self.__create_where_clause(api_filter)
+        with self.__lock:
+            rows = self.__connection.execute(
+                f"SELECT api_json, synced_at FROM questions {where_clause} "
+                "ORDER BY published_time DESC, id_of_post DESC",
+                values,
+            ).fetchall()
+        questions = [self.__row_to_question(row) for row in rows]
+        questions = MetaculusApi._apply_local_filters(questions, api_filter)
+
+        if num_questions is None:
+            return questions
+        if len(questions) < num_questions:
+            raise ValueError(
+                f"Only {len(questions)} questions in the store match the filter, needed {num_questions}"
+            )
+        if randomly_sample:
+            return random.sample(questions, num_questions)
+        return questions[:num_questions]
+
+    def __len__(self) -> int:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT COUNT(*) FROM questions"
+            ).fetchone()
+        return row[0]
+
+    def __sync_new_posts(
+        self,
+        api_filter: ApiFilter,
+        order_by_field: str,
+        max_pages: int | None,
+    ) -> set[int]:
+        """
+        Pages posts newest first down to the watermark (the newest value seen
+        by the last sync that finished). If `max_pages` stops a sync first,
+        the watermark stays where it was and the next sync continues from the
+        offset the last one stopped at before looking for newer posts.
+        """
+        sync_key = self.__make_sync_key(api_filter, order_by_field)
+        sync_state = self.__get_sync_state(sync_key)
+        saved_post_ids: set[int] = set()
+        pages_left = max_pages
+
+        if sync_state.resume_offset is not None:
+            page_run = self.__page_posts_down_to_watermark(
+                api_filter,
+                order_by_field,
+                sync_state.resume_offset,
+                sync_state.watermark,
+                pages_left,
+            )
+            saved_post_ids |= page_run.saved_post_ids
+            if page_run.next_offset is not None:
+                sync_state.resume_offset = page_run.next_offset
+                self.__set_sync_state(sync_key, sync_state)
+                return saved_post_ids
+            sync_state = _SyncState(
+                watermark=self.__max_value(
+                    sync_state.watermark, sync_state.resume_watermark
+                )
+            )
+            self.__set_sync_state(sync_key, sync_state)
+            if pages_left is not None:
+                pages_left -= page_run.pages_read
+                if pages_left <= 0:
+                    return saved_post_ids
+
+        page_run = self.__page_posts_down_to_watermark(
+            api_filter, order_by_field, 0, sync_state.watermark, pages_left
+        )
+        saved_post_ids |= page_run.saved_post_ids
+        newest_value = self.__max_value(
+            sync_state.watermark, page_run.newest_value_seen
+        )
+        if page_run.next_offset is None:
+            sync_state = _SyncState(watermark=newest_value)
+        else:
+            sync_state = _SyncState(
+                watermark=sync_state.watermark,
+                resume_offset=page_run.next_offset,
+                resume_watermark=newest_value,
+            )
+        self.__set_sync_state(sync_key, sync_state)
+        return saved_post_ids
+
+    def __page_posts_down_to_watermark(
+        self,
+        api_filter: ApiFilter,
+        order_by_field: str,
+        start_offset: int,
+        watermark: str | None,
+        max_pages: int | None,
+    ) -> _PageRun:
+        page_run = _PageRun()
+        page_size = MetaculusApi.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
+        offset = start_offset
+        while True:
+            if max_pages is not None and page_run.pages_read >= max_pages:
+                page_run.next_offset = offset
+                break
+            params = MetaculusApi._create_url_params_for_filter(
+                api_filter, offset
+            )
+            params["order_by"] = f"-{order_by_field}"
+            results = MetaculusApi._get_posts_json(params)["results"]
+            questions = MetaculusApi._api_results_to_questions(results)
+            self.add_questions(questions)
+            page_run.saved_post_ids.update(
+                question.id_of_post for question in questions
+            )
+            page_run.pages_read += 1
+            offset += page_size
+            page_values = [
+                post[order_by_field]
+                for post in results
+                if post.get(order_by_field) is not None
+            ]
+            page_run.newest_value_seen = self.__max_value(
+                page_run.newest_value_seen, *page_values
+            )
+            reached_watermark = watermark is not None and any(
+                value < watermark for value in page_values
+            )
+            if len(results) < page_size or reached_watermark:
+                break
+        logger.info(
+            f"Synced {len(page_run.saved_post_ids)} questions into the question store from {page_run.pages_read} pages starting at offset {start_offset}"
+        )
+        return page_run
+
+    @staticmethod
+    def __max_value(*values: str | None) -> str | None:
+        present_values = [value for value in values if value is not None]
+        return max(present_values) if present_values else None
+
+    def __refresh_unresolved_questions(
+        self, api_filter: ApiFilter, max_pages: int | None
+    ) -> set[int]:
+        allowed_statuses = (
+            api_filter.allowed_statuses or self.UNRESOLVED_STATUSES
+        )
+        statuses = [
+            status
+            for status in allowed_statuses
+            if status in self.UNRESOLVED_STATUSES
+        ]
+        if not statuses:
+            return set()
+        refresh_filter = api_filter.model_copy(
+            update={"allowed_statuses": statuses}
+        )
+        page_size = MetaculusApi.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
+        refreshed_post_ids: set[int] = set()
+        read_every_page = False
+        page_index = 0
+        while max_pages is None or page_index < max_pages:
+            params = MetaculusApi._create_url_params_for_filter(
+                refresh_filter, page_index * page_size
+            )
+            results = MetaculusApi._get_posts_json(params)["results"]
+            questions = MetaculusApi._api_results_to_questions(results)
+            self.add_questions(questions)
+            refreshed_post_ids.update(
+                question.id_of_post for question in questions
+            )
+            if len(results) < page_size:
+                read_every_page = True
+                break
+            page_index += 1
+        if not read_every_page:
+            logger.info(
+                f"Refreshed {len(refreshed_post_ids)} unresolved questions, stopped at {max_pages} pages"
+            )
+            return refreshed_post_ids
+
+        # Stored questions the API no longer lists as unresolved have changed status
+        changed_post_ids = [
+            post_id
+            for post_id in self.__get_stored_post_ids(refresh_filter)
+            if post_id not in refreshed_post_ids
+        ]
+        for post_id in changed_post_ids:
+            self.add_questions([MetaculusApi.get_question_by_post_id(post_id)])
+        logger.info(
+            f"Refreshed {len(refreshed_post_ids)} unresolved questions and {len(changed_post_ids)} questions whose status changed"
+        )
+        return refreshed_post_ids | set(changed_post_ids)
+
+    def __get_stored_post_ids(self, api_filter: ApiFilter) -> list[int]:
+        api_side_filter = api_filter.model_copy(
+            update={
+                "num_forecasters_gte": None,
+                "close_time_gt": None,
+                "close_time_lt": None,
+                "cp_reveal_time_gt": None,
+                "cp_reveal_time_lt": None,
+                "includes_bots_in_aggregates": None,
+            }
+        )
+        where_clause, values = self.__create_where_clause(api_side_filter)
+        with self.__lock:
+            rows = self.__connection.execute(
+                f"SELECT id_of_post FROM questions {where_clause}", values
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def __create_connection(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS questions ("
+            "id_of_post INTEGER PRIMARY KEY, "
+            "question_type TEXT NOT NULL, "
+            "state TEXT, "
+            "num_forecasters INTEGER, "
+            "includes_bots_in_aggregates INTEGER, "
+            "published_time TEXT, "
+            "open_time TEXT, "
+            "close_time TEXT, "
+            "scheduled_resolution_time TEXT, "
+            "cp_reveal_time TEXT, "
+            "api_json TEXT NOT NULL, "
+            "synced_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS question_tournaments ("
+            "id_of_post INTEGER NOT NULL, "
+            "tournament TEXT NOT NULL, "
+            "PRIMARY KEY (id_of_post, tournament))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "sync_key TEXT PRIMARY KEY, "
+            "watermark TEXT, "
+            "resume_offset INTEGER, "
+            "resume_watermark TEXT, "
+            "synced_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_published_time "
+            "ON questions (published_time)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tournament "
+            "ON question_tournaments (tournament)"
+        )
+        connection.commit()
+        return connection
+
+    def __question_to_row(
+        self, question: MetaculusQuestion
+    ) -> tuple[tuple[Any, ...], list[tuple[int, str]]]:
+        question_row = (
+            question.id_of_post,
+            question.api_json["question"]["type"],
+            question.state.value if question.state else None,
+            question.num_forecasters,
+            question.includes_bots_in_aggregates,
+            self.__to_sortable_time(question.published_time),
+            self.__to_sortable_time(question.open_time),
+            self.__to_sortable_time(question.close_time),
+            self.__to_sortable_time(question.scheduled_resolution_time),
+            self.__to_sortable_time(question.cp_reveal_time),
+            json.dumps(question.api_json),
+            time.time(),
+        )
+        tournaments: set[str] = set(question.tournament_slugs)
+        try:
+            for tournament in question.api_json["projects"]["tournament"]:
+                tournaments.add(str(tournament["id"]))
+        except KeyError:
+            pass
+        tournament_rows = [
+            (question.id_of_post, tournament) for tournament in tournaments
+        ]
+        return question_row, tournament_rows
+
+    def __row_to_question(self, row: tuple[str, float]) -> MetaculusQuestion:
+        api_json, synced_at = row
+        question = MetaculusApi._metaculus_api_json_to_question(
+            json.loads(api_json)
+        )
+        question.date_accessed = datetime.fromtimestamp(synced_at)
+        return question
+
+    def __create_where_clause(
+        self, api_filter: ApiFilter
+    ) -> tuple[str, list[Any]]:
+        conditions: list[str] = []
+        values: list[Any] = []
+
+        def add_in_condition(column: str, allowed_values: list[Any]) -> None:
+            placeholders = ", ".join("?" for _ in allowed_values)
+            conditions.append(f"{column} IN ({placeholders})")
+            values.extend(allowed_values)
+
+        add_in_condition("question_type", list(api_filter.allowed_types))
+        if api_filter.allowed_statuses:
+            add_in_condition("state", list(api_filter.allowed_statuses))
+        if api_filter.allowed_tournaments:
+            tournaments = [str(t) for t in api_filter.allowed_tournaments]
+            placeholders = ", ".join("?" for _ in tournaments)
+            conditions.append(
+                "id_of_post IN (SELECT id_of_post FROM question_tournaments "
+                f"WHERE tournament IN ({placeholders}))"
+            )
+            values.extend(tournaments)
+
+        time_bounds = [
+            ("scheduled_resolution_time", ">", "scheduled_resolve_time_gt"),
+            ("scheduled_resolution_time", "<", "scheduled_resolve_time_lt"),
+            ("published_time", ">", "publish_time_gt"),
+            ("published_time", "<", "publish_time_lt"),
+            ("open_time", ">", "open_time_gt"),
+            ("open_time", "<", "open_time_lt"),
+            ("close_time", ">", "close_time_gt"),
+            ("close_time", "<", "close_time_lt"),
+            ("cp_reveal_time", ">", "cp_reveal_time_gt"),
+            ("cp_reveal_time", "<", "cp_reveal_time_lt"),
+        ]
+        for column, operator, filter_field in time_bounds:
+            bound: datetime | None = getattr(api_filter, filter_field)
+            if bound is not None:
+                conditions.append(f"{column} {operator} ?")
+                values.append(self.__to_sortable_time(bound))
+
+        if api_filter.num_forecasters_gte is not None:
+            conditions.append("num_forecasters >= ?")
+            values.append(api_filter.num_forecasters_gte)
+        if api_filter.includes_bots_in_aggregates is not None:
+            conditions.append("includes_bots_in_aggregates = ?")
+            values.append(api_filter.includes_bots_in_aggregates)
+
+        return "WHERE " + " AND ".join(conditions), values
+
+    @staticmethod
+    def __to_sortable_time(value: datetime | None) -> str | None:
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+
+    @staticmethod
+    def __make_sync_key(api_filter: ApiFilter, order_by_field: str) -> str:
+        params = MetaculusApi._create_url_params_for_filter(api_filter)
+        params.pop("offset")
+        params["order_by"] = f"-{order_by_field}"
+        return json.dumps(params, sort_keys=True, default=str)
+
+    def __get_sync_state(self, sync_key: str) -> _SyncState:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT watermark, resume_offset, resume_watermark "
+                "FROM sync_state WHERE sync_key = ?",
+                (sync_key,),
+            ).fetchone()
+        if row is None:
+            return _SyncState()
+        return _SyncState(*row)
+
+    def __set_sync_state(self, sync_key: str, sync_state: _SyncState) -> None:
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO sync_state "
+                "(sync_key, watermark, resume_offset, resume_watermark, "
+                "synced_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    sync_key,
+                    sync_state.watermark,
+                    sync_state.resume_offset,
+                    sync_state.resume_watermark,
+                    time.time(),
+                ),
+            )
+            self.__connection.commit()
+
+
+@dataclass
+class _SyncState:
+    watermark: str | None = None
+    resume_offset: int | None = None
+    resume_watermark: str | None = None
+
+
+@dataclass
+class _PageRun:
+    saved_post_ids: set[int] = field(default_factory=set)
+    newest_value_seen: str | None = None
+    pages_read: int = 0
+    next_offset: int | None = None
@@ -5,6 +5,9 @@ import urllib.parse
 from datetime import datetime
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.ai_utils.search_result_cache import (
+    SearchResultCache,
+)
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
 from forecasting_tools.ai_models.basic_model_interfaces.outputs_text import (
     OutputsText,
@@ -35,6 +38,7 @@ class SmartSearcher(OutputsText, AiModel):
         use_brackets_around_citations: bool = True,
         num_searches_to_run: int = 2,
         num_sites_per_search: int = 10,
+        search_cache: SearchResultCache | None = None,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -46,6 +50,7 @@ class SmartSearcher(OutputsText, AiModel):
             include_text=False,
             include_highlights=True,
             num_results=num_sites_per_search,
+            search_cache=search_cache,
         )
         self.llm = BasicLlm(temperature=temperature)
         self.include_works_cited_list = include_works_cited_list
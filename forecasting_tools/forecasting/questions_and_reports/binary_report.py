@@ -45,6 +45,15 @@ class BinaryReport(ForecastReport):
             assert isinstance(prediction, float), "Predictions must be floats"
         return statistics.median(predictions)
 
+    @classmethod
+    def calculate_prediction_spread(cls, predictions: list[float]) -> float:
+        """
+        Interquartile range of the probabilities
+        """
+        assert predictions, "No predictions to measure spread of"
+        upper_quartile, lower_quartile = np.percentile(predictions, [75, 25])
+        return float(upper_quartile - lower_quartile)
+
     @classmethod
     def make_readable_prediction(cls, prediction: float) -> str:
         return f"{round(prediction * 100, 2)}%"
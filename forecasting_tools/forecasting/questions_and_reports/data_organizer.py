@@ -105,6 +105,12 @@ class DataOrganizer:
         cls, file_path: str
     ) -> list[ForecastReport]:
         jsons = file_manipulation.load_json_file(file_path)
+        return cls.load_reports_from_jsons(jsons)
+
+    @classmethod
+    def load_reports_from_jsons(
+        cls, jsons: list[dict]
+    ) -> list[ForecastReport]:
         reports = cls._load_objects_from_json(jsons, cls.get_all_report_types())  # type: ignore
         reports = typeguard.check_type(reports, list[ForecastReport])
         return reports
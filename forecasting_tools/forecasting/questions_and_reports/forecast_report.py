@@ -37,6 +37,7 @@ class ForecastReport(BaseModel, Jsonable, ABC):
     price_estimate: float | None = None
     minutes_taken: float | None = None
     errors: list[str] = Field(default_factory=list)
+    predictions_used: int | None = None
     prediction: Any
 
     @field_validator("explanation")
@@ -114,6 +115,16 @@ class ForecastReport(BaseModel, Jsonable, ABC):
             "Subclass must implement this abstract method"
         )
 
+    @classmethod
+    def calculate_prediction_spread(cls, predictions: list[Any]) -> float:
+        """
+        How much the predictions disagree, on a 0 to 1 scale (0 means they
+        all agree). Used to decide when enough predictions have been made.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} does not support measuring prediction spread"
+        )
+
     @classmethod
     @abstractmethod
     def make_readable_prediction(cls, prediction: Any) -> str:
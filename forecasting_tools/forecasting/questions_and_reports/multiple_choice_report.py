@@ -1,3 +1,4 @@
+import numpy as np
 from pydantic import BaseModel, Field
 
 from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
@@ -91,6 +92,28 @@ class MultipleChoiceReport(ForecastReport):
             )
         return PredictedOptionList(predicted_options=new_predicted_options)
 
+    @classmethod
+    def calculate_prediction_spread(
+        cls, predictions: list[PredictedOptionList]
+    ) -> float:
+        """
+        Largest interquartile range of any one option's probabilities
+        """
+        assert predictions, "No predictions to measure spread of"
+        probabilities_by_option: dict[str, list[float]] = {}
+        for option_list in predictions:
+            for option in option_list.predicted_options:
+                probabilities_by_option.setdefault(
+                    option.option_name, []
+                ).append(option.probability)
+        option_spreads = []
+        for probabilities in probabilities_by_option.values():
+            upper_quartile, lower_quartile = np.percentile(
+                probabilities, [75, 25]
+            )
+            option_spreads.append(float(upper_quartile - lower_quartile))
+        return max(option_spreads)
+
     @classmethod
     def make_readable_prediction(cls, prediction: PredictedOptionList) -> str:
         option_bullet_points = [
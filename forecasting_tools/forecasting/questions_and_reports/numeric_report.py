@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import ClassVar
 
 import numpy as np
 from pydantic import BaseModel, field_validator
@@ -61,38 +64,99 @@ class NumericDistribution(BaseModel):
         """
         Turns a list of percentiles into a full distribution with 201 points
         cdf stands for 'continuous distribution function'
+
+        The Percentile objects are built on each call from `cdf_values` and
+        `cdf_percentiles` (which are cached), use those directly if you only
+        need the numbers.
+        """
+        cdf_arrays = self.__get_cdf_arrays()
+        return [
+            Percentile(value=value, percentile=percentile)
+            for value, percentile in zip(
+                cdf_arrays.values.tolist(), cdf_arrays.percentiles.tolist()
+            )
+        ]
+
+    @property
+    def cdf_values(self) -> np.ndarray:
+        """
+        The 201 x axis locations of the cdf as a read only array
         """
-        # TODO: This function needs to be cleaned up and made more readable
+        return self.__get_cdf_arrays().values
+
+    @property
+    def cdf_percentiles(self) -> np.ndarray:
+        """
+        The cumulative probabilities at each of the `cdf_values` as a read only
+        array
+        """
+        return self.__get_cdf_arrays().percentiles
+
+    def __get_cdf_arrays(self) -> _CdfArrays:
+        # The result is cached in __dict__ (like functools.cached_property
+        # would) so pydantic ignores it when comparing and serializing. The
+        # key makes sure the cache is not used if a field was changed since.
+        cache_key = (
+            tuple(
+                (percentile.value, percentile.percentile)
+                for percentile in self.declared_percentiles
+            ),
+            self.open_upper_bound,
+            self.open_lower_bound,
+            self.upper_bound,
+            self.lower_bound,
+            self.zero_point,
+        )
+        cdf_arrays: _CdfArrays | None = self.__dict__.get("_cdf_arrays")
+        if cdf_arrays is None or cdf_arrays.cache_key != cache_key:
+            values, percentiles = self.__calculate_cdf_arrays()
+            cdf_arrays = _CdfArrays(cache_key, values, percentiles)
+            self.__dict__["_cdf_arrays"] = cdf_arrays
+        return cdf_arrays
+
+    def __calculate_cdf_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        percentile_values = self.__get_percentile_values_with_bounds()
+
+        # Invert to value -> percentile. For repeated values (e.g. after being
+        # moved in from the bounds) the highest percentile is kept.
+        value_percentiles = {
+            value: percentile / 100
+            for percentile, value in sorted(percentile_values.items())
+        }
+        known_values = np.array(sorted(value_percentiles))
+        known_percentiles = np.array(
+            [value_percentiles[value] for value in known_values.tolist()]
+        )
 
-        percentiles = self.declared_percentiles
-        open_upper_bound = self.open_upper_bound
-        open_lower_bound = self.open_lower_bound
-        upper_bound = self.upper_bound
-        lower_bound = self.lower_bound
-        zero_point = self.zero_point
+        cdf_x_axis = self.__generate_cdf_locations()
+        continuous_cdf = np.interp(cdf_x_axis, known_values, known_percentiles)
+        assert len(continuous_cdf) == 201
+        cdf_x_axis.setflags(write=False)
+        continuous_cdf.setflags(write=False)
+        return cdf_x_axis, continuous_cdf
 
-        # Convert to dict so I don't have to rewrite this whole function
+    def __get_percentile_values_with_bounds(self) -> dict[float, float]:
         percentile_values: dict[float, float] = {
             percentile.percentile * 100: percentile.value
-            for percentile in percentiles
+            for percentile in self.declared_percentiles
         }
 
-        percentile_max = max(float(key) for key in percentile_values.keys())
-        percentile_min = min(float(key) for key in percentile_values.keys())
-        range_min = lower_bound
-        range_max = upper_bound
+        percentile_max = max(percentile_values.keys())
+        percentile_min = min(percentile_values.keys())
+        range_min = self.lower_bound
+        range_max = self.upper_bound
         range_size = abs(range_max - range_min)
         buffer = 1 if range_size > 100 else 0.01 * range_size
 
         # Adjust any values that are exactly at the bounds
         for percentile, value in list(percentile_values.items()):
-            if not open_lower_bound and value <= range_min + buffer:
+            if not self.open_lower_bound and value <= range_min + buffer:
                 percentile_values[percentile] = range_min + buffer
-            if not open_upper_bound and value >= range_max - buffer:
+            if not self.open_upper_bound and value >= range_max - buffer:
                 percentile_values[percentile] = range_max - buffer
 
         # Set cdf values outside range
-        if open_upper_bound:
+        if self.open_upper_bound:
             if range_max > percentile_values[percentile_max]:
                 percentile_values[
                     int(100 - (0.5 * (100 - percentile_max)))
@@ -100,88 +164,27 @@ class NumericDistribution(BaseModel):
         else:
             percentile_values[100] = range_max
 
-        # Set cdf values outside range
-        if open_lower_bound:
+        if self.open_lower_bound:
             if range_min < percentile_values[percentile_min]:
                 percentile_values[int(0.5 * percentile_min)] = range_min
         else:
             percentile_values[0] = range_min
 
-        sorted_percentile_values = dict(sorted(percentile_values.items()))
-
-        # Normalize percentile keys
-        normalized_percentile_values = {}
-        for key, value in sorted_percentile_values.items():
-            percentile = float(key) / 100
-            normalized_percentile_values[percentile] = value
-
-        value_percentiles = {
-            value: key for key, value in normalized_percentile_values.items()
-        }
-
-        # function for log scaled questions
-        def generate_cdf_locations(
-            range_min: float, range_max: float, zero_point: float | None
-        ) -> list[float]:
-            if zero_point is None:
-                scale = lambda x: range_min + (range_max - range_min) * x
-            else:
-                deriv_ratio = (range_max - zero_point) / (
-                    range_min - zero_point
-                )
-                scale = lambda x: range_min + (range_max - range_min) * (
-                    deriv_ratio**x - 1
-                ) / (deriv_ratio - 1)
-            return [scale(x) for x in np.linspace(0, 1, 201)]
-
-        cdf_xaxis = generate_cdf_locations(range_min, range_max, zero_point)
-
-        def linear_interpolation(
-            x_values: list[float], xy_pairs: dict[float, float]
-        ) -> list[float]:
-            # Sort the xy_pairs by x-values
-            sorted_pairs = sorted(xy_pairs.items())
-
-            # Extract sorted x and y values
-            known_x = [pair[0] for pair in sorted_pairs]
-            known_y = [pair[1] for pair in sorted_pairs]
-
-            # Initialize the result list
-            y_values = []
-
-            for x in x_values:
-                # Check if x is exactly in the known x values
-                if x in known_x:
-                    y_values.append(known_y[known_x.index(x)])
-                else:
-                    # Find the indices of the two nearest known x-values
-                    i = 0
-                    while i < len(known_x) and known_x[i] < x:
-                        i += 1
-                    # If x is outside the range of known x-values, use the nearest endpoint
-                    if i == 0:
-                        y_values.append(known_y[0])
-                    elif i == len(known_x):
-                        y_values.append(known_y[-1])
-                    else:
-                        # Perform linear interpolation
-                        x0, x1 = known_x[i - 1], known_x[i]
-                        y0, y1 = known_y[i - 1], known_y[i]
-
-                        # Linear interpolation formula
-                        y = y0 + (x - x0) * (y1 - y0) / (x1 - x0)
-                        y_values.append(y)
-
-            return y_values
-
-        continuous_cdf = linear_interpolation(cdf_xaxis, value_percentiles)
-
-        percentiles = [
-            Percentile(value=value, percentile=percentile)
-            for value, percentile in zip(cdf_xaxis, continuous_cdf)
-        ]
-        assert len(percentiles) == 201
-        return percentiles
+        return percentile_values
+
+    def __generate_cdf_locations(self) -> np.ndarray:
+        range_min = self.lower_bound
+        range_max = self.upper_bound
+        x = np.linspace(0, 1, 201)
+        if self.zero_point is None:
+            return range_min + (range_max - range_min) * x
+        # log scaled questions
+        deriv_ratio = (range_max - self.zero_point) / (
+            range_min - self.zero_point
+        )
+        return range_min + (range_max - range_min) * (deriv_ratio**x - 1) / (
+            deriv_ratio - 1
+        )
 
     def get_representative_percentiles(
         self, num_percentiles: int = 5
@@ -209,43 +212,52 @@ class NumericDistribution(BaseModel):
         return representative_percentiles
 
 
+class NumericAggregationMethod(Enum):
+    MEDIAN = "median"
+    MEAN = "mean"
+    TRIMMED_MEAN = "trimmed_mean"
+    LOG_POOL = "log_pool"
+
+
+@dataclass(eq=False)
+class _CdfArrays:
+    cache_key: tuple
+    values: np.ndarray
+    percentiles: np.ndarray
+
+
 class NumericReport(ForecastReport):
     question: NumericQuestion
     prediction: NumericDistribution
 
+    MIN_LOG_POOL_PROBABILITY_MASS: ClassVar[float] = 1e-9
+
     @classmethod
     async def aggregate_predictions(
-        cls, predictions: list[NumericDistribution], question: NumericQuestion
+        cls,
+        predictions: list[NumericDistribution],
+        question: NumericQuestion,
+        aggregation_method: NumericAggregationMethod = NumericAggregationMethod.MEDIAN,
     ) -> NumericDistribution:
         assert predictions, "No predictions to aggregate"
-        cdfs = [prediction.cdf for prediction in predictions]
-        all_percentiles_of_cdf: list[list[float]] = []
-        all_values_of_cdf: list[list[float]] = []
-        x_axis: list[float] = [percentile.value for percentile in cdfs[0]]
-        for cdf in cdfs:
-            all_percentiles_of_cdf.append(
-                [percentile.percentile for percentile in cdf]
-            )
-            all_values_of_cdf.append([percentile.value for percentile in cdf])
-
-        for cdf in cdfs:
-            for i in range(len(cdf)):
-                if cdf[i].value != x_axis[i]:
-                    raise ValueError("X axis between cdfs is not the same")
-
-        median_percentile_list: list[float] = np.median(
-            np.array(all_percentiles_of_cdf), axis=0
-        ).tolist()
-        median_cdf = [
-            Percentile(value=value, percentile=percentile)
-            for value, percentile in zip(x_axis, median_percentile_list)
-        ]
-
-        if not predictions:
-            raise ValueError("No predictions to aggregate")
+        x_axis = predictions[0].cdf_values
+        stacked_values = np.stack(
+            [prediction.cdf_values for prediction in predictions]
+        )
+        if not np.allclose(stacked_values, x_axis):
+            raise ValueError("X axis between cdfs is not the same")
+        stacked_cdfs = np.stack(
+            [prediction.cdf_percentiles for prediction in predictions]
+        )
+        aggregated_cdf = cls.aggregate_cdfs(stacked_cdfs, aggregation_method)
 
         return NumericDistribution(
-            declared_percentiles=median_cdf,
+            declared_percentiles=[
+                Percentile(value=value, percentile=percentile)
+                for value, percentile in zip(
+                    x_axis.tolist(), aggregated_cdf.tolist()
+                )
+            ],
             open_upper_bound=question.open_upper_bound,
             open_lower_bound=question.open_lower_bound,
             upper_bound=question.upper_bound,
@@ -253,6 +265,81 @@ class NumericReport(ForecastReport):
             zero_point=question.zero_point,
         )
 
+    @classmethod
+    def aggregate_cdfs(
+        cls,
+        stacked_cdfs: np.ndarray,
+        aggregation_method: NumericAggregationMethod = NumericAggregationMethod.MEDIAN,
+        trimmed_proportion: float = 0.1,
+    ) -> np.ndarray:
+        """
+        Pools cdfs given as a (number of predictions, number of points) array
+        into one cdf. Median, mean and trimmed mean are taken point by point.
+        The log pool takes the normalized geometric mean of the probability
+        mass between each point (including the mass outside the bounds).
+        For the trimmed mean, `trimmed_proportion` of the predictions are
+        removed from each end at each point.
+        """
+        if stacked_cdfs.ndim != 2 or len(stacked_cdfs) == 0:
+            raise ValueError(
+                "Cdfs must be a non-empty 2D array of shape (predictions, points)"
+            )
+        if not 0 <= trimmed_proportion < 0.5:
+            raise ValueError("Trimmed proportion must be in [0, 0.5)")
+
+        if aggregation_method == NumericAggregationMethod.MEDIAN:
+            aggregated_cdf = np.median(stacked_cdfs, axis=0)
+        elif aggregation_method == NumericAggregationMethod.MEAN:
+            aggregated_cdf = np.mean(stacked_cdfs, axis=0)
+        elif aggregation_method == NumericAggregationMethod.TRIMMED_MEAN:
+            number_to_trim = int(trimmed_proportion * len(stacked_cdfs))
+            sorted_cdfs = np.sort(stacked_cdfs, axis=0)
+            kept_cdfs = sorted_cdfs[
+                number_to_trim : len(stacked_cdfs) - number_to_trim
+            ]
+            aggregated_cdf = np.mean(kept_cdfs, axis=0)
+        elif aggregation_method == NumericAggregationMethod.LOG_POOL:
+            aggregated_cdf = cls.__log_pool_cdfs(stacked_cdfs)
+        else:
+            raise ValueError(
+                f"Unknown aggregation method: {aggregation_method}"
+            )
+        return np.clip(aggregated_cdf, 0, 1)
+
+    @classmethod
+    def __log_pool_cdfs(cls, stacked_cdfs: np.ndarray) -> np.ndarray:
+        padded_cdfs = np.pad(
+            stacked_cdfs, ((0, 0), (1, 1)), constant_values=(0, 1)
+        )
+        probability_masses = np.clip(np.diff(padded_cdfs, axis=1), 0, None)
+        # A single prediction with no mass between two points would zero out
+        # the pool there (and make the cdf flat), so inner masses get a floor.
+        # Masses outside the bounds are left alone so closed bounds stay closed.
+        probability_masses[:, 1:-1] = np.maximum(
+            probability_masses[:, 1:-1], cls.MIN_LOG_POOL_PROBABILITY_MASS
+        )
+        with np.errstate(divide="ignore"):
+            log_masses = np.log(probability_masses)
+        pooled_masses = np.exp(log_masses.mean(axis=0))
+        return np.cumsum(pooled_masses / pooled_masses.sum())[:-1]
+
+    @classmethod
+    def calculate_prediction_spread(
+        cls, predictions: list[NumericDistribution]
+    ) -> float:
+        """
+        Largest interquartile range of the cdfs' probabilities at any point
+        (cdfs must share an x axis, as in `aggregate_predictions`)
+        """
+        assert predictions, "No predictions to measure spread of"
+        stacked_cdfs = np.stack(
+            [prediction.cdf_percentiles for prediction in predictions]
+        )
+        upper_quartiles, lower_quartiles = np.percentile(
+            stacked_cdfs, [75, 25], axis=0
+        )
+        return float(np.max(upper_quartiles - lower_quartiles))
+
     @classmethod
     def make_readable_prediction(cls, prediction: NumericDistribution) -> str:
         representative_percentiles = (
@@ -266,9 +353,7 @@ class NumericReport(ForecastReport):
     async def publish_report_to_metaculus(self) -> None:
         if self.question.id_of_question is None:
             raise ValueError("Question ID is None")
-        cdf_probabilities = [
-            percentile.percentile for percentile in self.prediction.cdf
-        ]
+        cdf_probabilities = self.prediction.cdf_percentiles.tolist()
         MetaculusApi.post_numeric_question_prediction(
             self.question.id_of_question, cdf_probabilities
         )
@@ -0,0 +1,71 @@
+import json
+import logging
+import os
+
+from forecasting_tools.forecasting.questions_and_reports.data_organizer import (
+    DataOrganizer,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+from forecasting_tools.util import file_manipulation
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlReportSink:
+    """
+    Append-only store of forecast reports (one JSON object per line).
+
+    Each report is written as soon as it is finished, so a crash only loses
+    the questions that were still in progress, and writing stays O(1) per report
+    rather than rewriting every previous report each time.
+    A sink can be read back to resume a run from where it stopped.
+
+    A line left partially written by a crash is removed before the next
+    report is appended (so it cannot merge with the new line), and any
+    malformed line is skipped when loading.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+
+    def add_report(self, report: ForecastReport) -> None:
+        self.add_reports([report])
+
+    def add_reports(self, reports: list[ForecastReport]) -> None:
+        if not reports:
+            return
+        removed_bytes = file_manipulation.remove_partially_written_last_line(
+            self.file_path
+        )
+        if removed_bytes:
+            logger.warning(
+                f"Removed {removed_bytes} bytes of a partially written last line from {self.file_path}"
+            )
+        file_manipulation.add_to_jsonl_file(
+            self.file_path, [report.to_json() for report in reports]
+        )
+
+    def load_reports(self) -> list[ForecastReport]:
+        full_file_path = file_manipulation.get_absolute_path(self.file_path)
+        if not os.path.exists(full_file_path):
+            return []
+
+        jsons: list[dict] = []
+        file_text = file_manipulation.load_text_file(self.file_path)
+        lines = [line for line in file_text.split("\n") if line.strip()]
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                jsons.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"Ignoring malformed line {line_number} in {self.file_path}"
+                )
+        return DataOrganizer.load_reports_from_jsons(jsons)
+
+    def get_finished_question_ids(self) -> set[int]:
+        return {report.question.id_of_post for report in self.load_reports()}
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.file_path})"
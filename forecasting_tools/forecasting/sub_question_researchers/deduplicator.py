@@ -1,22 +1,29 @@
 import asyncio
 import logging
-import os
 import random
 
-import numpy as np
-import requests
-from openai import OpenAI
-from sklearn.metrics.pairwise import cosine_similarity
-
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.ai_utils.embedding_index import (
+    EmbeddingIndex,
+)
 from forecasting_tools.forecasting.helpers.configured_llms import BasicLlm
 from forecasting_tools.forecasting.helpers.smart_searcher import SmartSearcher
-from forecasting_tools.util.misc import raise_for_status_with_additional_info
 
 logger = logging.getLogger(__name__)
 
 
 class Deduplicator:
+    _embedding_index: EmbeddingIndex | None = None
+
+    @classmethod
+    def get_embedding_index(cls) -> EmbeddingIndex:
+        """
+        The index is shared by every deduplication so each string is only
+        embedded once (and is cached on disk between runs)
+        """
+        if cls._embedding_index is None:
+            cls._embedding_index = EmbeddingIndex()
+        return cls._embedding_index
 
     @classmethod
     async def deduplicate_list_in_batches(
@@ -117,20 +124,137 @@ class Deduplicator:
         items: list[str],
         use_internet_search: bool = False,
         threshold_for_initial_semantic_check: float = 0.85,
+        max_concurrent_checks: int = 1,
     ) -> list[str]:
+        """
+        With max_concurrent_checks above 1, items are checked speculatively
+        in windows of that size: every item in a window is checked at once
+        against the items kept so far, then the items that passed are checked
+        against the earlier items of the window that also passed, so most
+        windows take two or three rounds of checks instead of one per item.
+        The items kept are the same as when checking one at a time.
+        """
+        if max_concurrent_checks < 1:
+            raise ValueError("max_concurrent_checks must be at least 1")
         deduplicated_items: list[str] = []
-        for item in items:
-            is_duplicate = await cls.determine_if_item_is_duplicate(
-                item,
+        for start in range(0, len(items), max_concurrent_checks):
+            window = items[start : start + max_concurrent_checks]
+            deduplicated_items += await cls.__deduplicate_window_speculatively(
+                window,
                 deduplicated_items,
                 use_internet_search,
                 threshold_for_initial_semantic_check,
             )
-            if not is_duplicate:
-                deduplicated_items.append(item)
         cls.__log_deduplication_results(items, deduplicated_items)
         return deduplicated_items
 
+    @classmethod
+    async def __deduplicate_window_speculatively(
+        cls,
+        window: list[str],
+        kept_items: list[str],
+        use_internet_search: bool,
+        threshold_for_initial_semantic_check: float,
+    ) -> list[str]:
+        """
+        Gives the same result as checking the window one item at a time,
+        assuming an item that duplicates a list also duplicates any longer
+        list that contains it. Items that pass the first round are checked
+        against the kept items plus every earlier item that passed. An item
+        that is not a duplicate of that longer list is kept, and one that is
+        a duplicate is removed if every earlier item was kept (since then it
+        was checked against the same list as in one at a time mode). The
+        remaining conflicts are checked against the items actually kept until
+        they are resolved, which usually takes one more round.
+        """
+        is_duplicate_of_kept_items = await cls.__check_items_concurrently(
+            [(item, kept_items) for item in window],
+            use_internet_search,
+            threshold_for_initial_semantic_check,
+        )
+        candidates = [
+            item
+            for item, is_duplicate in zip(window, is_duplicate_of_kept_items)
+            if not is_duplicate
+        ]
+        if not candidates:
+            return []
+        is_duplicate_of_earlier_candidates = (
+            await cls.__check_items_concurrently(
+                [
+                    (candidate, kept_items + candidates[:i])
+                    for i, candidate in enumerate(candidates)
+                    if i > 0
+                ],
+                use_internet_search,
+                threshold_for_initial_semantic_check,
+            )
+        )
+        # The first candidate was already checked against the same list
+        is_kept: list[bool | None] = [True]
+        for is_duplicate in is_duplicate_of_earlier_candidates:
+            if not is_duplicate:
+                is_kept.append(True)
+            elif all(is_kept):
+                is_kept.append(False)
+            else:
+                is_kept.append(None)
+
+        while None in is_kept:
+            unresolved_indices = [
+                i for i, kept in enumerate(is_kept) if kept is None
+            ]
+            lists_to_check = [
+                kept_items + [candidates[j] for j in range(i) if is_kept[j]]
+                for i in unresolved_indices
+            ]
+            is_duplicate_of_kept_candidates = (
+                await cls.__check_items_concurrently(
+                    [
+                        (candidates[i], list_to_check)
+                        for i, list_to_check in zip(
+                            unresolved_indices, lists_to_check
+                        )
+                    ],
+                    use_internet_search,
+                    threshold_for_initial_semantic_check,
+                )
+            )
+            # Once an unresolved item is kept, the lists of later items are
+            # missing it, so only their duplicates can be trusted
+            an_unresolved_item_was_kept = False
+            for i, is_duplicate in zip(
+                unresolved_indices, is_duplicate_of_kept_candidates
+            ):
+                if not an_unresolved_item_was_kept:
+                    is_kept[i] = not is_duplicate
+                    an_unresolved_item_was_kept = not is_duplicate
+                elif is_duplicate:
+                    is_kept[i] = False
+
+        return [
+            candidate for candidate, kept in zip(candidates, is_kept) if kept
+        ]
+
+    @classmethod
+    async def __check_items_concurrently(
+        cls,
+        items_and_lists_to_check: list[tuple[str, list[str]]],
+        use_internet_search: bool,
+        threshold_for_initial_semantic_check: float,
+    ) -> list[bool]:
+        return await asyncio.gather(
+            *[
+                cls.determine_if_item_is_duplicate(
+                    item,
+                    list_to_check,
+                    use_internet_search,
+                    threshold_for_initial_semantic_check,
+                )
+                for item, list_to_check in items_and_lists_to_check
+            ]
+        )
+
     @classmethod
     async def determine_if_item_is_duplicate(
         cls,
@@ -147,7 +271,7 @@ class Deduplicator:
             return True
 
         is_semantically_duplicate = (
-            cls.__determine_if_text_is_duplicate_semantically(
+            await cls.__determine_if_text_is_duplicate_semantically(
                 item, list_to_check, threshold_for_initial_semantic_check
             )
         )
@@ -187,21 +311,16 @@ class Deduplicator:
     async def __deduplicate_list_using_semantic_similarity(
         cls, items: list[str], threshold: float
     ) -> list[str]:
-        deduplicated_items: list[str] = []
-        for item in items:
-            is_duplicate = cls.__determine_if_text_is_duplicate_semantically(
-                item, deduplicated_items, threshold
-            )
-            if not is_duplicate:
-                deduplicated_items.append(item)
-
+        deduplicated_items = await cls.get_embedding_index().deduplicate_async(
+            items, threshold
+        )
         logger.info(
             f"Deduplicated {len(items)} items to {len(deduplicated_items)} items using semantic similarity"
         )
         return deduplicated_items
 
     @classmethod
-    def __determine_if_text_is_duplicate_semantically(
+    async def __determine_if_text_is_duplicate_semantically(
         cls,
         text: str,
         list_to_compare_to: list[str],
@@ -211,67 +330,9 @@ class Deduplicator:
         0.85 is good for an item like "1999 Moldovan referendum: description..."
         0.938 is good for a short item like "1999 Moldovan referendum"
         """
-        texts_to_get_embeddings_for = [text] + list_to_compare_to
-        try:
-            embeddings = cls.__get_embeddings_using_huggingface(
-                texts_to_get_embeddings_for
-            )
-        except Exception as e:
-            logger.warning(
-                f"Could not get embeddings using huggingface. Instead now getting embeddings with OpenAI. Error: {e}"
-            )
-            embeddings = cls.__get_embeddings_using_openai(
-                texts_to_get_embeddings_for
-            )
-
-        text_embedding = embeddings[0]
-        list_embeddings = embeddings[1:]
-
-        for list_embedding in list_embeddings:
-            similarity = cosine_similarity(
-                np.array([text_embedding]), np.array([list_embedding])
-            )[0][0]
-            if similarity > semantic_similarity_threshold:
-                return True
-        return False
-
-    @classmethod
-    def __get_embeddings_using_openai(
-        cls, texts: list[str]
-    ) -> list[list[float]]:
-        # TODO: Track costs from this in llm cost tracker
-        api_key = os.getenv("OPENAI_API_KEY")
-        assert api_key is not None, "OPENAI_API_KEY is not set"
-        client = OpenAI(api_key=api_key)
-
-        def query(texts: list[str]) -> list[list[float]]:
-            response = client.embeddings.create(
-                model="text-embedding-3-small", input=texts
-            )
-            return [embedding.embedding for embedding in response.data]
-
-        return query(texts)
-
-    @classmethod
-    def __get_embeddings_using_huggingface(
-        cls, texts: list[str]
-    ) -> list[list[float]]:
-        model_id = "sentence-transformers/all-MiniLM-L6-v2"
-        api_url = f"https://api-inference.huggingface.co/pipeline/feature-extraction/{model_id}"
-        api_key = os.getenv("HUGGINGFACE_API_KEY")
-        assert api_key is not None, "HUGGINGFACE_API_KEY is not set"
-        headers = {"Authorization": f"Bearer {api_key}"}
-
-        def query(texts: list[str]) -> list[list[float]]:
-            response = requests.post(
-                api_url,
-                headers=headers,
-                json={"inputs": texts, "options": {"wait_for_model": True}},
-            )
-            raise_for_status_with_additional_info(response)
-            return response.json()
-
-        return query(texts)
+        return await cls.get_embedding_index().text_is_similar_to_any_async(
+            text, list_to_compare_to, semantic_similarity_threshold
+        )
 
     @classmethod
     def __log_deduplication_results(
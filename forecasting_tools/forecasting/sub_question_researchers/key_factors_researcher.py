@@ -110,10 +110,8 @@ class KeyFactorsResearcher:
             cls.__find_key_factors_for_question(question)
             for question in questions
         ]
-        key_factors, _ = (
-            async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                key_factor_tasks
-            )
+        key_factors, _ = await async_batching.gather_removing_exceptions(
+            key_factor_tasks
         )
         flattened_key_factors = [
             factor for sublist in key_factors for factor in sublist
@@ -205,10 +203,8 @@ class KeyFactorsResearcher:
             cls.__score_key_factor(metaculus_question.question_text, factor)
             for factor in key_factors
         ]
-        scored_factors, _ = (
-            async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                scoring_coroutines
-            )
+        scored_factors, _ = await async_batching.gather_removing_exceptions(
+            scoring_coroutines
         )
         return scored_factors
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import (
@@ -72,10 +73,8 @@ class ResearchCoordinator:
             BaseRateResearcher(question).make_base_rate_report()
             for question in base_rate_questions
         ]
-        base_rate_reports, _ = (
-            async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                base_rate_tasks
-            )
+        base_rate_reports, _ = await async_batching.gather_removing_exceptions(
+            base_rate_tasks
         )
         return base_rate_reports
 
@@ -328,8 +327,8 @@ class ResearchCoordinator:
                 answering_question_coroutines
             )
         )
-        unverified_answers: list[str | Exception] = (
-            async_batching.run_coroutines(exception_handled_coroutines)
+        unverified_answers: list[str | Exception] = await asyncio.gather(
+            *exception_handled_coroutines
         )
         verified_answers = []
         for question, answer in zip(questions, unverified_answers):
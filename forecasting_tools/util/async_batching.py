@@ -1,10 +1,16 @@
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, TypeVar
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Coroutine, TypeVar
 
 import nest_asyncio
 from aiolimiter import AsyncLimiter
 
+from forecasting_tools.ai_models.resource_managers.rate_limiter_registry import (
+    RateLimiterRegistry,
+    SharedRateLimiter,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -17,10 +23,23 @@ def wrap_coroutines_with_rate_limit(
     coroutine_list: list[Coroutine[Any, Any, T]],
     calls_per_period: int,
     time_period_in_seconds: int = 60,
+    limiter_name: str | None = None,
 ) -> list[Coroutine[Any, Any, T]]:
     """
-    Rate Limiting is only applied to the coroutines in the list, and not between calls of this function.
+    Without a `limiter_name`, rate limiting is only applied to the coroutines in the list, and not between calls of this function.
+    With a `limiter_name`, the limiter of that name in the RateLimiterRegistry is used (and created with the given limits if
+    it does not exist yet), so the limit is shared with every other call and model that uses the same name.
     """
+    if limiter_name is not None:
+        shared_limiter = RateLimiterRegistry.get_or_create(
+            limiter_name,
+            requests_per_period=calls_per_period,
+            period_in_seconds=time_period_in_seconds,
+        )
+        return [
+            apply_shared_limiter_to_coroutine(coroutine, shared_limiter)
+            for coroutine in coroutine_list
+        ]
     limiter = AsyncLimiter(
         max_rate=calls_per_period, time_period=time_period_in_seconds
     )
@@ -37,6 +56,13 @@ async def apply_limiter_to_coroutine(
     return await coroutine
 
 
+async def apply_shared_limiter_to_coroutine(
+    coroutine: Coroutine, limiter: SharedRateLimiter
+) -> Any:
+    async with limiter.acquire():
+        return await coroutine
+
+
 def wrap_coroutines_with_timeout(
     coroutine_list: list[Coroutine[Any, Any, T]], timeout_time: float
 ) -> list[Coroutine[Any, Any, T]]:
@@ -49,11 +75,11 @@ def wrap_coroutines_with_timeout(
         except asyncio.TimeoutError as e:
             raise asyncio.TimeoutError(
                 f"Timeout of {timeout_time} seconds exceeded while running coroutine. Here is the exception: {e.__class__.__name__}: {e}"
-            )
+            ) from e
         except Exception as e:
             raise RuntimeError(
                 f"Exception while running coroutine with timeout wrapper. Here is the exception: {e.__class__.__name__}: {e}"
-            )
+            ) from e
 
     return [
         coroutine_with_timeout(coroutine, timeout_time)
@@ -121,7 +147,140 @@ def run_coroutines_while_removing_and_logging_exceptions(
     Runs a list of coroutines and returns only the results (and their corresponding inputs) that did not raise an exception.
     A list of "None" is returned as the corresponding input if no matching_inputs are provided.
     A default log message is given on the case of an exception. You can switch out this with a custom function if desired.
+    Use `gather_removing_exceptions` instead if you are already inside async code.
+    """
+    modified_inputs = _match_inputs_to_coroutines(coroutines, matching_inputs)
+    exception_wrapped_coroutines = (
+        wrap_coroutines_to_return_not_raise_exceptions(coroutines)
+    )
+    results = run_coroutines(exception_wrapped_coroutines)
+    return _remove_and_handle_exceptions(
+        coroutines, modified_inputs, results, action_on_exception
+    )
+
+
+async def gather_removing_exceptions(
+    coroutines: list[Coroutine[Any, Any, T]],
+    matching_inputs: list[T2] | T2 = None,
+    action_on_exception: Callable[[Exception, T2], None] | None = None,
+    max_concurrency: int | None = None,
+) -> tuple[list[T], list[T2]]:
+    """
+    Awaitable version of `run_coroutines_while_removing_and_logging_exceptions`.
+    The coroutines run as tasks on the current event loop (so they overlap with
+    other work on the loop rather than re-entering it), with at most
+    `max_concurrency` running at once if it is set.
+    """
+    modified_inputs = _match_inputs_to_coroutines(coroutines, matching_inputs)
+    exception_wrapped_coroutines = (
+        wrap_coroutines_to_return_not_raise_exceptions(
+            wrap_coroutines_with_concurrency_limit(coroutines, max_concurrency)
+        )
+    )
+    results = await asyncio.gather(*exception_wrapped_coroutines)
+    return _remove_and_handle_exceptions(
+        coroutines, modified_inputs, results, action_on_exception
+    )
+
+
+async def iterate_as_completed(
+    coroutines: list[Coroutine[Any, Any, T]],
+    max_concurrency: int | None = None,
+) -> AsyncIterator[tuple[int, T]]:
+    """
+    Yields (index of coroutine, result) pairs in the order the coroutines finish.
+    At most `max_concurrency` coroutines are started at once, and the next one is
+    only started when a running one finishes. An exception is raised when the
+    coroutine that raised it is reached (wrap the coroutines with
+    `wrap_coroutines_to_return_not_raise_exceptions` to get them as results).
+    Anything still running is cancelled if the iteration stops early.
     """
+    _validate_max_concurrency(max_concurrency)
+    waiting_coroutines = list(enumerate(coroutines))
+    waiting_coroutines.reverse()
+    running_tasks: dict[asyncio.Task[T], int] = {}
+    try:
+        while waiting_coroutines or running_tasks:
+            while waiting_coroutines and (
+                max_concurrency is None or len(running_tasks) < max_concurrency
+            ):
+                index, coroutine = waiting_coroutines.pop()
+                running_tasks[asyncio.ensure_future(coroutine)] = index
+            finished_tasks, _ = await asyncio.wait(
+                running_tasks, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in _sort_tasks_by_index(finished_tasks, running_tasks):
+                index = running_tasks.pop(task)
+                yield index, task.result()
+    finally:
+        for _, coroutine in waiting_coroutines:
+            coroutine.close()
+        for task in running_tasks:
+            task.cancel()
+        await asyncio.gather(*running_tasks, return_exceptions=True)
+
+
+async def run_in_task_group(
+    coroutines: list[Coroutine[Any, Any, T]],
+    max_concurrency: int | None = None,
+) -> list[T]:
+    """
+    Runs the coroutines as one group with the same behavior as asyncio.TaskGroup
+    (which is not used since it needs python 3.11): if any coroutine raises,
+    the rest are cancelled and the first exception is raised. Otherwise the
+    results are returned in the same order as the coroutines.
+    """
+    results: list[T | None] = [None] * len(coroutines)
+    async with aclosing(
+        iterate_as_completed(coroutines, max_concurrency)
+    ) as completed_results:
+        async for index, result in completed_results:
+            results[index] = result
+    return results  # type: ignore
+
+
+def wrap_coroutines_with_concurrency_limit(
+    coroutine_list: list[Coroutine[Any, Any, T]],
+    max_concurrency: int | None,
+) -> list[Coroutine[Any, Any, T]]:
+    """
+    The limit is only applied to the coroutines in the list, and not between calls of this function.
+    """
+    _validate_max_concurrency(max_concurrency)
+    if max_concurrency is None:
+        return list(coroutine_list)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def coroutine_with_concurrency_limit(
+        coroutine: Coroutine[Any, Any, T]
+    ) -> T:
+        try:
+            async with semaphore:
+                return await coroutine
+        finally:
+            # Avoid 'never awaited' warnings if cancelled while waiting
+            coroutine.close()
+
+    return [
+        coroutine_with_concurrency_limit(coroutine)
+        for coroutine in coroutine_list
+    ]
+
+
+def _validate_max_concurrency(max_concurrency: int | None) -> None:
+    if max_concurrency is not None and max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than 0")
+
+
+def _sort_tasks_by_index(
+    tasks: set[asyncio.Task[T]], task_indices: dict[asyncio.Task[T], int]
+) -> list[asyncio.Task[T]]:
+    return sorted(tasks, key=lambda task: task_indices[task])
+
+
+def _match_inputs_to_coroutines(
+    coroutines: list[Coroutine[Any, Any, T]], matching_inputs: list[T2] | T2
+) -> list[T2]:
     if matching_inputs is None:
         modified_inputs = [None] * len(coroutines)
     elif not isinstance(matching_inputs, list):
@@ -132,15 +291,18 @@ def run_coroutines_while_removing_and_logging_exceptions(
     assert len(modified_inputs) == len(
         coroutines
     ), "The number of inputs must match the number of coroutines"
+    return modified_inputs  # type: ignore
 
-    exception_wrapped_coroutines = (
-        wrap_coroutines_to_return_not_raise_exceptions(coroutines)
-    )
-    results = run_coroutines(exception_wrapped_coroutines)
 
+def _remove_and_handle_exceptions(
+    coroutines: list[Coroutine[Any, Any, T]],
+    inputs: list[T2],
+    results: list[T | Exception],
+    action_on_exception: Callable[[Exception, T2], None] | None,
+) -> tuple[list[T], list[T2]]:
     results_that_did_not_error: list[T] = []
     inputs_that_did_not_error: list[T2] = []
-    for input, result, coroutine in zip(modified_inputs, results, coroutines):
+    for input, result, coroutine in zip(inputs, results, coroutines):
         if isinstance(result, Exception):
             error = result
             if action_on_exception is None:
@@ -118,8 +118,8 @@ def write_json_file(file_path_in_package: str, input: list[dict]) -> None:
 
 
 def add_to_jsonl_file(file_path_in_package: str, input: list[dict]) -> None:
-    json_strings = [json.dumps(item) for item in input]
-    jsonl_string = "\n".join(json_strings)
+    json_strings = [json.dumps(item) + "\n" for item in input]
+    jsonl_string = "".join(json_strings)
     create_or_append_to_file(file_path_in_package, jsonl_string)
 
 
@@ -145,6 +145,33 @@ def create_or_append_to_file(file_path_in_package: str, text: str) -> None:
         file.write(text)
 
 
+@skip_if_file_writing_not_allowed
+def remove_partially_written_last_line(file_path_in_package: str) -> int:
+    """
+    This function truncates a file back to its last newline so that text
+    appended later starts on a fresh line. Returns the number of bytes removed.
+    """
+    full_file_path = get_absolute_path(file_path_in_package)
+    if not os.path.exists(full_file_path):
+        return 0
+    chunk_size = 64 * 1024
+    with open(full_file_path, "rb+") as file:
+        file_size = file.seek(0, os.SEEK_END)
+        end_of_last_full_line = 0
+        chunk_end = file_size
+        while chunk_end > 0:
+            chunk_start = max(0, chunk_end - chunk_size)
+            file.seek(chunk_start)
+            chunk = file.read(chunk_end - chunk_start)
+            last_newline = chunk.rfind(b"\n")
+            if last_newline != -1:
+                end_of_last_full_line = chunk_start + last_newline + 1
+                break
+            chunk_end = chunk_start
+        file.truncate(end_of_last_full_line)
+    return file_size - end_of_last_full_line
+
+
 @skip_if_file_writing_not_allowed
 def log_to_file(
     file_path_in_package: str, text: str, type: str = "DEBUG"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+
+import aiohttp
+from aiohttp import web
+
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher
+from forecasting_tools.ai_models.resource_managers.http_session_pool import (
+    HttpSessionPool,
+)
+from forecasting_tools.util.custom_logger import CustomLogger
+
+logger = logging.getLogger(__name__)
+
+
+async def start_stub_exa_server(
+    response_delay_in_seconds: float,
+) -> tuple[web.AppRunner, str]:
+    async def handle_search(request: web.Request) -> web.Response:
+        await asyncio.sleep(response_delay_in_seconds)
+        return web.json_response({"autopromptString": None, "results": []})
+
+    app = web.Application()
+    app.router.add_post("/search", handle_search)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    return runner, f"http://127.0.0.1:{port}/search"
+
+
+async def request_with_new_session(url: str) -> dict:
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, json={}) as response:
+            response.raise_for_status()
+            return await response.json()
+
+
+async def time_requests(
+    name: str, make_request, number_of_requests: int, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed_request() -> None:
+        async with semaphore:
+            start_time = time.perf_counter()
+            await make_request()
+            latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*[timed_request() for _ in range(number_of_requests)])
+    duration = time.perf_counter() - start_time
+    latencies_in_ms = sorted(latency * 1000 for latency in latencies)
+    logger.info(
+        f"{name} ({number_of_requests} requests, concurrency {concurrency}): "
+        f"total {duration:.2f}s, "
+        f"median latency {statistics.median(latencies_in_ms):.2f}ms, "
+        f"p95 latency {latencies_in_ms[int(len(latencies_in_ms) * 0.95)]:.2f}ms"
+    )
+
+
+async def benchmark_http_session_pool() -> None:
+    """
+    The stub server is plain HTTP on localhost, so this only measures the
+    TCP and session setup that pooling saves. Against a real HTTPS API the
+    TLS handshake and DNS lookups add more savings on top of this.
+    """
+    number_of_requests = 500
+    runner, url = await start_stub_exa_server(response_delay_in_seconds=0.005)
+    try:
+        for concurrency in [1, 10]:
+            await time_requests(
+                "New session per request",
+                lambda: request_with_new_session(url),
+                number_of_requests,
+                concurrency,
+            )
+            async with HttpSessionPool() as pool:
+                searcher = ExaSearcher(session_pool=pool)
+                await time_requests(
+                    "Pooled session",
+                    lambda: searcher._make_api_request(url, {}, {}),
+                    number_of_requests,
+                    concurrency,
+                )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    CustomLogger.setup_logging()
+    asyncio.run(benchmark_http_session_pool())
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
+    NumericDistribution,
+    Percentile,
+)
+from forecasting_tools.util.custom_logger import CustomLogger
+
+logger = logging.getLogger(__name__)
+
+
+def create_random_distributions(
+    number_of_distributions: int,
+) -> list[NumericDistribution]:
+    distributions: list[NumericDistribution] = []
+    for _ in range(number_of_distributions):
+        lower_bound = random.uniform(1, 100)
+        upper_bound = lower_bound * random.uniform(2, 1000)
+        declared_values = sorted(
+            random.uniform(lower_bound, upper_bound) for _ in range(6)
+        )
+        declared_percentiles = [0.05, 0.1, 0.25, 0.75, 0.9, 0.95]
+        distributions.append(
+            NumericDistribution(
+                declared_percentiles=[
+                    Percentile(value=value, percentile=percentile)
+                    for value, percentile in zip(
+                        declared_values, declared_percentiles
+                    )
+                ],
+                open_upper_bound=random.random() < 0.5,
+                open_lower_bound=random.random() < 0.5,
+                upper_bound=upper_bound,
+                lower_bound=lower_bound,
+                zero_point=0 if random.random() < 0.3 else None,
+            )
+        )
+    return distributions
+
+
+def time_cdf_access(
+    description: str,
+    distributions: list[NumericDistribution],
+    access_type: str,
+) -> None:
+    start_time = time.perf_counter()
+    for distribution in distributions:
+        if access_type == "array":
+            distribution.cdf_percentiles
+        else:
+            distribution.cdf
+    duration = time.perf_counter() - start_time
+    logger.info(
+        f"{description}: {len(distributions)} distributions in {duration:.3f}s "
+        f"({duration / len(distributions) * 1e6:.1f} microseconds per distribution)"
+    )
+
+
+def benchmark_cdf(number_of_distributions: int) -> None:
+    array_distributions = create_random_distributions(number_of_distributions)
+    time_cdf_access("First cdf array access", array_distributions, "array")
+    time_cdf_access("Cached cdf array access", array_distributions, "array")
+
+    list_distributions = create_random_distributions(number_of_distributions)
+    time_cdf_access("First cdf list access", list_distributions, "list")
+    time_cdf_access("Repeated cdf list access", list_distributions, "list")
+
+
+if __name__ == "__main__":
+    CustomLogger.setup_logging()
+    benchmark_cdf(number_of_distributions=5000)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+
+from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
+    RefreshingBucketRateLimiter,
+)
+from forecasting_tools.util.custom_logger import CustomLogger
+
+logger = logging.getLogger(__name__)
+
+
+async def benchmark_uncontended_acquire(number_of_acquires: int) -> None:
+    rate_limiter = RefreshingBucketRateLimiter(
+        capacity=number_of_acquires, refresh_rate=number_of_acquires
+    )
+    start_time = time.perf_counter()
+    for _ in range(number_of_acquires):
+        await rate_limiter.wait_till_able_to_acquire_resources(1)
+    duration = time.perf_counter() - start_time
+    logger.info(
+        f"Uncontended acquire: {number_of_acquires} acquires in {duration:.3f}s "
+        f"({duration / number_of_acquires * 1e6:.2f} microseconds per acquire)"
+    )
+
+
+async def benchmark_concurrent_waiters(
+    number_of_waiters: int, capacity: int, refresh_rate: float
+) -> None:
+    rate_limiter = RefreshingBucketRateLimiter(
+        capacity=capacity, refresh_rate=refresh_rate
+    )
+    rate_limiter.zero_out_resources()
+    order_served: list[int] = []
+    wait_times: list[float] = []
+
+    async def acquire(waiter_number: int) -> None:
+        start_time = time.perf_counter()
+        await rate_limiter.wait_till_able_to_acquire_resources(1)
+        wait_times.append(time.perf_counter() - start_time)
+        order_served.append(waiter_number)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*[acquire(i) for i in range(number_of_waiters)])
+    duration = time.perf_counter() - start_time
+
+    expected_duration = number_of_waiters / refresh_rate
+    out_of_order_grants = sum(
+        1
+        for earlier, later in zip(order_served, order_served[1:])
+        if later < earlier
+    )
+    logger.info(
+        f"{number_of_waiters} concurrent waiters (capacity {capacity}, refresh rate {refresh_rate}/s): "
+        f"finished in {duration:.3f}s (ideal {expected_duration:.3f}s). "
+        f"Out of order grants: {out_of_order_grants}. "
+        f"Median wait: {statistics.median(wait_times):.3f}s, max wait: {max(wait_times):.3f}s"
+    )
+
+
+async def benchmark_rate_limiter() -> None:
+    await benchmark_uncontended_acquire(100_000)
+    await benchmark_concurrent_waiters(
+        number_of_waiters=10_000, capacity=500, refresh_rate=5_000
+    )
+
+
+if __name__ == "__main__":
+    CustomLogger.setup_logging()
+    asyncio.run(benchmark_rate_limiter())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import Callable
+
+from forecasting_tools.ai_models.ai_utils.token_count_cache import (
+    TokenCountCache,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.util.custom_logger import CustomLogger
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_WORDS = (
+    "forecast probability resolution criteria base rate polling "
+    "administration announced quarterly report analysts expect the "
+    "committee vote scheduled market estimates according to sources "
+    "historically trend inflation election agency statement deadline"
+).split()
+
+
+def create_research_report(approximate_number_of_words: int) -> str:
+    """
+    Creates a report shaped like the research section of a Veritas bot
+    forecast report (markdown headers, cited summaries and quotes)
+    """
+    sections: list[str] = []
+    words_written = 0
+    section_number = 0
+    while words_written < approximate_number_of_words:
+        section_number += 1
+        paragraph_words = [random.choice(RESEARCH_WORDS) for _ in range(120)]
+        quote_words = [random.choice(RESEARCH_WORDS) for _ in range(30)]
+        sections.append(
+            f"## Search {section_number}: {' '.join(paragraph_words[:6])}\n"
+            f"{' '.join(paragraph_words)} [{section_number}]"
+            f"(https://example.com/article-{section_number}).\n"
+            f'> "{" ".join(quote_words)}"\n'
+        )
+        words_written += len(paragraph_words) + len(quote_words) + 6
+    return "\n".join(sections)
+
+
+def time_function(
+    description: str, function: Callable[[], int], repetitions: int
+) -> None:
+    start_time = time.perf_counter()
+    for _ in range(repetitions):
+        token_count = function()
+    duration = time.perf_counter() - start_time
+    logger.info(
+        f"{description}: {token_count} tokens, "
+        f"{duration / repetitions * 1e3:.3f} ms per call"
+    )
+
+
+def benchmark_token_counting(approximate_number_of_words: int) -> None:
+    report = create_research_report(approximate_number_of_words)
+    model = Gpt4o()
+    Gpt4o._token_count_cache.clear()
+    logger.info(f"Research report has {len(report)} characters")
+
+    time_function(
+        "Exact count (tiktoken)", lambda: model.input_to_tokens(report), 5
+    )
+    model.APPROXIMATE_TOKENS_ABOVE_CHARACTER_COUNT = None
+    time_function(
+        "First count through the token cache",
+        lambda: model._count_tokens_for_token_limit(report),
+        1,
+    )
+    time_function(
+        "Cached count",
+        lambda: model._count_tokens_for_token_limit(report),
+        100,
+    )
+    time_function(
+        "Approximate count",
+        lambda: TokenCountCache.estimate_tokens_from_characters(
+            len(report), model.APPROXIMATE_CHARACTERS_PER_TOKEN
+        ),
+        100,
+    )
+
+
+if __name__ == "__main__":
+    CustomLogger.setup_logging()
+    benchmark_token_counting(approximate_number_of_words=40_000)